@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from domain.repositories import LibraryRepository
+
+
+@dataclass(frozen=True)
+class CompactLibraryChangesCommand:
+    retention: timedelta
+
+
+class CompactLibraryChangesHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._clock = clock
+
+    def handle(self, command: CompactLibraryChangesCommand) -> int:
+        return self._repository.compact_changes(self._clock() - command.retention)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Callable, List
+
+from domain.backups import BackupRetentionPolicy, BackupSnapshot
+from domain.models import LibrarySnapshot
+from domain.repositories import LibraryBackupRepository, LibraryRepository
+
+
+@dataclass(frozen=True)
+class CreateLibraryBackupCommand:
+    force: bool = False
+
+
+@dataclass(frozen=True)
+class CreateLibraryBackupResult:
+    snapshot: BackupSnapshot
+    created: bool
+    pruned: List[str] = field(default_factory=list)
+
+
+class CreateLibraryBackupHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        backup_repository: LibraryBackupRepository,
+        retention: BackupRetentionPolicy,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._backup_repository = backup_repository
+        self._retention = retention
+        self._clock = clock
+
+    def handle(self, command: CreateLibraryBackupCommand) -> CreateLibraryBackupResult:
+        snapshot = load_library_with_notes(self._repository)
+        latest = self._backup_repository.latest()
+        created = self._backup_repository.create(
+            snapshot.items, snapshot.revision, self._clock(), force=command.force
+        )
+        if latest is not None and created.snapshot_id == latest.snapshot_id:
+            return CreateLibraryBackupResult(snapshot=created, created=False)
+
+        snapshots = self._backup_repository.list_snapshots()
+        retained = self._retention.select_retained(snapshots)
+        retained.add(created.snapshot_id)
+        pruned = [
+            existing.snapshot_id
+            for existing in snapshots
+            if existing.snapshot_id not in retained
+        ]
+        if pruned:
+            self._backup_repository.delete_snapshots(pruned)
+        return CreateLibraryBackupResult(snapshot=created, created=True, pruned=pruned)
+
+
+def load_library_with_notes(repository: LibraryRepository) -> LibrarySnapshot:
+    snapshot = repository.snapshot()
+    notes = repository.load_notes([item.id for item in snapshot.items])
+    return LibrarySnapshot(
+        revision=snapshot.revision,
+        items=[replace(item, notes=notes.get(item.id, "")) for item in snapshot.items],
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import shutil
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import BinaryIO, Callable
+
+from domain.imports import IMPORT_FORMATS, IMPORT_STATUS_QUEUED, ImportJob
+from domain.repositories import ImportJobRepository
+from domain.tenants import DEFAULT_TENANT_ID
+
+
+@dataclass(frozen=True)
+class CreateLibraryImportCommand:
+    source_format: str
+    source: BinaryIO
+    tenant_id: str = DEFAULT_TENANT_ID
+
+
+class CreateLibraryImportHandler:
+    def __init__(
+        self,
+        job_repository: ImportJobRepository,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._job_repository = job_repository
+        self._clock = clock
+
+    def handle(self, command: CreateLibraryImportCommand) -> ImportJob:
+        if command.source_format not in IMPORT_FORMATS:
+            raise ValueError(f"unsupported import format: {command.source_format}")
+
+        now = self._clock()
+        job = ImportJob(
+            job_id=uuid.uuid4().hex,
+            source_format=command.source_format,
+            status=IMPORT_STATUS_QUEUED,
+            created_at=now,
+            updated_at=now,
+            tenant_id=command.tenant_id,
+        )
+        with self._job_repository.open_source_writer(job.job_id) as writer:
+            shutil.copyfileobj(command.source, writer)
+        self._job_repository.save(job)
+        return job
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
-from domain.repositories import LibraryRepository
+from domain.models import LibraryMutation
+from domain.repositories import AsyncLibraryRepository
 
 
 @dataclass(frozen=True)
 class DeleteLibraryItemCommand:
     item_id: str
+    expected_revision: Optional[int] = None
 
 
 class DeleteLibraryItemHandler:
-    def __init__(self, repository: LibraryRepository) -> None:
+    def __init__(self, repository: AsyncLibraryRepository) -> None:
         self._repository = repository
 
-    def handle(self, command: DeleteLibraryItemCommand) -> None:
-        self._repository.delete(command.item_id)
+    async def handle(self, command: DeleteLibraryItemCommand) -> LibraryMutation:
+        return await self._repository.delete(command.item_id, command.expected_revision)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from domain.errors import CoverImageError
+from domain.services import CoverImageStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PrefetchCoverImageCommand:
+    cover_url: str
+
+
+class PrefetchCoverImageHandler:
+    def __init__(self, cover_store: CoverImageStore) -> None:
+        self._cover_store = cover_store
+
+    def handle(self, command: PrefetchCoverImageCommand) -> None:
+        if not command.cover_url:
+            return
+        try:
+            self._cover_store.prefetch(command.cover_url)
+        except CoverImageError:
+            logger.info("表紙画像の先読みに失敗しました: %s", command.cover_url)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from application.queries.search_books import SearchBooksHandler
+from domain.errors import SearchServiceError
+from domain.repositories import SearchResultCacheRepository
+from domain.search import SearchQuery
+from domain.services import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+MAX_PREFETCH_PAGE = 10
+PREFETCH_BUDGET_KEY = "search-prefetch"
+
+
+@dataclass(frozen=True)
+class PrefetchSearchPageCommand:
+    query: SearchQuery
+    returned: int
+
+
+class PrefetchSearchPageHandler:
+    def __init__(
+        self,
+        search_handler: SearchBooksHandler,
+        cache: SearchResultCacheRepository,
+        budget: RateLimiter,
+        max_page: int = MAX_PREFETCH_PAGE,
+    ) -> None:
+        self._search_handler = search_handler
+        self._cache = cache
+        self._budget = budget
+        self._max_page = max_page
+
+    def next_query(self, command: PrefetchSearchPageCommand) -> Optional[SearchQuery]:
+        query = command.query
+        page = max(query.page, 1)
+        if command.returned < max(query.limit, 1) or page >= self._max_page:
+            return None
+        next_query = replace(query, page=page + 1)
+        if self._cache.contains(next_query):
+            return None
+        return next_query
+
+    def handle(self, command: PrefetchSearchPageCommand) -> bool:
+        next_query = self.next_query(command)
+        if next_query is None:
+            return False
+        if not self._budget.try_acquire(PREFETCH_BUDGET_KEY):
+            logger.debug(
+                "先読みの予算が不足しているため page=%s を見送ります。", next_query.page
+            )
+            return False
+        try:
+            self._search_handler.handle(next_query)
+        except SearchServiceError:
+            logger.info("検索結果の先読みに失敗しました: page=%s", next_query.page)
+            return False
+        return True
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Sequence
+
+from domain.models import LibraryItem
+from domain.repositories import SeriesCatalogRepository
+from domain.series_catalog import SeriesCatalogEntry
+from domain.series_identity import build_series_title
+from domain.series_matching import (
+    build_listing_series_key,
+    extract_listing_volume,
+    strip_listing_labels,
+)
+
+
+@dataclass(frozen=True)
+class RecordSeriesCatalogCommand:
+    items: Sequence[LibraryItem]
+
+
+class RecordSeriesCatalogHandler:
+    def __init__(
+        self,
+        repository: SeriesCatalogRepository,
+        ttl: timedelta,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._ttl = ttl
+        self._clock = clock
+
+    def handle(self, command: RecordSeriesCatalogCommand) -> None:
+        reported: Dict[str, list[LibraryItem]] = {}
+        for item in command.items:
+            if extract_listing_volume(item.title) is None:
+                continue
+            series_key = build_listing_series_key(item.title, item.author)
+            reported.setdefault(series_key, []).append(item)
+        if not reported:
+            return
+
+        now = self._clock()
+        existing = {
+            entry.series_key: entry
+            for entry in self._repository.get_many(list(reported))
+        }
+
+        changed: list[SeriesCatalogEntry] = []
+        for series_key, items in reported.items():
+            entry = existing.get(series_key)
+            if entry is None:
+                first = items[0]
+                entry = SeriesCatalogEntry(
+                    series_key=series_key,
+                    title=build_series_title(strip_listing_labels(first.title)),
+                    author=first.author,
+                    refreshed_at=now,
+                )
+            elif entry.is_stale(now, self._ttl):
+                entry = replace(entry, refreshed_at=now, volumes=dict(entry.volumes))
+            before = dict(entry.volumes)
+            for item in items:
+                volume = extract_listing_volume(item.title)
+                if volume is not None:
+                    entry.record_volume(volume, item.isbn)
+            if entry.refreshed_at == now or entry.volumes != before:
+                changed.append(entry)
+
+        if changed:
+            self._repository.save_many(changed)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from domain.repositories import SeriesCatalogRepository
+from domain.suggestions import (
+    CATALOG_OWNER_PREFIX,
+    SUGGESTION_KIND_AUTHOR,
+    SUGGESTION_KIND_TITLE,
+    PrefixIndex,
+)
+
+
+@dataclass(frozen=True)
+class RefreshSuggestionCatalogCommand:
+    pass
+
+
+class RefreshSuggestionCatalogHandler:
+    def __init__(
+        self, catalog_repository: SeriesCatalogRepository, index: PrefixIndex
+    ) -> None:
+        self._catalog_repository = catalog_repository
+        self._index = index
+
+    def handle(self, command: RefreshSuggestionCatalogCommand) -> int:
+        entries = {
+            f"{CATALOG_OWNER_PREFIX}{entry.series_key}": entry
+            for entry in self._catalog_repository.list_all()
+        }
+        for owner in self._index.owners(CATALOG_OWNER_PREFIX):
+            if owner not in entries:
+                self._index.remove_owner(owner)
+        for owner, entry in entries.items():
+            self._index.replace_owner(
+                owner,
+                [
+                    (SUGGESTION_KIND_TITLE, entry.title),
+                    (SUGGESTION_KIND_AUTHOR, entry.author),
+                ],
+            )
+        return len(entries)
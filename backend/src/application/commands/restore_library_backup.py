@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from application.commands.create_library_backup import load_library_with_notes
+from domain.errors import BackupIntegrityError, BackupSnapshotNotFoundError
+from domain.models import LibraryMutation
+from domain.repositories import LibraryBackupRepository, LibraryRepository
+
+
+@dataclass(frozen=True)
+class RestoreLibraryBackupCommand:
+    snapshot_id: str
+    expected_revision: Optional[int] = None
+
+
+class RestoreLibraryBackupHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        backup_repository: LibraryBackupRepository,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._backup_repository = backup_repository
+        self._clock = clock
+
+    def handle(self, command: RestoreLibraryBackupCommand) -> LibraryMutation:
+        verification = self._backup_repository.verify(command.snapshot_id)
+        if verification is None:
+            raise BackupSnapshotNotFoundError(command.snapshot_id)
+        if not verification.ok:
+            raise BackupIntegrityError(command.snapshot_id)
+        items = self._backup_repository.load_items(command.snapshot_id)
+        if items is None:
+            raise BackupSnapshotNotFoundError(command.snapshot_id)
+
+        current = load_library_with_notes(self._repository)
+        self._backup_repository.create(current.items, current.revision, self._clock())
+        return self._repository.replace_all(items, command.expected_revision)
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from application.queries.lookup_isbns import LookupIsbnsHandler, LookupIsbnsQuery
+from domain.errors import ImportJobNotFoundError, SearchServiceError
+from domain.imports import (
+    IMPORT_STATUS_COMPLETED,
+    IMPORT_STATUS_FAILED,
+    IMPORT_STATUS_RUNNING,
+    ImportJob,
+    ImportRow,
+    ImportRowError,
+    parse_import_rows,
+)
+from domain.isbn import to_isbn13
+from domain.models import LibraryItem
+from domain.repositories import ImportJobRepository, LibraryRepository
+from domain.search import SearchQuery
+from domain.series_identity import build_series_key, normalize_author_key
+from domain.series_matching import normalize_match_title
+from domain.services import BookSearchService
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 0.1
+TITLE_SEARCH_LIMIT = 10
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class RunLibraryImportCommand:
+    job_id: str
+
+
+@dataclass(frozen=True)
+class ImportOutcome:
+    row: ImportRow
+    item: Optional[LibraryItem] = None
+    error: Optional[str] = None
+    invalid: bool = False
+
+
+class RunLibraryImportHandler:
+    def __init__(
+        self,
+        repositories: Callable[[str], LibraryRepository],
+        job_repository: ImportJobRepository,
+        lookup: LookupIsbnsHandler,
+        title_search: Optional[BookSearchService] = None,
+        title_search_budget: int = 0,
+        lookup_workers: int = 4,
+        lookup_batch_size: int = 100,
+        queue_size: int = 8,
+        write_batch_size: int = 200,
+        stop_event: Optional[threading.Event] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repositories = repositories
+        self._job_repository = job_repository
+        self._lookup = lookup
+        self._title_search = title_search
+        self._title_search_budget = max(title_search_budget, 0)
+        self._lookup_workers = max(lookup_workers, 1)
+        self._lookup_batch_size = max(lookup_batch_size, 1)
+        self._queue_size = max(queue_size, 1)
+        self._write_batch_size = max(write_batch_size, 1)
+        self._stop_event = stop_event or threading.Event()
+        self._clock = clock
+
+    def handle(self, command: RunLibraryImportCommand) -> ImportJob:
+        job = self._job_repository.get(command.job_id)
+        if job is None:
+            raise ImportJobNotFoundError(command.job_id)
+        if job.finished:
+            return job
+
+        job.status = IMPORT_STATUS_RUNNING
+        job.message = None
+        self._save(job)
+        try:
+            self._run(job, self._repositories(job.tenant_id))
+        except Exception as exc:
+            logger.exception("インポート %s に失敗しました。", job.job_id)
+            job.status = IMPORT_STATUS_FAILED
+            job.message = str(exc) or type(exc).__name__
+            self._save(job)
+        return job
+
+    def _run(self, job: ImportJob, repository: LibraryRepository) -> None:
+        abort = threading.Event()
+        batches: queue.Queue[object] = queue.Queue(maxsize=self._queue_size)
+        outcomes: queue.Queue[object] = queue.Queue(maxsize=self._queue_size)
+        parsed = {"rows": 0}
+        title_searches = _SearchBudget(self._title_search_budget)
+
+        def parse() -> None:
+            batch: List[ImportRow] = []
+            try:
+                rows = parse_import_rows(
+                    self._job_repository.read_source(job.job_id), job.source_format
+                )
+                for row in rows:
+                    parsed["rows"] = row.row
+                    if row.row <= job.cursor:
+                        continue
+                    batch.append(row)
+                    if len(batch) >= self._lookup_batch_size:
+                        if not _put(batches, batch, abort):
+                            return
+                        batch = []
+                if batch:
+                    _put(batches, batch, abort)
+            except Exception:
+                abort.set()
+                raise
+            finally:
+                for _ in range(self._lookup_workers):
+                    _put(batches, _DONE, abort)
+
+        def lookup() -> None:
+            try:
+                while not abort.is_set():
+                    batch = _get(batches)
+                    if batch is None:
+                        continue
+                    if batch is _DONE:
+                        break
+                    outcomes_batch = self._lookup_rows(batch, title_searches)
+                    if not _put(outcomes, outcomes_batch, abort):
+                        return
+            except Exception:
+                abort.set()
+                raise
+            finally:
+                _put(outcomes, _DONE, abort)
+
+        pending: List[ImportOutcome] = []
+        completed: set[int] = set()
+        finished_workers = 0
+        with ThreadPoolExecutor(
+            max_workers=self._lookup_workers + 1,
+            thread_name_prefix=f"import-{job.job_id}",
+        ) as pool:
+            workers = [pool.submit(parse)]
+            workers.extend(pool.submit(lookup) for _ in range(self._lookup_workers))
+            try:
+                while finished_workers < self._lookup_workers and not abort.is_set():
+                    if self._stop_event.is_set():
+                        abort.set()
+                        break
+                    value = _get(outcomes)
+                    if value is None:
+                        continue
+                    if value is _DONE:
+                        finished_workers += 1
+                        continue
+                    pending.extend(value)
+                    if len(pending) >= self._write_batch_size:
+                        self._flush(job, repository, pending, completed)
+                        pending = []
+            finally:
+                abort.set()
+
+        for worker in workers:
+            worker.result()
+        self._flush(job, repository, pending, completed)
+        if finished_workers < self._lookup_workers:
+            return
+        job.total = parsed["rows"]
+        job.status = IMPORT_STATUS_COMPLETED
+        self._save(job)
+
+    def _lookup_rows(
+        self, batch: List[ImportRow], title_searches: _SearchBudget
+    ) -> List[ImportOutcome]:
+        isbns = [row.isbn for row in batch if row.isbn]
+        items: Dict[str, LibraryItem] = {}
+        normalized: Dict[str, str] = {}
+        if isbns:
+            result = self._lookup.handle(LookupIsbnsQuery(isbns=isbns))
+            items = result.items
+            normalized = result.normalized
+        outcomes: List[ImportOutcome] = []
+        for row in batch:
+            found = items.get(normalized.get(row.isbn or "", ""))
+            if found is None and not row.isbn and row.title:
+                found = self._search_title(row, title_searches)
+            outcomes.append(build_import_outcome(row, found))
+        return outcomes
+
+    def _search_title(
+        self, row: ImportRow, title_searches: _SearchBudget
+    ) -> Optional[LibraryItem]:
+        if self._title_search is None or not title_searches.take():
+            return None
+        query = SearchQuery(
+            title=row.title, author=row.author or None, limit=TITLE_SEARCH_LIMIT
+        )
+        try:
+            result = self._title_search.search(query)
+        except SearchServiceError:
+            return None
+        return pick_title_match(row, result.items)
+
+    def _flush(
+        self,
+        job: ImportJob,
+        repository: LibraryRepository,
+        outcomes: List[ImportOutcome],
+        completed: set[int],
+    ) -> None:
+        if not outcomes:
+            return
+        items = [outcome.item for outcome in outcomes if outcome.item is not None]
+        if items:
+            repository.merge_many(items)
+
+        for outcome in outcomes:
+            completed.add(outcome.row.row)
+            if outcome.item is not None:
+                job.imported += 1
+                continue
+            if outcome.invalid:
+                job.invalid += 1
+            else:
+                job.not_found += 1
+            job.record_error(
+                ImportRowError(
+                    row=outcome.row.row,
+                    value=outcome.row.isbn or outcome.row.title,
+                    reason=outcome.error or "",
+                )
+            )
+        while job.cursor + 1 in completed:
+            completed.discard(job.cursor + 1)
+            job.cursor += 1
+        self._save(job)
+
+    def _save(self, job: ImportJob) -> None:
+        job.updated_at = self._clock()
+        self._job_repository.save(job)
+
+
+def build_import_outcome(row: ImportRow, found: Optional[LibraryItem]) -> ImportOutcome:
+    if found is not None:
+        return ImportOutcome(row=row, item=apply_import_row(found, row))
+    if row.title:
+        return ImportOutcome(row=row, item=build_row_item(row))
+    if row.isbn and to_isbn13(row.isbn) is None:
+        return ImportOutcome(row=row, error="ISBN の形式が不正です。", invalid=True)
+    if row.isbn:
+        return ImportOutcome(row=row, error="書誌情報が見つかりませんでした。")
+    return ImportOutcome(row=row, error="ISBN またはタイトルが必要です。", invalid=True)
+
+
+def pick_title_match(
+    row: ImportRow, candidates: List[LibraryItem]
+) -> Optional[LibraryItem]:
+    series_title = normalize_match_title(row.title)
+    author_key = normalize_author_key(row.author)
+    for candidate in candidates:
+        if normalize_match_title(candidate.title) != series_title:
+            continue
+        candidate_author = normalize_author_key(candidate.author)
+        if author_key and candidate_author and author_key not in candidate_author:
+            continue
+        return candidate
+    return None
+
+
+def apply_import_row(item: LibraryItem, row: ImportRow) -> LibraryItem:
+    return replace(
+        item,
+        owned_volumes=sorted({*item.owned_volumes, *row.owned_volumes}),
+        notes=row.notes or item.notes or None,
+        is_favorite=item.is_favorite or row.is_favorite,
+        publisher=item.publisher or row.publisher,
+    )
+
+
+def build_row_item(row: ImportRow) -> LibraryItem:
+    series_key = build_series_key(row.title, row.author)
+    digest = hashlib.sha1(series_key.encode("utf-8")).hexdigest()[:16]
+    return LibraryItem(
+        id=f"import-{digest}",
+        title=row.title,
+        author=row.author,
+        publisher=row.publisher,
+        latest_volume=max(row.owned_volumes, default=1),
+        owned_volumes=list(row.owned_volumes),
+        is_favorite=row.is_favorite,
+        notes=row.notes or None,
+        isbn=to_isbn13(row.isbn),
+        source="import",
+    )
+
+
+class _SearchBudget:
+    def __init__(self, limit: int) -> None:
+        self._remaining = limit
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+
+def _put(target: queue.Queue[object], value: object, abort: threading.Event) -> bool:
+    while True:
+        try:
+            target.put(value, timeout=POLL_SECONDS)
+            return True
+        except queue.Full:
+            if abort.is_set():
+                return False
+
+
+def _get(source: queue.Queue[object]) -> object:
+    try:
+        return source.get(timeout=POLL_SECONDS)
+    except queue.Empty:
+        return None
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Sequence
+
+from application.commands.record_series_catalog import (
+    RecordSeriesCatalogCommand,
+    RecordSeriesCatalogHandler,
+)
+from domain.errors import RevisionConflictError, SearchServiceError
+from domain.models import LibraryItem
+from domain.publication_date import normalize_release_date
+from domain.repositories import LibraryRepository, ReleaseTrackerProgressRepository
+from domain.search import SearchQuery
+from domain.series_identity import (
+    build_series_key,
+    build_series_title,
+    normalize_author_key,
+)
+from domain.series_matching import extract_listing_volume, normalize_match_title
+from domain.services import BookSearchService, RateLimiter
+
+SEARCH_LIMIT = 20
+RELEASE_WRITE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class TrackNewReleasesCommand:
+    batch_size: int = 20
+    refresh_interval: timedelta = timedelta(hours=24)
+
+
+@dataclass(frozen=True)
+class TrackNewReleasesResult:
+    checked: int
+    updated: int
+    remaining: int
+
+
+class TrackNewReleasesHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        providers: Sequence[BookSearchService],
+        progress_repository: ReleaseTrackerProgressRepository,
+        rate_limiter: Optional[RateLimiter] = None,
+        catalog_recorder: Optional[RecordSeriesCatalogHandler] = None,
+        workers: int = 1,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._providers = list(providers)
+        self._progress_repository = progress_repository
+        self._rate_limiter = rate_limiter
+        self._catalog_recorder = catalog_recorder
+        self._workers = max(workers, 1)
+        self._clock = clock
+
+    def handle(self, command: TrackNewReleasesCommand) -> TrackNewReleasesResult:
+        now = self._clock()
+        progress = self._progress_repository.load()
+        due_before = now - command.refresh_interval
+
+        due: List[tuple[str, LibraryItem]] = []
+        for item in self._repository.list():
+            series_key = build_series_key(item.title, item.author)
+            checked_at = progress.last_checked(series_key)
+            if checked_at is None or checked_at <= due_before:
+                due.append((series_key, item))
+        due.sort(key=lambda entry: _checked_order(progress.last_checked(entry[0])))
+
+        batch = due[: max(command.batch_size, 0)]
+        lookups = self._find_next_volumes([item for _, item in batch])
+
+        releases: dict[str, LibraryItem] = {}
+        discovered: List[LibraryItem] = []
+        checked = 0
+        for (series_key, item), (attempted, release, found) in zip(
+            batch, lookups, strict=True
+        ):
+            discovered.extend(found)
+            if not attempted:
+                continue
+            checked += 1
+            progress.mark_checked(series_key, now)
+            if release is not None:
+                releases[item.id] = release
+
+        if discovered and self._catalog_recorder is not None:
+            self._catalog_recorder.handle(RecordSeriesCatalogCommand(discovered))
+        updated = self._apply_releases(releases) if releases else 0
+        if checked:
+            self._progress_repository.save(progress)
+
+        return TrackNewReleasesResult(
+            checked=checked,
+            updated=updated,
+            remaining=len(due) - checked,
+        )
+
+    def _find_next_volumes(
+        self, items: Sequence[LibraryItem]
+    ) -> List[tuple[bool, Optional[LibraryItem], List[LibraryItem]]]:
+        if self._workers == 1 or len(items) <= 1:
+            return [self._find_next_volume(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._workers, len(items))) as pool:
+            return list(pool.map(self._find_next_volume, items))
+
+    def _apply_releases(self, releases: dict[str, LibraryItem]) -> int:
+        for attempt in range(1, RELEASE_WRITE_ATTEMPTS + 1):
+            snapshot = self._repository.snapshot()
+            updates: List[LibraryItem] = []
+            for item in snapshot.items:
+                release = releases.get(item.id)
+                if release is None:
+                    continue
+                updated = apply_release(item, release)
+                if updated is not None:
+                    updates.append(updated)
+            if not updates:
+                return 0
+            try:
+                self._repository.upsert_many(
+                    updates, expected_revision=snapshot.revision
+                )
+            except RevisionConflictError:
+                if attempt == RELEASE_WRITE_ATTEMPTS:
+                    raise
+                continue
+            return len(updates)
+        return 0
+
+    def _find_next_volume(
+        self, item: LibraryItem
+    ) -> tuple[bool, Optional[LibraryItem], List[LibraryItem]]:
+        target_volume = max(item.latest_volume, 0) + 1
+        query = SearchQuery(
+            title=build_series_title(item.title),
+            author=item.author or None,
+            limit=SEARCH_LIMIT,
+        )
+
+        attempted = False
+        found: List[LibraryItem] = []
+        for provider in self._providers:
+            if self._rate_limiter is not None and not self._rate_limiter.try_acquire(
+                provider.name
+            ):
+                continue
+            attempted = True
+            try:
+                result = provider.search(query)
+            except SearchServiceError:
+                continue
+            found.extend(result.items)
+            release = pick_next_volume(item, result.items, target_volume)
+            if release is not None:
+                return True, release, found
+        return attempted, None, found
+
+
+def pick_next_volume(
+    item: LibraryItem, candidates: Sequence[LibraryItem], target_volume: int
+) -> Optional[LibraryItem]:
+    series_title = normalize_match_title(item.title)
+    author_key = normalize_author_key(item.author)
+    for candidate in candidates:
+        if extract_listing_volume(candidate.title) != target_volume:
+            continue
+        if normalize_match_title(candidate.title) != series_title:
+            continue
+        candidate_author = normalize_author_key(candidate.author)
+        if author_key and candidate_author and author_key not in candidate_author:
+            continue
+        return candidate
+    return None
+
+
+def apply_release(item: LibraryItem, release: LibraryItem) -> Optional[LibraryItem]:
+    release_date = normalize_release_date(release.published_date)
+    source_url = release.source_url or item.source_url
+    if release_date is None and source_url == item.source_url:
+        return None
+    if release_date == item.next_release_date and source_url == item.source_url:
+        return None
+    return replace(
+        item,
+        next_release_date=release_date or item.next_release_date,
+        source_url=source_url,
+    )
+
+
+def _checked_order(checked_at: Optional[datetime]) -> float:
+    if checked_at is None:
+        return float("-inf")
+    return checked_at.timestamp()
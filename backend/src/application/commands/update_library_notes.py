@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from domain.models import LibraryItem
+from domain.repositories import AsyncLibraryRepository
+
+
+@dataclass(frozen=True)
+class UpdateLibraryNotesCommand:
+    item_id: str
+    notes: str
+
+
+class UpdateLibraryNotesHandler:
+    def __init__(self, repository: AsyncLibraryRepository) -> None:
+        self._repository = repository
+
+    async def handle(self, command: UpdateLibraryNotesCommand) -> LibraryItem:
+        return await self._repository.save_notes(command.item_id, command.notes)
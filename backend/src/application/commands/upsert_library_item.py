@@ -1,19 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from typing import Optional
 
-from domain.models import LibraryItem
-from domain.repositories import LibraryRepository
+from domain.models import LibraryItem, LibraryMutation
+from domain.repositories import AsyncLibraryRepository
 
 
 @dataclass(frozen=True)
 class UpsertLibraryItemCommand:
     item: LibraryItem
+    expected_revision: Optional[int] = None
 
 
 class UpsertLibraryItemHandler:
-    def __init__(self, repository: LibraryRepository) -> None:
+    def __init__(self, repository: AsyncLibraryRepository) -> None:
         self._repository = repository
 
-    def handle(self, command: UpsertLibraryItemCommand) -> LibraryItem:
-        return self._repository.upsert(command.item)
+    async def handle(self, command: UpsertLibraryItemCommand) -> LibraryMutation:
+        mutation = await self._repository.upsert(
+            command.item, command.expected_revision
+        )
+        saved = mutation.item
+        if saved is None or saved.notes is not None:
+            return mutation
+        notes = await self._repository.load_notes([saved.id])
+        return replace(mutation, item=replace(saved, notes=notes.get(saved.id, "")))
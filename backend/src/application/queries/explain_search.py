@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from domain.search import SearchQuery
+from domain.search_planning import SearchPlan
+from domain.services import SearchPlanner
+
+
+class ExplainSearchHandler:
+    def __init__(self, planner: SearchPlanner) -> None:
+        self._planner = planner
+
+    def handle(self, query: SearchQuery) -> SearchPlan:
+        return self._planner.plan(query)
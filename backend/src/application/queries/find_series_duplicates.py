@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+from domain.models import LibraryItem
+from domain.repositories import LibraryRepository
+from domain.series_matching import (
+    REPORT_AUTHOR_THRESHOLD,
+    REPORT_TITLE_THRESHOLD,
+    find_similar_series,
+)
+
+
+@dataclass(frozen=True)
+class FindSeriesDuplicatesQuery:
+    title_threshold: float = REPORT_TITLE_THRESHOLD
+    author_threshold: float = REPORT_AUTHOR_THRESHOLD
+
+
+@dataclass(frozen=True)
+class SeriesDuplicateCandidate:
+    left: LibraryItem
+    right: LibraryItem
+    title_similarity: float
+    author_similarity: float
+
+
+class FindSeriesDuplicatesHandler:
+    def __init__(self, repository: LibraryRepository) -> None:
+        self._repository = repository
+
+    def handle(
+        self, query: FindSeriesDuplicatesQuery
+    ) -> List[SeriesDuplicateCandidate]:
+        items = self._repository.list()
+        by_id = {item.id: item for item in items}
+        matches = find_similar_series(
+            items, query.title_threshold, query.author_threshold
+        )
+        return [
+            SeriesDuplicateCandidate(
+                left=by_id[match.left_id],
+                right=by_id[match.right_id],
+                title_similarity=match.title_similarity,
+                author_similarity=match.author_similarity,
+            )
+            for match in matches
+        ]
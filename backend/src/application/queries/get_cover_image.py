@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from domain.covers import COVER_SIZE_ORIGINAL, CoverImage
+from domain.errors import LibraryItemNotFoundError
+from domain.repositories import LibraryRepository
+from domain.services import CoverImageStore
+
+
+@dataclass(frozen=True)
+class GetCoverImageQuery:
+    item_id: str
+    size: str = COVER_SIZE_ORIGINAL
+
+
+class GetCoverImageHandler:
+    def __init__(
+        self, repository: LibraryRepository, cover_store: CoverImageStore
+    ) -> None:
+        self._repository = repository
+        self._cover_store = cover_store
+
+    def handle(self, query: GetCoverImageQuery) -> Optional[CoverImage]:
+        item = self._repository.get(query.item_id)
+        if item is None:
+            raise LibraryItemNotFoundError(query.item_id)
+        if not item.cover_url:
+            return None
+        return self._cover_store.get(item.cover_url, query.size)
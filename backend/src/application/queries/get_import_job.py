@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from domain.errors import ImportJobNotFoundError
+from domain.imports import ImportJob
+from domain.repositories import ImportJobRepository
+from domain.tenants import DEFAULT_TENANT_ID
+
+
+@dataclass(frozen=True)
+class GetImportJobQuery:
+    job_id: str
+    tenant_id: str = DEFAULT_TENANT_ID
+
+
+class GetImportJobHandler:
+    def __init__(self, job_repository: ImportJobRepository) -> None:
+        self._job_repository = job_repository
+
+    def handle(self, query: GetImportJobQuery) -> ImportJob:
+        job = self._job_repository.get(query.job_id)
+        if job is None or job.tenant_id != query.tenant_id:
+            raise ImportJobNotFoundError(query.job_id)
+        return job
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, replace
+from typing import Optional
 
-from domain.models import LibraryItem
+from domain.models import LibrarySnapshot
 from domain.repositories import LibraryRepository
 
 
 @dataclass(frozen=True)
-class GetLibraryQuery:
-    pass
+class GetLibrarySnapshotQuery:
+    known_revision: Optional[int] = None
+    include_notes: bool = False
+    known_notes_version: Optional[str] = None
 
 
-class GetLibraryHandler:
+class GetLibrarySnapshotHandler:
     def __init__(self, repository: LibraryRepository) -> None:
         self._repository = repository
 
-    def handle(self, _query: GetLibraryQuery) -> List[LibraryItem]:
-        return self._repository.list()
+    def handle(self, query: GetLibrarySnapshotQuery) -> Optional[LibrarySnapshot]:
+        notes_version = (
+            self._repository.notes_version() if query.include_notes else None
+        )
+        if (
+            query.known_revision is not None
+            and self._repository.revision() == query.known_revision
+            and query.known_notes_version == notes_version
+        ):
+            return None
+        snapshot = self._repository.snapshot()
+        if not query.include_notes:
+            return snapshot
+        notes = self._repository.load_notes([item.id for item in snapshot.items])
+        return LibrarySnapshot(
+            revision=snapshot.revision,
+            items=[
+                replace(item, notes=notes.get(item.id, "")) for item in snapshot.items
+            ],
+            notes_version=notes_version,
+        )
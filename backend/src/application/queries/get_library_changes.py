@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from domain.models import LibraryChanges
+from domain.repositories import AsyncLibraryRepository
+
+
+@dataclass(frozen=True)
+class GetLibraryChangesQuery:
+    since: int
+
+
+class GetLibraryChangesHandler:
+    def __init__(self, repository: AsyncLibraryRepository) -> None:
+        self._repository = repository
+
+    async def handle(self, query: GetLibraryChangesQuery) -> LibraryChanges:
+        return await self._repository.changes_since(max(query.since, 0))
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from domain.errors import LibraryItemNotFoundError
+from domain.models import LibraryItem
+from domain.repositories import AsyncLibraryRepository
+
+
+@dataclass(frozen=True)
+class GetLibraryItemQuery:
+    item_id: str
+
+
+class GetLibraryItemHandler:
+    def __init__(self, repository: AsyncLibraryRepository) -> None:
+        self._repository = repository
+
+    async def handle(self, query: GetLibraryItemQuery) -> LibraryItem:
+        item = await self._repository.get(query.item_id)
+        if item is None:
+            raise LibraryItemNotFoundError(query.item_id)
+        notes = await self._repository.load_notes([item.id])
+        return replace(item, notes=notes.get(item.id, ""))
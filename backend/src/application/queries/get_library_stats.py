@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+from domain.library_stats import LibraryStats
+from domain.repositories import LibraryRepository
+from domain.services import LibraryStatsIndex
+
+
+@dataclass(frozen=True)
+class GetLibraryStatsQuery:
+    limit: int = 10
+
+
+class GetLibraryStatsHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        index: LibraryStatsIndex,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._index = index
+        self._clock = clock
+        self._revision: Optional[int] = None
+        self._cached: Dict[Tuple[date, int], LibraryStats] = {}
+        self._lock = threading.Lock()
+
+    def handle(self, query: GetLibraryStatsQuery) -> LibraryStats:
+        with self._lock:
+            self._sync_library()
+            key = (self._clock().date(), query.limit)
+            stats = self._cached.get(key)
+            if stats is None:
+                stats = replace(
+                    self._index.aggregate(key[0], query.limit),
+                    revision=self._revision or 0,
+                )
+                self._cached = {
+                    cached_key: cached
+                    for cached_key, cached in self._cached.items()
+                    if cached_key[0] == key[0]
+                }
+                self._cached[key] = stats
+            return stats
+
+    def _sync_library(self) -> None:
+        if self._revision is not None and self._repository.revision() == self._revision:
+            return
+        if self._revision is None:
+            snapshot = self._repository.snapshot()
+            self._index.reset(snapshot.items)
+            self._revision = snapshot.revision
+        else:
+            changes = self._repository.changes_since(self._revision)
+            if changes.reset:
+                self._index.reset(changes.items)
+            else:
+                self._index.update(changes.items, changes.deleted)
+            self._revision = changes.revision
+        self._cached = {}
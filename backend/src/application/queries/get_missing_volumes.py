@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from domain.errors import LibraryItemNotFoundError
+from domain.models import LibraryItem
+from domain.repositories import LibraryRepository, SeriesCatalogRepository
+from domain.series_catalog import compress_volume_ranges, find_missing_volumes
+from domain.series_matching import build_listing_series_key
+
+
+@dataclass(frozen=True)
+class GetMissingVolumesQuery:
+    item_id: str
+
+
+@dataclass(frozen=True)
+class MissingVolumes:
+    item: LibraryItem
+    series_key: str
+    known_volumes: List[int]
+    missing_volumes: List[int]
+    missing_ranges: List[tuple[int, int]]
+    missing_isbns: Dict[int, str]
+    catalog_refreshed_at: Optional[datetime]
+    stale: bool
+
+
+class GetMissingVolumesHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        catalog_repository: SeriesCatalogRepository,
+        ttl: timedelta,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repository = repository
+        self._catalog_repository = catalog_repository
+        self._ttl = ttl
+        self._clock = clock
+
+    def handle(self, query: GetMissingVolumesQuery) -> MissingVolumes:
+        item = self._repository.get(query.item_id)
+        if item is None:
+            raise LibraryItemNotFoundError(query.item_id)
+
+        series_key = build_listing_series_key(item.title, item.author)
+        entry = self._catalog_repository.get(series_key)
+        catalog_volumes = entry.volumes if entry is not None else {}
+
+        missing = find_missing_volumes(
+            item.owned_volumes, catalog_volumes, item.latest_volume
+        )
+        missing_isbns = {
+            volume: isbn
+            for volume in missing
+            if (isbn := catalog_volumes.get(volume)) is not None
+        }
+        return MissingVolumes(
+            item=item,
+            series_key=series_key,
+            known_volumes=sorted(catalog_volumes),
+            missing_volumes=missing,
+            missing_ranges=compress_volume_ranges(missing),
+            missing_isbns=missing_isbns,
+            catalog_refreshed_at=entry.refreshed_at if entry is not None else None,
+            stale=entry is None or entry.is_stale(self._clock(), self._ttl),
+        )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+from domain.backups import BackupSnapshot
+from domain.repositories import LibraryBackupRepository
+
+
+@dataclass(frozen=True)
+class ListLibraryBackupsQuery:
+    pass
+
+
+class ListLibraryBackupsHandler:
+    def __init__(self, backup_repository: LibraryBackupRepository) -> None:
+        self._backup_repository = backup_repository
+
+    def handle(self, query: ListLibraryBackupsQuery) -> List[BackupSnapshot]:
+        return self._backup_repository.list_snapshots()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from domain.errors import SearchServiceError
+from domain.isbn import IsbnCacheEntry, to_isbn13
+from domain.models import LibraryItem
+from domain.repositories import IsbnLookupCacheRepository
+from domain.services import IsbnLookupService
+
+
+@dataclass(frozen=True)
+class LookupIsbnsQuery:
+    isbns: Sequence[str]
+
+
+@dataclass(frozen=True)
+class IsbnLookupResult:
+    items: Dict[str, LibraryItem]
+    normalized: Dict[str, str]
+    not_found: List[str]
+    invalid: List[str]
+    cached: int
+
+
+class LookupIsbnsHandler:
+    def __init__(
+        self,
+        providers: Sequence[IsbnLookupService],
+        cache_repository: IsbnLookupCacheRepository,
+        found_ttl: timedelta,
+        miss_ttl: timedelta,
+        max_workers: int = 4,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._providers = list(providers)
+        self._cache_repository = cache_repository
+        self._found_ttl = found_ttl
+        self._miss_ttl = miss_ttl
+        self._max_workers = max(max_workers, 1)
+        self._clock = clock
+
+    def handle(self, query: LookupIsbnsQuery) -> IsbnLookupResult:
+        normalized: Dict[str, str] = {}
+        invalid: List[str] = []
+        for raw in query.isbns:
+            isbn = to_isbn13(raw)
+            if isbn is None:
+                invalid.append(raw)
+                continue
+            normalized[raw] = isbn
+        wanted = list(dict.fromkeys(normalized.values()))
+
+        now = self._clock()
+        items: Dict[str, LibraryItem] = {}
+        pending: List[str] = []
+        cached = 0
+        entries = {
+            entry.isbn: entry for entry in self._cache_repository.get_many(wanted)
+        }
+        for isbn in wanted:
+            entry = entries.get(isbn)
+            if entry is None or not entry.is_fresh(
+                now, self._found_ttl, self._miss_ttl
+            ):
+                pending.append(isbn)
+                continue
+            cached += 1
+            if entry.item is not None:
+                items[isbn] = entry.item
+
+        fetched, answered = self._fetch(pending)
+        items.update(fetched)
+        misses = [isbn for isbn in pending if isbn not in fetched]
+        self._cache_repository.save_many(
+            [
+                IsbnCacheEntry(isbn=isbn, item=item, fetched_at=now)
+                for isbn, item in fetched.items()
+            ]
+            + [
+                IsbnCacheEntry(isbn=isbn, item=None, fetched_at=now)
+                for isbn in misses
+                if isbn in answered
+            ]
+        )
+
+        return IsbnLookupResult(
+            items=items,
+            normalized=normalized,
+            not_found=[isbn for isbn in wanted if isbn not in items],
+            invalid=invalid,
+            cached=cached,
+        )
+
+    def _fetch(self, isbns: List[str]) -> tuple[Dict[str, LibraryItem], Set[str]]:
+        found: Dict[str, LibraryItem] = {}
+        answered: Set[str] = set()
+        remaining = list(isbns)
+        if not remaining:
+            return found, answered
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for provider in self._providers:
+                if not remaining:
+                    break
+                batches = chunk_isbns(remaining, provider.max_batch_size)
+                results = executor.map(
+                    lambda batch, provider=provider: _lookup(provider, batch), batches
+                )
+                for batch, result in zip(batches, results, strict=True):
+                    if result is None:
+                        continue
+                    answered.update(batch)
+                    found.update(result)
+                remaining = [isbn for isbn in remaining if isbn not in found]
+        return found, answered
+
+
+def chunk_isbns(isbns: Sequence[str], batch_size: int) -> List[List[str]]:
+    size = max(batch_size, 1)
+    return [list(isbns[index : index + size]) for index in range(0, len(isbns), size)]
+
+
+def _lookup(
+    provider: IsbnLookupService, batch: List[str]
+) -> Optional[Dict[str, LibraryItem]]:
+    try:
+        return provider.lookup_isbns(batch)
+    except SearchServiceError:
+        return None
@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from typing import Optional
+
+from application.commands.record_series_catalog import (
+    RecordSeriesCatalogCommand,
+    RecordSeriesCatalogHandler,
+)
 from application.queries.rank_search_results import rank_search_result
-from domain.search import SearchQuery, SearchResult
+from domain.cancellation import raise_if_cancelled
+from domain.repositories import SearchResultCacheRepository
+from domain.search import SEARCH_PIPELINE_FIELDS, SearchQuery, SearchResult
 from domain.services import BookSearchService
 
 
 class SearchBooksHandler:
-    def __init__(self, service: BookSearchService) -> None:
+    def __init__(
+        self,
+        service: BookSearchService,
+        catalog_recorder: Optional[RecordSeriesCatalogHandler] = None,
+        cache: Optional[SearchResultCacheRepository] = None,
+    ) -> None:
         self._service = service
+        self._catalog_recorder = catalog_recorder
+        self._cache = cache
 
     def handle(self, query: SearchQuery) -> SearchResult:
         has_condition = any(
@@ -22,5 +38,21 @@ class SearchBooksHandler:
         )
         if not has_condition:
             return SearchResult(items=[], total=0, page=query.page, limit=query.limit)
-        result = self._service.search(query)
-        return rank_search_result(result, query)
+        if self._cache is not None:
+            cached = self._cache.get(query)
+            if cached is not None:
+                return cached
+
+        provider_query = query
+        if query.fields is not None:
+            provider_query = replace(
+                query, fields=query.fields | SEARCH_PIPELINE_FIELDS
+            )
+        result = self._service.search(provider_query)
+        raise_if_cancelled()
+        if self._catalog_recorder is not None:
+            self._catalog_recorder.handle(RecordSeriesCatalogCommand(result.items))
+        ranked = rank_search_result(result, provider_query)
+        if self._cache is not None:
+            self._cache.save(query, ranked)
+        return ranked
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+from domain.models import LibraryItem
+from domain.repositories import LibraryRepository
+from domain.series_identity import build_series_title
+from domain.suggestions import (
+    LIBRARY_OWNER_PREFIX,
+    SUGGESTION_KIND_AUTHOR,
+    SUGGESTION_KIND_TITLE,
+    PrefixIndex,
+    Suggestion,
+    normalize_suggestion_key,
+)
+
+
+@dataclass(frozen=True)
+class SuggestTitlesQuery:
+    prefix: str
+    limit: int = 10
+
+
+class SuggestTitlesHandler:
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        index: PrefixIndex,
+        catalog_index: Optional[PrefixIndex] = None,
+    ) -> None:
+        self._repository = repository
+        self._index = index
+        self._catalog_index = catalog_index
+        self._revision: Optional[int] = None
+        self._sync_lock = threading.Lock()
+
+    def handle(self, query: SuggestTitlesQuery) -> List[Suggestion]:
+        self._sync_library()
+        suggestions = self._index.search(query.prefix, query.limit)
+        if self._catalog_index is None or len(suggestions) >= query.limit:
+            return suggestions
+        seen = {suggestion_id(suggestion) for suggestion in suggestions}
+        for suggestion in self._catalog_index.search(
+            query.prefix, query.limit + len(suggestions)
+        ):
+            if len(suggestions) >= query.limit:
+                break
+            if suggestion_id(suggestion) not in seen:
+                suggestions.append(suggestion)
+        return suggestions
+
+    def _sync_library(self) -> None:
+        revision = self._repository.revision()
+        if revision == self._revision:
+            return
+        with self._sync_lock:
+            if revision == self._revision:
+                return
+            if self._revision is None:
+                snapshot = self._repository.snapshot()
+                self._reset(snapshot.items)
+                self._revision = snapshot.revision
+                return
+
+            changes = self._repository.changes_since(self._revision)
+            if changes.reset:
+                self._reset(changes.items)
+            else:
+                for item in changes.items:
+                    self._index.replace_owner(library_owner(item.id), item_terms(item))
+                for item_id in changes.deleted:
+                    self._index.remove_owner(library_owner(item_id))
+            self._revision = changes.revision
+
+    def _reset(self, items: List[LibraryItem]) -> None:
+        current = {library_owner(item.id) for item in items}
+        for owner in self._index.owners(LIBRARY_OWNER_PREFIX):
+            if owner not in current:
+                self._index.remove_owner(owner)
+        for item in items:
+            self._index.replace_owner(library_owner(item.id), item_terms(item))
+
+
+def library_owner(item_id: str) -> str:
+    return f"{LIBRARY_OWNER_PREFIX}{item_id}"
+
+
+def suggestion_id(suggestion: Suggestion) -> tuple[str, str]:
+    return suggestion.kind, normalize_suggestion_key(suggestion.text)
+
+
+def item_terms(item: LibraryItem) -> List[tuple[str, str]]:
+    return [
+        (SUGGESTION_KIND_TITLE, build_series_title(item.title)),
+        (SUGGESTION_KIND_AUTHOR, item.author),
+    ]
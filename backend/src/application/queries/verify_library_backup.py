@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from domain.backups import BackupVerification
+from domain.errors import BackupSnapshotNotFoundError
+from domain.repositories import LibraryBackupRepository
+
+
+@dataclass(frozen=True)
+class VerifyLibraryBackupQuery:
+    snapshot_id: str
+
+
+class VerifyLibraryBackupHandler:
+    def __init__(self, backup_repository: LibraryBackupRepository) -> None:
+        self._backup_repository = backup_repository
+
+    def handle(self, query: VerifyLibraryBackupQuery) -> BackupVerification:
+        verification = self._backup_repository.verify(query.snapshot_id)
+        if verification is None:
+            raise BackupSnapshotNotFoundError(query.snapshot_id)
+        return verification
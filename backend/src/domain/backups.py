@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Hashable, List, Optional, Sequence, Set
+
+
+@dataclass(frozen=True)
+class BackupSnapshot:
+    snapshot_id: str
+    created_at: datetime
+    revision: int
+    item_count: int
+    parent_id: Optional[str] = None
+    new_objects: int = 0
+    stored_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class BackupVerification:
+    snapshot_id: str
+    checked_objects: int
+    missing: List[str] = field(default_factory=list)
+    corrupt: List[str] = field(default_factory=list)
+    broken_chain: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and not self.corrupt and not self.broken_chain
+
+
+@dataclass(frozen=True)
+class BackupRetentionPolicy:
+    keep_last: int = 24
+    keep_daily: int = 14
+    keep_weekly: int = 8
+
+    def select_retained(self, snapshots: Sequence[BackupSnapshot]) -> Set[str]:
+        ordered = sorted(snapshots, key=lambda snapshot: snapshot.created_at)
+        ordered.reverse()
+        retained = {snapshot.snapshot_id for snapshot in ordered[: self.keep_last]}
+        retained |= _newest_per_bucket(
+            ordered, self.keep_daily, lambda created_at: created_at.date()
+        )
+        retained |= _newest_per_bucket(
+            ordered,
+            self.keep_weekly,
+            lambda created_at: tuple(created_at.isocalendar())[:2],
+        )
+        return retained
+
+
+def _newest_per_bucket(
+    newest_first: Sequence[BackupSnapshot],
+    limit: int,
+    bucket: Callable[[datetime], Hashable],
+) -> Set[str]:
+    selected: Set[str] = set()
+    seen: Set[Hashable] = set()
+    for snapshot in newest_first:
+        if len(seen) >= limit:
+            break
+        key = bucket(snapshot.created_at)
+        if key in seen:
+            continue
+        seen.add(key)
+        selected.add(snapshot.snapshot_id)
+    return selected
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+COVER_SIZE_ORIGINAL = "original"
+COVER_SIZE_SMALL = "small"
+COVER_SIZES = (COVER_SIZE_ORIGINAL, COVER_SIZE_SMALL)
+
+
+@dataclass(frozen=True)
+class CoverImage:
+    content: bytes
+    content_type: str
+    digest: str
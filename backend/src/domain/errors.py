@@ -1,2 +1,34 @@
 class SearchServiceError(RuntimeError):
     """Raised when the external search provider fails."""
+
+
+class LibraryItemNotFoundError(LookupError):
+    """Raised when the requested library item does not exist."""
+
+
+class RevisionConflictError(RuntimeError):
+    """Raised when a write is based on an outdated library revision."""
+
+
+class CoverImageError(RuntimeError):
+    """Raised when a cover image cannot be fetched or cached."""
+
+
+class ImportJobNotFoundError(LookupError):
+    """Raised when the requested import job does not exist."""
+
+
+class BackupSnapshotNotFoundError(LookupError):
+    """Raised when the requested backup snapshot does not exist."""
+
+
+class BackupIntegrityError(RuntimeError):
+    """Raised when a backup snapshot fails verification."""
+
+
+class OperationCancelledError(RuntimeError):
+    """Raised when the caller abandoned the operation before it finished."""
+
+
+class SearchOverloadedError(SearchServiceError):
+    """Raised when search capacity is exhausted and the request is shed."""
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import csv
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .tenants import DEFAULT_TENANT_ID
+
+IMPORT_FORMAT_CSV = "csv"
+IMPORT_FORMAT_ISBN_LIST = "isbns"
+IMPORT_FORMATS = (IMPORT_FORMAT_CSV, IMPORT_FORMAT_ISBN_LIST)
+
+IMPORT_STATUS_QUEUED = "queued"
+IMPORT_STATUS_RUNNING = "running"
+IMPORT_STATUS_COMPLETED = "completed"
+IMPORT_STATUS_FAILED = "failed"
+
+MAX_RECORDED_ERRORS = 100
+
+_CSV_COLUMNS: Dict[str, str] = {
+    "isbn": "isbn",
+    "isbn13": "isbn",
+    "isbn10": "isbn",
+    "title": "title",
+    "タイトル": "title",
+    "書名": "title",
+    "author": "author",
+    "著者": "author",
+    "publisher": "publisher",
+    "出版社": "publisher",
+    "volume": "volumes",
+    "volumes": "volumes",
+    "ownedvolumes": "volumes",
+    "巻": "volumes",
+    "所持巻": "volumes",
+    "notes": "notes",
+    "メモ": "notes",
+    "favorite": "favorite",
+    "isfavorite": "favorite",
+    "お気に入り": "favorite",
+}
+_TRUE_VALUES = {"1", "true", "yes", "y", "on", "○", "◯"}
+_VOLUME_RANGE_RE = re.compile(r"^(\d+)\s*[-~〜～]\s*(\d+)$")
+MAX_VOLUME_RANGE = 1000
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    row: int
+    isbn: Optional[str] = None
+    title: str = ""
+    author: str = ""
+    publisher: Optional[str] = None
+    owned_volumes: List[int] = field(default_factory=list)
+    notes: str = ""
+    is_favorite: bool = False
+
+
+@dataclass(frozen=True)
+class ImportRowError:
+    row: int
+    value: str
+    reason: str
+
+
+@dataclass
+class ImportJob:
+    job_id: str
+    source_format: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    cursor: int = 0
+    total: Optional[int] = None
+    imported: int = 0
+    not_found: int = 0
+    invalid: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    message: Optional[str] = None
+    tenant_id: str = DEFAULT_TENANT_ID
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (IMPORT_STATUS_COMPLETED, IMPORT_STATUS_FAILED)
+
+    def record_error(self, error: ImportRowError) -> None:
+        if len(self.errors) < MAX_RECORDED_ERRORS:
+            self.errors.append(error)
+
+
+def parse_import_rows(lines: Iterable[str], source_format: str) -> Iterator[ImportRow]:
+    if source_format == IMPORT_FORMAT_ISBN_LIST:
+        yield from _parse_isbn_list(lines)
+        return
+    yield from _parse_csv(lines)
+
+
+def parse_volume_list(value: str) -> List[int]:
+    volumes: set[int] = set()
+    normalized = unicodedata.normalize("NFKC", value or "")
+    for part in re.split(r"[,、;\s]+", normalized):
+        if not part:
+            continue
+        if part.isdigit():
+            volumes.add(int(part))
+            continue
+        match = _VOLUME_RANGE_RE.match(part)
+        if match is None:
+            continue
+        start, end = int(match.group(1)), int(match.group(2))
+        if start <= end and end - start <= MAX_VOLUME_RANGE:
+            volumes.update(range(start, end + 1))
+    return sorted(volume for volume in volumes if volume > 0)
+
+
+def _parse_isbn_list(lines: Iterable[str]) -> Iterator[ImportRow]:
+    row = 0
+    for line in lines:
+        value = line.strip()
+        if not value or value.startswith("#"):
+            continue
+        row += 1
+        yield ImportRow(row=row, isbn=value)
+
+
+def _parse_csv(lines: Iterable[str]) -> Iterator[ImportRow]:
+    reader = csv.reader(lines)
+    columns: Optional[List[Optional[str]]] = None
+    row = 0
+    for record in reader:
+        if not any(cell.strip() for cell in record):
+            continue
+        if columns is None:
+            columns = [_CSV_COLUMNS.get(_column_key(cell)) for cell in record]
+            if any(column is not None for column in columns):
+                continue
+            columns = ["isbn", "title", "author", "volumes"]
+
+        values: Dict[str, str] = {}
+        for column, cell in zip(columns, record, strict=False):
+            if column is not None and cell.strip():
+                values.setdefault(column, cell.strip())
+        row += 1
+        yield ImportRow(
+            row=row,
+            isbn=values.get("isbn"),
+            title=values.get("title", ""),
+            author=values.get("author", ""),
+            publisher=values.get("publisher"),
+            owned_volumes=parse_volume_list(values.get("volumes", "")),
+            notes=values.get("notes", ""),
+            is_favorite=values.get("favorite", "").lower() in _TRUE_VALUES,
+        )
+
+
+def _column_key(value: str) -> str:
+    normalized = unicodedata.normalize("NFKC", value).strip().lower()
+    return re.sub(r"[\s_\-]+", "", normalized.lstrip("﻿"))
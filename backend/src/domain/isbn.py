@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .models import LibraryItem
+
+
+@dataclass(frozen=True)
+class IsbnCacheEntry:
+    isbn: str
+    item: Optional[LibraryItem]
+    fetched_at: datetime
+
+    def is_fresh(
+        self, now: datetime, found_ttl: timedelta, miss_ttl: timedelta
+    ) -> bool:
+        ttl = found_ttl if self.item is not None else miss_ttl
+        return self.fetched_at > now - ttl
+
+
+def normalize_isbn(value: str) -> str:
+    return re.sub(r"[^0-9xX]", "", value or "").upper()
+
+
+def is_valid_isbn10(value: str) -> bool:
+    if not re.fullmatch(r"\d{9}[\dX]", value):
+        return False
+    total = sum(
+        (10 - index) * (10 if char == "X" else int(char))
+        for index, char in enumerate(value)
+    )
+    return total % 11 == 0
+
+
+def is_valid_isbn13(value: str) -> bool:
+    if not re.fullmatch(r"97[89]\d{10}", value):
+        return False
+    return isbn13_check_digit(value[:12]) == value[12]
+
+
+def isbn13_check_digit(body: str) -> str:
+    total = sum(
+        int(char) * (1 if index % 2 == 0 else 3) for index, char in enumerate(body)
+    )
+    return str((10 - total % 10) % 10)
+
+
+def to_isbn13(value: Optional[str]) -> Optional[str]:
+    isbn = normalize_isbn(value or "")
+    if len(isbn) == 13 and is_valid_isbn13(isbn):
+        return isbn
+    if len(isbn) == 10 and is_valid_isbn10(isbn):
+        body = f"978{isbn[:9]}"
+        return body + isbn13_check_digit(body)
+    return None
+
+
+def to_isbn10(value: Optional[str]) -> Optional[str]:
+    isbn13 = to_isbn13(value)
+    if isbn13 is None or not isbn13.startswith("978"):
+        return None
+    body = isbn13[3:12]
+    total = sum((10 - index) * int(char) for index, char in enumerate(body))
+    check = (11 - total % 11) % 11
+    return body + ("X" if check == 10 else str(check))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import LibraryItem
+from .publication_date import parse_publication_date
+
+
+@dataclass(frozen=True)
+class StatsBucket:
+    key: str
+    count: int
+
+
+@dataclass(frozen=True)
+class SeriesCompletion:
+    item_id: str
+    title: str
+    owned_volumes: int
+    latest_volume: int
+    ratio: float
+
+
+@dataclass(frozen=True)
+class LibraryStats:
+    revision: int
+    series: int
+    owned_volumes: int
+    favorites: int
+    completed_series: int
+    average_completion: float
+    volumes_by_author: List[StatsBucket]
+    volumes_by_publisher: List[StatsBucket]
+    completion: List[SeriesCompletion]
+    upcoming_releases: List[StatsBucket]
+    genres: List[StatsBucket]
+
+
+def owned_volume_count(item: LibraryItem) -> int:
+    return len(item.owned_volumes)
+
+
+def release_month(value: Optional[str]) -> Tuple[int, int]:
+    parts = parse_publication_date(value)
+    if parts is None or parts[1] == 0:
+        return -1, 0
+    year, month, day = parts
+    return year * 12 + month - 1, day
+
+
+def month_index(today: date) -> int:
+    return today.year * 12 + today.month - 1
+
+
+def month_label(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def rank_buckets(counts: Dict[str, int], limit: int) -> List[StatsBucket]:
+    ranked = sorted((key, count) for key, count in counts.items() if key and count > 0)
+    ranked.sort(key=lambda entry: -entry[1])
+    return [StatsBucket(key=key, count=count) for key, count in ranked[:limit]]
+
+
+def month_buckets(counts: Dict[int, int]) -> List[StatsBucket]:
+    return [
+        StatsBucket(key=month_label(month), count=counts[month])
+        for month in sorted(counts)
+        if counts[month] > 0
+    ]
+
+
+def least_complete(
+    entries: Iterable[SeriesCompletion], limit: int
+) -> List[SeriesCompletion]:
+    return heapq.nsmallest(
+        limit, entries, key=lambda entry: (entry.ratio, entry.title, entry.item_id)
+    )
@@ -15,9 +15,31 @@ class LibraryItem:
     owned_volumes: List[int] = field(default_factory=list)
     next_release_date: Optional[str] = None
     is_favorite: bool = False
-    notes: str = ""
+    notes: Optional[str] = None
     cover_url: str = ""
     genre: List[str] = field(default_factory=list)
     isbn: Optional[str] = None
     source: Optional[str] = None
     source_url: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class LibrarySnapshot:
+    revision: int
+    items: List[LibraryItem]
+    notes_version: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class LibraryMutation:
+    revision: int
+    item: Optional[LibraryItem] = None
+
+
+@dataclass(frozen=True)
+class LibraryChanges:
+    revision: int
+    since: int
+    items: List[LibraryItem]
+    deleted: List[str]
+    reset: bool = False
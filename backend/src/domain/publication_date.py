@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import calendar
+import re
+import unicodedata
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+_DATE_PARTS_RE = re.compile(
+    r"(?P<year>\d{4})(?:\s*[-/.年]\s*(?P<month>\d{1,2})(?:\s*[-/.月]\s*(?P<day>\d{1,2}))?)?"
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_publication_date(value: Optional[str]) -> Optional[tuple[int, int, int]]:
+    if not value:
+        return None
+    normalized = unicodedata.normalize("NFKC", value)
+    match = _DATE_PARTS_RE.search(normalized)
+    if not match:
+        return None
+    year = int(match.group("year"))
+    month = int(match.group("month") or 0)
+    day = int(match.group("day") or 0)
+    if not 1 <= month <= 12:
+        return (year, 0, 0)
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return (year, month, 0)
+    return (year, month, day)
+
+
+def normalize_release_date(value: Optional[str]) -> Optional[str]:
+    parts = parse_publication_date(value)
+    if parts is None:
+        return None
+    year, month, day = parts
+    if month == 0:
+        return f"{year:04d}"
+    if day == 0:
+        return f"{year:04d}-{month:02d}"
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=4096)
+def publication_date_range(value: Optional[str]) -> Optional[tuple[date, date]]:
+    parts = parse_publication_date(value)
+    if parts is None:
+        return None
+    year, month, day = parts
+    if not 1 <= year <= 9999:
+        return None
+    if month == 0:
+        return date(year, 1, 1), date(year, 12, 31)
+    if day == 0:
+        last_day = calendar.monthrange(year, month)[1]
+        return date(year, month, 1), date(year, month, last_day)
+    return date(year, month, day), date(year, month, day)
+
+
+def is_published_between(
+    value: Optional[str], from_date: Optional[date], until: Optional[date]
+) -> bool:
+    if from_date is None and until is None:
+        return True
+    period = publication_date_range(value)
+    if period is None:
+        return False
+    earliest, latest = period
+    if from_date is not None and latest < from_date:
+        return False
+    return until is None or earliest <= until
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+
+
+@dataclass
+class ReleaseTrackerProgress:
+    checked_at: Dict[str, datetime] = field(default_factory=dict)
+
+    def last_checked(self, series_key: str) -> Optional[datetime]:
+        return self.checked_at.get(series_key)
+
+    def mark_checked(self, series_key: str, checked_at: datetime) -> None:
+        self.checked_at[series_key] = checked_at
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence
 
-from .models import LibraryItem
+from .backups import BackupSnapshot, BackupVerification
+from .imports import ImportJob
+from .isbn import IsbnCacheEntry
+from .models import LibraryChanges, LibraryItem, LibraryMutation, LibrarySnapshot
+from .release_tracking import ReleaseTrackerProgress
+from .search import SearchQuery, SearchResult
+from .series_catalog import SeriesCatalogEntry
 
 
 class LibraryRepository(ABC):
@@ -12,9 +19,209 @@ class LibraryRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def upsert(self, item: LibraryItem) -> LibraryItem:
+    def snapshot(self) -> LibrarySnapshot:
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, item_id: str) -> None:
+    def revision(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def changes_since(self, revision: int) -> LibraryChanges:
+        raise NotImplementedError
+
+    @abstractmethod
+    def compact_changes(self, deleted_before: datetime) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, item_id: str) -> Optional[LibraryItem]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert(
+        self, item: LibraryItem, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_many(
+        self, items: Sequence[LibraryItem], expected_revision: Optional[int] = None
+    ) -> List[LibraryItem]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def merge_many(self, items: Sequence[LibraryItem]) -> List[LibraryItem]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(
+        self, item_id: str, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_notes(self, item_ids: Sequence[str]) -> Dict[str, str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def notes_version(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_notes(self, item_id: str, notes: str) -> LibraryItem:
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace_all(
+        self, items: Sequence[LibraryItem], expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        raise NotImplementedError
+
+
+class AsyncLibraryRepository(ABC):
+    @abstractmethod
+    async def snapshot(self) -> LibrarySnapshot:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revision(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def changes_since(self, revision: int) -> LibraryChanges:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, item_id: str) -> Optional[LibraryItem]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert(
+        self, item: LibraryItem, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(
+        self, item_id: str, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def load_notes(self, item_ids: Sequence[str]) -> Dict[str, str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_notes(self, item_id: str, notes: str) -> LibraryItem:
+        raise NotImplementedError
+
+
+class ReleaseTrackerProgressRepository(ABC):
+    @abstractmethod
+    def load(self) -> ReleaseTrackerProgress:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, progress: ReleaseTrackerProgress) -> None:
+        raise NotImplementedError
+
+
+class SeriesCatalogRepository(ABC):
+    @abstractmethod
+    def get(self, series_key: str) -> Optional[SeriesCatalogEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many(self, series_keys: Sequence[str]) -> List[SeriesCatalogEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_all(self) -> List[SeriesCatalogEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, entries: Sequence[SeriesCatalogEntry]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self) -> None:
+        raise NotImplementedError
+
+
+class IsbnLookupCacheRepository(ABC):
+    @abstractmethod
+    def get_many(self, isbns: Sequence[str]) -> List[IsbnCacheEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, entries: Sequence[IsbnCacheEntry]) -> None:
+        raise NotImplementedError
+
+
+class SearchResultCacheRepository(ABC):
+    @abstractmethod
+    def get(self, query: SearchQuery) -> Optional[SearchResult]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def contains(self, query: SearchQuery) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, query: SearchQuery, result: SearchResult) -> None:
+        raise NotImplementedError
+
+
+class ImportJobRepository(ABC):
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, job: ImportJob) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_unfinished(self) -> List[ImportJob]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_source_writer(self, job_id: str) -> BinaryIO:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_source(self, job_id: str) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class LibraryBackupRepository(ABC):
+    @abstractmethod
+    def list_snapshots(self) -> List[BackupSnapshot]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def latest(self) -> Optional[BackupSnapshot]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def create(
+        self,
+        items: Sequence[LibraryItem],
+        revision: int,
+        created_at: datetime,
+        force: bool = False,
+    ) -> BackupSnapshot:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_items(self, snapshot_id: str) -> Optional[List[LibraryItem]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def verify(self, snapshot_id: str) -> Optional[BackupVerification]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_snapshots(self, snapshot_ids: Sequence[str]) -> int:
         raise NotImplementedError
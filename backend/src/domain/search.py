@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from .models import LibraryItem
 
@@ -17,6 +17,14 @@ class SearchQuery:
     until: Optional[date] = None
     page: int = 1
     limit: int = 20
+    fields: Optional[FrozenSet[str]] = None
+
+
+SEARCH_PIPELINE_FIELDS = frozenset(
+    {"id", "title", "author", "isbn", "published_date", "source"}
+)
+SEARCH_TEXT_FILTERS = frozenset({"q", "title", "author", "publisher"})
+SEARCH_DATE_FILTERS = frozenset({"from_date", "until"})
 
 
 @dataclass(frozen=True)
@@ -25,3 +33,19 @@ class SearchResult:
     total: int
     page: int
     limit: int
+
+
+def includes_field(fields: Optional[FrozenSet[str]], name: str) -> bool:
+    return fields is None or name in fields
+
+
+def active_filters(query: SearchQuery) -> FrozenSet[str]:
+    values = {
+        "q": query.q,
+        "title": query.title,
+        "author": query.author,
+        "publisher": query.publisher,
+        "from_date": query.from_date,
+        "until": query.until,
+    }
+    return frozenset(name for name, value in values.items() if value is not None)
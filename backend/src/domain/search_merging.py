@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .isbn import to_isbn13
+from .models import LibraryItem
+from .publication_date import parse_publication_date
+from .series_identity import build_series_key, extract_volume_number, normalize_text
+
+
+class SearchResultMerger:
+    def __init__(self) -> None:
+        self._items: List[LibraryItem] = []
+        self._parents: List[int] = []
+        self._owners: Dict[str, int] = {}
+        self._clusters = 0
+
+    def __len__(self) -> int:
+        return self._clusters
+
+    def add(self, items: Iterable[LibraryItem]) -> None:
+        for item in items:
+            index = len(self._items)
+            self._items.append(item)
+            self._parents.append(index)
+            self._clusters += 1
+            for key in build_identity_keys(item):
+                owner = self._owners.setdefault(key, index)
+                if owner != index:
+                    self._union(owner, index)
+
+    def results(self) -> List[LibraryItem]:
+        clusters: Dict[int, List[LibraryItem]] = {}
+        for index, item in enumerate(self._items):
+            clusters.setdefault(self._find(index), []).append(item)
+        return [merge_cluster(members) for members in clusters.values()]
+
+    def _find(self, index: int) -> int:
+        parents = self._parents
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def _union(self, left: int, right: int) -> None:
+        left_root = self._find(left)
+        right_root = self._find(right)
+        if left_root == right_root:
+            return
+        if right_root < left_root:
+            left_root, right_root = right_root, left_root
+        self._parents[right_root] = left_root
+        self._clusters -= 1
+
+
+def merge_search_results(items: Iterable[LibraryItem]) -> List[LibraryItem]:
+    merger = SearchResultMerger()
+    merger.add(items)
+    return merger.results()
+
+
+def build_identity_keys(item: LibraryItem) -> List[str]:
+    keys: List[str] = []
+    isbn = to_isbn13(item.isbn)
+    if isbn is not None:
+        keys.append(f"isbn:{isbn}")
+    volume = extract_volume_number(item.title)
+    if volume is not None:
+        keys.append(f"volume:{build_series_key(item.title, item.author)}#{volume}")
+    else:
+        title = normalize_text(item.title)
+        author = normalize_text(item.author)
+        keys.append(f"title:{title}|author:{author}")
+    source_url = (item.source_url or "").strip().rstrip("/")
+    if source_url:
+        keys.append(f"url:{source_url}")
+    return keys
+
+
+def merge_cluster(members: Sequence[LibraryItem]) -> LibraryItem:
+    base = members[0]
+    if len(members) == 1:
+        return base
+
+    genre: List[str] = []
+    for member in members:
+        for value in member.genre:
+            if value not in genre:
+                genre.append(value)
+
+    return replace(
+        base,
+        author=_first_text(member.author for member in members) or "",
+        publisher=_first_text(member.publisher for member in members),
+        published_date=_most_precise_date(members),
+        latest_volume=max(member.latest_volume for member in members),
+        next_release_date=_first_text(member.next_release_date for member in members),
+        cover_url=_first_text(member.cover_url for member in members) or "",
+        genre=genre,
+        isbn=_merged_isbn(members),
+        source_url=_first_text(member.source_url for member in members),
+    )
+
+
+def _first_text(values: Iterable[Optional[str]]) -> Optional[str]:
+    for value in values:
+        if value:
+            return value
+    return None
+
+
+def _most_precise_date(members: Sequence[LibraryItem]) -> Optional[str]:
+    best: Optional[str] = None
+    best_precision = -1
+    for member in members:
+        parts = parse_publication_date(member.published_date)
+        if parts is None:
+            continue
+        precision = sum(1 for part in parts if part)
+        if precision > best_precision:
+            best = member.published_date
+            best_precision = precision
+    return best or _first_text(member.published_date for member in members)
+
+
+def _merged_isbn(members: Sequence[LibraryItem]) -> Optional[str]:
+    for member in members:
+        isbn = to_isbn13(member.isbn)
+        if isbn is not None:
+            return isbn
+    return _first_text(member.isbn for member in members)
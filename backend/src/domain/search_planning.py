@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field, replace
+from typing import FrozenSet, List, Optional, Sequence
+
+from .isbn import to_isbn13
+from .search import (
+    SEARCH_DATE_FILTERS,
+    SEARCH_TEXT_FILTERS,
+    SearchQuery,
+    active_filters,
+)
+
+SEARCH_KIND_NONE = "none"
+SEARCH_KIND_ISBN = "isbn"
+SEARCH_KIND_TITLE = "title"
+SEARCH_KIND_AUTHOR = "author"
+SEARCH_KIND_DATE_RANGE = "date_range"
+SEARCH_KIND_FREE_TEXT = "free_text"
+
+CALL_MODE_SEARCH = "search"
+CALL_MODE_LOOKUP = "lookup"
+
+_ISBN_QUERY_RE = re.compile(r"(?:isbn[:\s]*)?\d[\d\-\s]{8,16}[\dxX]", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class ProviderCapabilities:
+    name: str
+    filters: FrozenSet[str]
+    isbn_lookup: bool = False
+
+
+@dataclass(frozen=True)
+class PlannedCall:
+    provider: str
+    mode: str
+    query: SearchQuery
+    local_filters: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class SkippedProvider:
+    provider: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class SearchPlan:
+    kind: str
+    calls: List[PlannedCall]
+    skipped: List[SkippedProvider] = field(default_factory=list)
+    isbn: Optional[str] = None
+    stop_after: int = 0
+
+
+def parse_isbn_query(value: Optional[str]) -> Optional[str]:
+    text = (value or "").strip()
+    if not _ISBN_QUERY_RE.fullmatch(text):
+        return None
+    return to_isbn13(text)
+
+
+def classify_search(query: SearchQuery) -> tuple[str, Optional[str]]:
+    filters = active_filters(query)
+    if not filters:
+        return SEARCH_KIND_NONE, None
+    if filters in (frozenset({"q"}), frozenset({"title"})):
+        isbn = parse_isbn_query(query.q or query.title)
+        if isbn is not None:
+            return SEARCH_KIND_ISBN, isbn
+    if "title" in filters:
+        return SEARCH_KIND_TITLE, None
+    if "q" in filters:
+        return SEARCH_KIND_FREE_TEXT, None
+    if "author" in filters:
+        return SEARCH_KIND_AUTHOR, None
+    if filters & SEARCH_DATE_FILTERS:
+        return SEARCH_KIND_DATE_RANGE, None
+    return SEARCH_KIND_FREE_TEXT, None
+
+
+def plan_search(
+    query: SearchQuery,
+    providers: Sequence[ProviderCapabilities],
+    early_stop: bool = True,
+) -> SearchPlan:
+    kind, isbn = classify_search(query)
+    if kind == SEARCH_KIND_NONE:
+        return SearchPlan(kind=kind, calls=[])
+
+    fetch_limit = max(query.page, 1) * max(query.limit, 1)
+    if early_stop:
+        fetch_limit += 1
+    provider_query = replace(query, page=1, limit=fetch_limit)
+    skipped: List[SkippedProvider] = []
+
+    if isbn is not None:
+        lookups = [
+            PlannedCall(
+                provider=provider.name,
+                mode=CALL_MODE_LOOKUP,
+                query=replace(provider_query, q=isbn, title=None),
+            )
+            for provider in providers
+            if provider.isbn_lookup
+        ]
+        if lookups:
+            skipped = [
+                SkippedProvider(provider.name, "ISBN 検索に対応していません。")
+                for provider in providers
+                if not provider.isbn_lookup
+            ]
+            return SearchPlan(
+                kind=kind,
+                calls=lookups,
+                skipped=skipped,
+                isbn=isbn,
+                stop_after=1 if early_stop else 0,
+            )
+
+    filters = active_filters(query)
+    text_filters = filters & SEARCH_TEXT_FILTERS
+    date_filters = filters & SEARCH_DATE_FILTERS
+    native: List[PlannedCall] = []
+    filtered_locally: List[PlannedCall] = []
+    for provider in providers:
+        unsupported = text_filters - provider.filters
+        if unsupported:
+            skipped.append(
+                SkippedProvider(
+                    provider.name,
+                    f"{', '.join(sorted(unsupported))} を指定できません。",
+                )
+            )
+            continue
+        local_filters = date_filters - provider.filters
+        if local_filters and not text_filters:
+            skipped.append(
+                SkippedProvider(provider.name, "日付範囲のみの検索に対応していません。")
+            )
+            continue
+        call = PlannedCall(
+            provider=provider.name,
+            mode=CALL_MODE_SEARCH,
+            query=replace(
+                provider_query,
+                from_date=None if "from_date" in local_filters else query.from_date,
+                until=None if "until" in local_filters else query.until,
+            ),
+            local_filters=local_filters,
+        )
+        if local_filters:
+            filtered_locally.append(call)
+        else:
+            native.append(call)
+
+    return SearchPlan(
+        kind=kind,
+        calls=native + filtered_locally,
+        skipped=skipped,
+        stop_after=fetch_limit if early_stop else 0,
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+
+@dataclass
+class SeriesCatalogEntry:
+    series_key: str
+    title: str
+    author: str
+    refreshed_at: datetime
+    volumes: Dict[int, Optional[str]] = field(default_factory=dict)
+
+    def is_stale(self, now: datetime, ttl: timedelta) -> bool:
+        return self.refreshed_at <= now - ttl
+
+    def record_volume(self, volume: int, isbn: Optional[str]) -> None:
+        if isbn or volume not in self.volumes:
+            self.volumes[volume] = isbn or self.volumes.get(volume)
+
+
+def find_missing_volumes(
+    owned_volumes: Iterable[int], known_volumes: Iterable[int], latest_volume: int
+) -> List[int]:
+    known = set(known_volumes)
+    upper = max(max(known, default=0), latest_volume, 0)
+    return sorted(set(range(1, upper + 1)) - set(owned_volumes))
+
+
+def compress_volume_ranges(volumes: Iterable[int]) -> List[tuple[int, int]]:
+    ranges: List[tuple[int, int]] = []
+    for volume in sorted(set(volumes)):
+        if ranges and ranges[-1][1] + 1 == volume:
+            ranges[-1] = (ranges[-1][0], volume)
+            continue
+        ranges.append((volume, volume))
+    return ranges
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import re
 import unicodedata
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+SERIES_RULES_VERSION = 1
 
 _KANJI_DIGITS = {
     "〇": 0,
@@ -69,6 +73,41 @@ _REMOVE_STANDALONE_UPPER_LOWER_RE = re.compile(
 _REMOVE_TRAILING_ARABIC_RE = re.compile(r"(?:(?:\s+)|(?:[-_/#]))\d{1,4}$")
 
 
+@dataclass(frozen=True)
+class SeriesIdentity:
+    series_key: str
+    volume: Optional[int]
+
+
+class SeriesIdentityResolver:
+    def __init__(self) -> None:
+        self._known: Dict[Tuple[str, str], SeriesIdentity] = {}
+        self.derived = 0
+
+    def remember(self, title: str, author: str, identity: SeriesIdentity) -> None:
+        self._known[(title, author)] = identity
+
+    def resolve(self, title: str, author: str) -> SeriesIdentity:
+        identity = self._known.get((title, author))
+        if identity is None:
+            identity = derive_series_identity(title, author)
+            self._known[(title, author)] = identity
+            self.derived += 1
+        return identity
+
+
+def derive_series_identity(title: str, author: str) -> SeriesIdentity:
+    return SeriesIdentity(
+        series_key=build_series_key(title, author),
+        volume=extract_volume_number(title),
+    )
+
+
+def series_source_fingerprint(title: str, author: str) -> str:
+    source = f"{title}\0{author}".encode()
+    return hashlib.blake2b(source, digest_size=8).hexdigest()
+
+
 def normalize_text(value: str) -> str:
     normalized = unicodedata.normalize("NFKC", value or "")
     normalized = re.sub(r"\s+", " ", normalized).strip().lower()
@@ -140,11 +179,20 @@ def extract_volume_number(title: str) -> Optional[int]:
 
 
 def build_series_key(title: str, author: str) -> str:
+    base_title = normalize_series_title(title)
+    normalized_author = normalize_author_key(author)
+    return f"title:{base_title}|author:{normalized_author}"
+
+
+def normalize_series_title(title: str) -> str:
     base_title = normalize_text(_strip_volume_expression(title))
     if not base_title:
         base_title = normalize_text(title)
-    normalized_author = normalize_author_key(author)
-    return f"title:{base_title}|author:{normalized_author}"
+    return base_title
+
+
+def build_series_title(title: str) -> str:
+    return _strip_volume_expression(title) or (title or "").strip()
 
 
 def normalize_author_key(author: str) -> str:
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import struct
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .models import LibraryItem
+from .series_identity import (
+    build_series_key,
+    extract_volume_number,
+    normalize_series_title,
+    normalize_text,
+)
+
+NGRAM_SIZE = 2
+NUM_PERMUTATIONS = 64
+NUM_BANDS = 16
+MAX_BUCKET_SIZE = 64
+
+REPORT_TITLE_THRESHOLD = 0.5
+REPORT_AUTHOR_THRESHOLD = 0.3
+
+_EDITION_MARKER_RE = re.compile(
+    r"(?:新装版|新装改訂版|完全版|愛蔵版|文庫版|ワイド版|復刻版|特装版|限定版|通常版"
+    r"|豪華版|デラックス版|決定版|改訂版|新版|カラー版|電子版|kanzenban"
+    r"|deluxe\s+edition|complete\s+edition|collector'?s\s+edition)",
+    re.IGNORECASE,
+)
+_BRACKETED_RE = re.compile(r"[（(【\[〔][^）)】\]〕]*[）)】\]〕]")
+_LABEL_BRACKET_RE = re.compile(r"【[^】]*】|〔[^〕]*〕")
+_EMPTY_BRACKETS_RE = re.compile(r"[(\[]\s*[)\]]")
+_SUBTITLE_SEPARATOR_RE = re.compile(r"\s*[～〜~]\s*|\s[-‐―:]\s")
+_NON_WORD_RE = re.compile(r"[\s・･.,、。!！?？'\"“”‘’「」『』]+")
+_LONG_VOWEL_RULES = (("ou", "o"), ("oo", "o"), ("uu", "u"), ("aa", "a"), ("ii", "i"))
+
+
+@dataclass(frozen=True)
+class SeriesMatch:
+    left_id: str
+    right_id: str
+    title_similarity: float
+    author_similarity: float
+
+    @property
+    def score(self) -> float:
+        return (self.title_similarity + self.author_similarity) / 2
+
+
+@dataclass(frozen=True)
+class _IndexedSeries:
+    item_id: str
+    title_shingles: frozenset[str]
+    author_shingles: frozenset[str]
+
+
+class SeriesCandidateIndex:
+    def __init__(
+        self,
+        num_permutations: int = NUM_PERMUTATIONS,
+        num_bands: int = NUM_BANDS,
+        max_bucket_size: int = MAX_BUCKET_SIZE,
+    ) -> None:
+        if num_permutations % num_bands != 0:
+            raise ValueError("num_permutations must be divisible by num_bands")
+        self._rows = num_permutations // num_bands
+        self._num_bands = num_bands
+        self._max_bucket_size = max_bucket_size
+        self._hash_format = struct.Struct(f"<{num_permutations}I")
+        self._entries: Dict[str, _IndexedSeries] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, item_id: str, title: str, author: str) -> None:
+        if item_id in self._entries:
+            return
+        entry = _IndexedSeries(
+            item_id=item_id,
+            title_shingles=build_title_shingles(title),
+            author_shingles=build_author_shingles(author),
+        )
+        self._entries[item_id] = entry
+        for bucket in self._bucket_keys(entry):
+            self._buckets.setdefault(bucket, []).append(item_id)
+
+    def add_items(self, items: Iterable[LibraryItem]) -> None:
+        for item in items:
+            self.add(item.id, item.title, item.author)
+
+    def candidate_pairs(self) -> Set[Tuple[str, str]]:
+        pairs: Set[Tuple[str, str]] = set()
+        for members in self._buckets.values():
+            if len(members) < 2 or len(members) > self._max_bucket_size:
+                continue
+            for left_index, left in enumerate(members):
+                for right in members[left_index + 1 :]:
+                    pairs.add((left, right) if left < right else (right, left))
+        return pairs
+
+    def find_matches(
+        self,
+        title_threshold: float = REPORT_TITLE_THRESHOLD,
+        author_threshold: float = REPORT_AUTHOR_THRESHOLD,
+    ) -> List[SeriesMatch]:
+        matches: List[SeriesMatch] = []
+        for left_id, right_id in self.candidate_pairs():
+            left = self._entries[left_id]
+            right = self._entries[right_id]
+            match = SeriesMatch(
+                left_id=left_id,
+                right_id=right_id,
+                title_similarity=jaccard(left.title_shingles, right.title_shingles),
+                author_similarity=author_similarity(
+                    left.author_shingles, right.author_shingles
+                ),
+            )
+            if _passes(match, title_threshold, author_threshold):
+                matches.append(match)
+        matches.sort(key=lambda match: (-match.score, match.left_id, match.right_id))
+        return matches
+
+    def _bucket_keys(self, entry: _IndexedSeries) -> List[Tuple[int, Tuple[int, ...]]]:
+        shingles = [f"t:{value}" for value in entry.title_shingles]
+        shingles.extend(f"a:{value}" for value in entry.author_shingles)
+        if not shingles:
+            return []
+        signature = self._signature(shingles)
+        rows = self._rows
+        return [
+            (band, tuple(signature[band * rows : (band + 1) * rows]))
+            for band in range(self._num_bands)
+        ]
+
+    def _signature(self, shingles: Sequence[str]) -> List[int]:
+        hash_format = self._hash_format
+        rows = [
+            hash_format.unpack(
+                hashlib.shake_128(value.encode("utf-8")).digest(hash_format.size)
+            )
+            for value in shingles
+        ]
+        return list(map(min, zip(*rows, strict=True)))
+
+
+def build_title_shingles(title: str) -> frozenset[str]:
+    return build_shingles(normalize_match_title(title))
+
+
+def build_author_shingles(author: str) -> frozenset[str]:
+    return build_shingles(normalize_match_author(author))
+
+
+def build_shingles(value: str, size: int = NGRAM_SIZE) -> frozenset[str]:
+    if not value:
+        return frozenset()
+    if len(value) <= size:
+        return frozenset([value])
+    return frozenset(
+        value[index : index + size] for index in range(len(value) - size + 1)
+    )
+
+
+def normalize_match_title(title: str) -> str:
+    normalized = unicodedata.normalize("NFKC", title or "")
+    normalized = _BRACKETED_RE.sub(" ", normalized)
+    normalized = _EDITION_MARKER_RE.sub(" ", normalized)
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    main_title = _SUBTITLE_SEPARATOR_RE.split(normalized, maxsplit=1)[0]
+    if main_title.strip():
+        normalized = main_title
+    normalized = normalize_series_title(normalized)
+    return _NON_WORD_RE.sub("", normalized)
+
+
+def build_edition_key(title: str, author: str) -> str:
+    normalized = unicodedata.normalize("NFKC", title or "")
+    normalized = _LABEL_BRACKET_RE.sub(" ", normalized)
+    normalized = _EDITION_MARKER_RE.sub(" ", normalized)
+    normalized = _EMPTY_BRACKETS_RE.sub(" ", normalized)
+    return build_series_key(normalized, author)
+
+
+def extract_listing_volume(title: str) -> Optional[int]:
+    volume = extract_volume_number(title)
+    if volume is not None:
+        return volume
+    return extract_volume_number(strip_listing_labels(title))
+
+
+def build_listing_series_key(title: str, author: str) -> str:
+    return build_series_key(strip_listing_labels(title), author)
+
+
+def strip_listing_labels(title: str) -> str:
+    normalized = unicodedata.normalize("NFKC", title or "")
+    stripped = re.sub(r"\s+", " ", _BRACKETED_RE.sub(" ", normalized)).strip()
+    return stripped or normalized
+
+
+def normalize_match_author(author: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", normalize_text(author))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    stripped = unicodedata.normalize("NFKC", stripped)
+    tokens = [token for token in _NON_WORD_RE.split(stripped) if token]
+    if all(token.isascii() for token in tokens):
+        tokens.sort()
+    normalized = "".join(tokens)
+    for source, target in _LONG_VOWEL_RULES:
+        normalized = normalized.replace(source, target)
+    return normalized
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    union = len(left | right)
+    if union == 0:
+        return 0.0
+    return len(left & right) / union
+
+
+def author_similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 1.0 if not left and not right else 0.0
+    return jaccard(left, right)
+
+
+def find_similar_series(
+    items: Sequence[LibraryItem],
+    title_threshold: float = REPORT_TITLE_THRESHOLD,
+    author_threshold: float = REPORT_AUTHOR_THRESHOLD,
+) -> List[SeriesMatch]:
+    index = SeriesCandidateIndex()
+    index.add_items(items)
+    return index.find_matches(title_threshold, author_threshold)
+
+
+def _passes(
+    match: SeriesMatch, title_threshold: float, author_threshold: float
+) -> bool:
+    return (
+        match.title_similarity >= title_threshold
+        and match.author_similarity >= author_threshold
+    )
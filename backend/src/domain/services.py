@@ -1,11 +1,65 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, FrozenSet, Optional, Sequence
 
-from .search import SearchQuery, SearchResult
+from .covers import CoverImage
+from .library_stats import LibraryStats
+from .models import LibraryItem
+from .search import SEARCH_TEXT_FILTERS, SearchQuery, SearchResult
+from .search_planning import SearchPlan
 
 
 class BookSearchService(ABC):
+    name = ""
+    search_filters: FrozenSet[str] = SEARCH_TEXT_FILTERS
+
     @abstractmethod
     def search(self, query: SearchQuery) -> SearchResult:
         raise NotImplementedError
+
+
+class SearchPlanner(ABC):
+    @abstractmethod
+    def plan(self, query: SearchQuery) -> SearchPlan:
+        raise NotImplementedError
+
+
+class IsbnLookupService(ABC):
+    name = ""
+    max_batch_size = 1
+
+    @abstractmethod
+    def lookup_isbns(self, isbns: Sequence[str]) -> Dict[str, LibraryItem]:
+        raise NotImplementedError
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    def try_acquire(self, key: str, timeout_seconds: float = 0.0) -> bool:
+        raise NotImplementedError
+
+
+class CoverImageStore(ABC):
+    @abstractmethod
+    def get(self, url: str, size: str) -> Optional[CoverImage]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def prefetch(self, url: str) -> None:
+        raise NotImplementedError
+
+
+class LibraryStatsIndex(ABC):
+    @abstractmethod
+    def reset(self, items: Sequence[LibraryItem]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, items: Sequence[LibraryItem], deleted: Sequence[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def aggregate(self, today: date, limit: int) -> LibraryStats:
+        raise NotImplementedError
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+SUGGESTION_KIND_TITLE = "title"
+SUGGESTION_KIND_AUTHOR = "author"
+LIBRARY_OWNER_PREFIX = "library:"
+CATALOG_OWNER_PREFIX = "catalog:"
+MAX_SCANNED_KEYS = 256
+
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+_TOKEN_SEPARATOR_RE = re.compile(r"[\s・/／:：\-－~～]+")
+
+TermId = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    text: str
+    kind: str
+    in_library: bool
+
+
+@dataclass
+class SuggestionTerm:
+    text: str
+    kind: str
+    owners: Set[str] = field(default_factory=set)
+    library_owners: int = 0
+
+
+def normalize_suggestion_key(value: str) -> str:
+    normalized = unicodedata.normalize("NFKC", value or "").lower()
+    normalized = normalized.translate(_KATAKANA_TO_HIRAGANA)
+    return re.sub(r"\s+", " ", normalized).strip()
+
+
+def build_search_keys(normalized: str) -> List[str]:
+    keys = [normalized]
+    for match in _TOKEN_SEPARATOR_RE.finditer(normalized):
+        suffix = normalized[match.end() :]
+        if suffix and suffix not in keys:
+            keys.append(suffix)
+    return keys
+
+
+class PrefixIndex:
+    def __init__(self) -> None:
+        self._keys: List[Tuple[str, TermId]] = []
+        self._terms: Dict[TermId, SuggestionTerm] = {}
+        self._owned: Dict[str, Set[TermId]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def owners(self, prefix: str) -> List[str]:
+        with self._lock:
+            return [owner for owner in self._owned if owner.startswith(prefix)]
+
+    def replace_owner(self, owner: str, terms: Iterable[Tuple[str, str]]) -> None:
+        wanted: Dict[TermId, str] = {}
+        for kind, text in terms:
+            cleaned = (text or "").strip()
+            normalized = normalize_suggestion_key(cleaned)
+            if normalized:
+                wanted.setdefault((kind, normalized), cleaned)
+
+        with self._lock:
+            previous = self._owned.get(owner, set())
+            for term_id in previous - set(wanted):
+                self._release(owner, term_id)
+            for term_id, text in wanted.items():
+                if term_id not in previous:
+                    self._acquire(owner, term_id, text)
+            if wanted:
+                self._owned[owner] = set(wanted)
+            else:
+                self._owned.pop(owner, None)
+
+    def remove_owner(self, owner: str) -> None:
+        self.replace_owner(owner, ())
+
+    def search(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        normalized = normalize_suggestion_key(prefix)
+        if not normalized or limit <= 0:
+            return []
+        seen: Set[TermId] = set()
+        candidates: List[SuggestionTerm] = []
+        with self._lock:
+            position = bisect.bisect_left(self._keys, (normalized,))
+            for key, term_id in self._keys[position : position + MAX_SCANNED_KEYS]:
+                if not key.startswith(normalized):
+                    break
+                if term_id in seen:
+                    continue
+                seen.add(term_id)
+                candidates.append(self._terms[term_id])
+        candidates.sort(
+            key=lambda term: (
+                term.library_owners == 0,
+                -len(term.owners),
+                len(term.text),
+                term.text,
+            )
+        )
+        return [
+            Suggestion(
+                text=term.text, kind=term.kind, in_library=term.library_owners > 0
+            )
+            for term in candidates[:limit]
+        ]
+
+    def _acquire(self, owner: str, term_id: TermId, text: str) -> None:
+        term = self._terms.get(term_id)
+        if term is None:
+            term = SuggestionTerm(text=text, kind=term_id[0])
+            self._terms[term_id] = term
+            for key in build_search_keys(term_id[1]):
+                bisect.insort(self._keys, (key, term_id))
+        term.owners.add(owner)
+        if owner.startswith(LIBRARY_OWNER_PREFIX):
+            term.library_owners += 1
+            term.text = text
+
+    def _release(self, owner: str, term_id: TermId) -> None:
+        term = self._terms.get(term_id)
+        if term is None or owner not in term.owners:
+            return
+        term.owners.discard(owner)
+        if owner.startswith(LIBRARY_OWNER_PREFIX):
+            term.library_owners -= 1
+        if term.owners:
+            return
+        del self._terms[term_id]
+        for key in build_search_keys(term_id[1]):
+            position = bisect.bisect_left(self._keys, (key, term_id))
+            if position < len(self._keys) and self._keys[position] == (key, term_id):
+                del self._keys[position]
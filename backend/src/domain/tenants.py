@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+DEFAULT_TENANT_ID = "default"
+
+_TENANT_ID_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,63}")
+
+
+def normalize_tenant_id(value: Optional[str]) -> str:
+    tenant_id = (value or "").strip()
+    if not tenant_id:
+        return DEFAULT_TENANT_ID
+    if not _TENANT_ID_RE.fullmatch(tenant_id):
+        raise ValueError(tenant_id)
+    return tenant_id.lower()
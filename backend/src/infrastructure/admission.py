@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Mapping, Optional
+
+from infrastructure.metrics import MetricsRegistry
+
+SHED_REASON_QUEUE_FULL = "queue_full"
+SHED_REASON_TIMEOUT = "timeout"
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimit:
+    max_active: int
+    max_queued: int = 0
+
+
+@dataclass
+class AdmissionState:
+    limit: ConcurrencyLimit
+    active: int = 0
+    queued: int = 0
+
+
+class ConcurrencyLimiter:
+    def __init__(
+        self,
+        limits: Mapping[str, ConcurrencyLimit],
+        metrics: Optional[MetricsRegistry] = None,
+        metric_prefix: str = "admission",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._states = {
+            key: AdmissionState(limit)
+            for key, limit in limits.items()
+            if limit.max_active > 0
+        }
+        self._lock = threading.Lock()
+        self._conditions = {
+            key: threading.Condition(self._lock) for key in self._states
+        }
+        self._metrics = metrics
+        self._metric_prefix = metric_prefix
+        self._clock = clock
+        register_admission_gauges(self._states, metrics, metric_prefix)
+
+    def acquire(self, key: str, timeout_seconds: float = 0.0) -> bool:
+        state = self._states.get(key)
+        if state is None:
+            return True
+        condition = self._conditions[key]
+        with condition:
+            if state.active < state.limit.max_active and state.queued == 0:
+                state.active += 1
+                return self._admit(key)
+            if state.queued >= state.limit.max_queued:
+                return self._shed(key, SHED_REASON_QUEUE_FULL)
+            state.queued += 1
+            deadline = self._clock() + max(timeout_seconds, 0.0)
+            try:
+                while state.active >= state.limit.max_active:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return self._shed(key, SHED_REASON_TIMEOUT)
+                    condition.wait(remaining)
+            finally:
+                state.queued -= 1
+            state.active += 1
+            return self._admit(key)
+
+    def release(self, key: str) -> None:
+        state = self._states.get(key)
+        if state is None:
+            return
+        condition = self._conditions[key]
+        with condition:
+            state.active = max(state.active - 1, 0)
+            condition.notify()
+
+    def _admit(self, key: str) -> bool:
+        record_admission(self._metrics, self._metric_prefix, key, None)
+        return True
+
+    def _shed(self, key: str, reason: str) -> bool:
+        record_admission(self._metrics, self._metric_prefix, key, reason)
+        return False
+
+
+class AsyncConcurrencyLimiter:
+    def __init__(
+        self,
+        limits: Mapping[str, ConcurrencyLimit],
+        metrics: Optional[MetricsRegistry] = None,
+        metric_prefix: str = "admission",
+    ) -> None:
+        self._states = {
+            key: AdmissionState(limit)
+            for key, limit in limits.items()
+            if limit.max_active > 0
+        }
+        self._waiters: Dict[str, Deque[asyncio.Future[None]]] = {
+            key: deque() for key in self._states
+        }
+        self._metrics = metrics
+        self._metric_prefix = metric_prefix
+        register_admission_gauges(self._states, metrics, metric_prefix)
+
+    async def acquire(self, key: str, timeout_seconds: float = 0.0) -> bool:
+        state = self._states.get(key)
+        if state is None:
+            return True
+        waiters = self._waiters[key]
+        if state.active < state.limit.max_active and not waiters:
+            state.active += 1
+            return self._record(key, None)
+        if state.queued >= state.limit.max_queued:
+            return self._record(key, SHED_REASON_QUEUE_FULL)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        state.queued += 1
+        try:
+            await asyncio.wait_for(waiter, max(timeout_seconds, 0.0))
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                return self._record(key, None)
+            return self._record(key, SHED_REASON_TIMEOUT)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(key)
+            raise
+        finally:
+            state.queued -= 1
+            if waiter in waiters:
+                waiters.remove(waiter)
+        return self._record(key, None)
+
+    def release(self, key: str) -> None:
+        state = self._states.get(key)
+        if state is None:
+            return
+        waiters = self._waiters[key]
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        state.active = max(state.active - 1, 0)
+
+    def _record(self, key: str, reason: Optional[str]) -> bool:
+        record_admission(self._metrics, self._metric_prefix, key, reason)
+        return reason is None
+
+
+def record_admission(
+    metrics: Optional[MetricsRegistry],
+    metric_prefix: str,
+    key: str,
+    shed_reason: Optional[str],
+) -> None:
+    if metrics is None:
+        return
+    if shed_reason is None:
+        metrics.increment(f"{metric_prefix}_admitted_total", key=key)
+    else:
+        metrics.increment(f"{metric_prefix}_shed_total", key=key, reason=shed_reason)
+
+
+def register_admission_gauges(
+    states: Mapping[str, AdmissionState],
+    metrics: Optional[MetricsRegistry],
+    metric_prefix: str,
+) -> None:
+    if metrics is None:
+        return
+    for key, state in states.items():
+        metrics.register_gauge(
+            f"{metric_prefix}_active", lambda state=state: state.active, key=key
+        )
+        metrics.register_gauge(
+            f"{metric_prefix}_queue_depth", lambda state=state: state.queued, key=key
+        )
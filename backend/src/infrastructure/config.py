@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from functools import lru_cache
-import os
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -20,6 +20,61 @@ class AppSettings:
     rakuten_books_endpoint: str
     google_books_api_key: Optional[str]
     google_books_endpoint: str
+    search_planner_early_stop: bool
+    search_cache_ttl_seconds: int
+    search_cache_max_entries: int
+    search_prefetch_enabled: bool
+    search_prefetch_workers: int
+    search_prefetch_requests_per_minute: int
+    search_max_concurrency: int
+    search_max_queued: int
+    search_queue_timeout_seconds: float
+    search_retry_after_seconds: int
+    provider_max_concurrency: int
+    provider_max_queued: int
+    provider_queue_timeout_seconds: float
+    suggest_catalog_refresh_seconds: int
+    rate_limit_dir: Path
+    rate_limit_shared: bool
+    rate_limit_wait_seconds: float
+    rakuten_requests_per_second: float
+    google_books_requests_per_second: float
+    ndl_requests_per_second: float
+    release_tracker_enabled: bool
+    release_tracker_progress_file: Path
+    release_tracker_interval_seconds: int
+    release_tracker_batch_size: int
+    release_tracker_refresh_hours: int
+    release_tracker_requests_per_minute: int
+    series_catalog_file: Path
+    series_catalog_ttl_hours: int
+    series_catalog_flush_seconds: float
+    cover_cache_dir: Path
+    cover_cache_max_bytes: int
+    isbn_cache_file: Path
+    isbn_cache_found_ttl_hours: int
+    isbn_cache_miss_ttl_hours: int
+    isbn_lookup_max_workers: int
+    import_dir: Path
+    import_max_bytes: int
+    import_lookup_workers: int
+    import_lookup_batch_size: int
+    import_write_batch_size: int
+    import_title_search_budget: int
+    library_tombstone_retention_days: int
+    library_compaction_interval_seconds: int
+    library_reader_workers: int
+    library_writer_workers: int
+    library_max_open_shards: int
+    library_shards_dir: Path
+    library_change_channel: str
+    library_change_poll_seconds: float
+    backup_enabled: bool
+    backup_dir: Path
+    backup_interval_seconds: int
+    backup_keep_last: int
+    backup_keep_daily: int
+    backup_keep_weekly: int
 
 
 @lru_cache
@@ -42,4 +97,104 @@ def get_settings() -> AppSettings:
             "GOOGLE_BOOKS_ENDPOINT",
             "https://www.googleapis.com/books/v1/volumes",
         ),
+        search_planner_early_stop=_env_flag("SEARCH_PLANNER_EARLY_STOP", True),
+        search_cache_ttl_seconds=_env_int("SEARCH_CACHE_TTL_SECONDS", 300),
+        search_cache_max_entries=_env_int("SEARCH_CACHE_MAX_ENTRIES", 256),
+        search_prefetch_enabled=_env_flag("SEARCH_PREFETCH_ENABLED", False),
+        search_prefetch_workers=_env_int("SEARCH_PREFETCH_WORKERS", 1),
+        search_prefetch_requests_per_minute=_env_int(
+            "SEARCH_PREFETCH_REQUESTS_PER_MINUTE", 20
+        ),
+        search_max_concurrency=_env_int("SEARCH_MAX_CONCURRENCY", 8),
+        search_max_queued=_env_int("SEARCH_MAX_QUEUED", 16),
+        search_queue_timeout_seconds=_env_float("SEARCH_QUEUE_TIMEOUT_SECONDS", 2.0),
+        search_retry_after_seconds=_env_int("SEARCH_RETRY_AFTER_SECONDS", 5),
+        provider_max_concurrency=_env_int("PROVIDER_MAX_CONCURRENCY", 4),
+        provider_max_queued=_env_int("PROVIDER_MAX_QUEUED", 8),
+        provider_queue_timeout_seconds=_env_float(
+            "PROVIDER_QUEUE_TIMEOUT_SECONDS", 1.0
+        ),
+        suggest_catalog_refresh_seconds=_env_int(
+            "SUGGEST_CATALOG_REFRESH_SECONDS", 300
+        ),
+        rate_limit_dir=root / "data" / "rate_limits",
+        rate_limit_shared=_env_flag("RATE_LIMIT_SHARED", True),
+        rate_limit_wait_seconds=_env_float("RATE_LIMIT_WAIT_SECONDS", 0.5),
+        rakuten_requests_per_second=_env_float("RAKUTEN_REQUESTS_PER_SECOND", 1.0),
+        google_books_requests_per_second=_env_float(
+            "GOOGLE_BOOKS_REQUESTS_PER_SECOND", 1.0
+        ),
+        ndl_requests_per_second=_env_float("NDL_REQUESTS_PER_SECOND", 0.0),
+        release_tracker_enabled=_env_flag("RELEASE_TRACKER_ENABLED", False),
+        release_tracker_progress_file=root / "data" / "release_tracker.json",
+        release_tracker_interval_seconds=_env_int(
+            "RELEASE_TRACKER_INTERVAL_SECONDS", 900
+        ),
+        release_tracker_batch_size=_env_int("RELEASE_TRACKER_BATCH_SIZE", 20),
+        release_tracker_refresh_hours=_env_int("RELEASE_TRACKER_REFRESH_HOURS", 24),
+        release_tracker_requests_per_minute=_env_int(
+            "RELEASE_TRACKER_REQUESTS_PER_MINUTE", 30
+        ),
+        series_catalog_file=root / "data" / "series_catalog.json",
+        series_catalog_ttl_hours=_env_int("SERIES_CATALOG_TTL_HOURS", 24 * 7),
+        series_catalog_flush_seconds=_env_float("SERIES_CATALOG_FLUSH_SECONDS", 5.0),
+        cover_cache_dir=root / "data" / "covers",
+        cover_cache_max_bytes=_env_int("COVER_CACHE_MAX_MB", 200) * 1024 * 1024,
+        isbn_cache_file=root / "data" / "isbn_cache.json",
+        isbn_cache_found_ttl_hours=_env_int("ISBN_CACHE_FOUND_TTL_HOURS", 24 * 30),
+        isbn_cache_miss_ttl_hours=_env_int("ISBN_CACHE_MISS_TTL_HOURS", 24),
+        isbn_lookup_max_workers=_env_int("ISBN_LOOKUP_MAX_WORKERS", 4),
+        import_dir=root / "data" / "imports",
+        import_max_bytes=_env_int("IMPORT_MAX_MB", 20) * 1024 * 1024,
+        import_lookup_workers=_env_int("IMPORT_LOOKUP_WORKERS", 4),
+        import_lookup_batch_size=_env_int("IMPORT_LOOKUP_BATCH_SIZE", 100),
+        import_write_batch_size=_env_int("IMPORT_WRITE_BATCH_SIZE", 200),
+        import_title_search_budget=_env_int("IMPORT_TITLE_SEARCH_BUDGET", 100),
+        library_tombstone_retention_days=_env_int(
+            "LIBRARY_TOMBSTONE_RETENTION_DAYS", 30
+        ),
+        library_compaction_interval_seconds=_env_int(
+            "LIBRARY_COMPACTION_INTERVAL_SECONDS", 6 * 60 * 60
+        ),
+        library_reader_workers=_env_int("LIBRARY_READER_WORKERS", 4),
+        library_writer_workers=_env_int("LIBRARY_WRITER_WORKERS", 2),
+        library_max_open_shards=_env_int("LIBRARY_MAX_OPEN_SHARDS", 64),
+        library_shards_dir=root / "data" / "libraries",
+        library_change_channel=os.getenv("LIBRARY_CHANGE_CHANNEL", "file")
+        .strip()
+        .lower(),
+        library_change_poll_seconds=_env_float("LIBRARY_CHANGE_POLL_SECONDS", 0.25),
+        backup_enabled=_env_flag("BACKUP_ENABLED", True),
+        backup_dir=root / "data" / "backups",
+        backup_interval_seconds=_env_int("BACKUP_INTERVAL_SECONDS", 60 * 60),
+        backup_keep_last=_env_int("BACKUP_KEEP_LAST", 24),
+        backup_keep_daily=_env_int("BACKUP_KEEP_DAILY", 14),
+        backup_keep_weekly=_env_int("BACKUP_KEEP_WEEKLY", 8),
     )
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
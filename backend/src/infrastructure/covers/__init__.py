@@ -0,0 +1 @@
+"""Cover image adapters."""
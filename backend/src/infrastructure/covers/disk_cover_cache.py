@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from domain.covers import COVER_SIZE_SMALL, CoverImage
+from domain.errors import CoverImageError
+from domain.services import CoverImageStore
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is optional
+    Image = None
+
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+THUMBNAIL_SIZE = (200, 300)
+
+
+@dataclass
+class _CachedObject:
+    size: int
+    content_type: str
+    last_access: float
+
+
+Fetcher = Callable[[str], tuple[bytes, str]]
+
+
+class DiskCoverCache(CoverImageStore):
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int,
+        timeout_seconds: int = 10,
+        fetcher: Optional[Fetcher] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._directory = directory
+        self._objects_dir = directory / "objects"
+        self._index_file = directory / "index.json"
+        self._max_bytes = max_bytes
+        self._timeout_seconds = timeout_seconds
+        self._fetcher = fetcher or self._fetch
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._urls: Dict[str, str] = {}
+        self._thumbnails: Dict[str, str] = {}
+        self._objects: Dict[str, _CachedObject] = {}
+        self._load_index()
+
+    def get(self, url: str, size: str) -> Optional[CoverImage]:
+        if not is_fetchable(url):
+            return None
+
+        with self._lock:
+            digest = self._urls.get(url)
+        image = self._read(digest) if digest else None
+        if image is None:
+            image = self._store(url)
+        if size == COVER_SIZE_SMALL:
+            return self._thumbnail(image) or image
+        return image
+
+    def prefetch(self, url: str) -> None:
+        if not is_fetchable(url):
+            return
+        with self._lock:
+            if url in self._urls:
+                return
+        image = self._store(url)
+        self._thumbnail(image)
+
+    def _store(self, url: str) -> CoverImage:
+        content, content_type = self._fetcher(url)
+        image = self._write(content, content_type)
+        with self._lock:
+            self._urls[url] = image.digest
+            self._evict()
+            self._save_index()
+        return image
+
+    def _thumbnail(self, image: CoverImage) -> Optional[CoverImage]:
+        if Image is None:
+            return None
+        with self._lock:
+            thumbnail_digest = self._thumbnails.get(image.digest)
+        if thumbnail_digest:
+            cached = self._read(thumbnail_digest)
+            if cached is not None:
+                return cached
+
+        try:
+            with Image.open(io.BytesIO(image.content)) as source:
+                source.thumbnail(THUMBNAIL_SIZE)
+                output = io.BytesIO()
+                source.convert("RGB").save(output, format="JPEG", quality=80)
+        except (OSError, ValueError):
+            return None
+
+        thumbnail = self._write(output.getvalue(), "image/jpeg")
+        with self._lock:
+            self._thumbnails[image.digest] = thumbnail.digest
+            self._evict()
+            self._save_index()
+        return thumbnail
+
+    def _read(self, digest: str) -> Optional[CoverImage]:
+        with self._lock:
+            cached = self._objects.get(digest)
+            if cached is None:
+                return None
+            cached.last_access = self._clock()
+        try:
+            content = self._object_path(digest).read_bytes()
+        except OSError:
+            with self._lock:
+                self._forget(digest)
+            return None
+        return CoverImage(
+            content=content, content_type=cached.content_type, digest=digest
+        )
+
+    def _write(self, content: bytes, content_type: str) -> CoverImage:
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(content)
+            temp_path.replace(path)
+        with self._lock:
+            self._objects[digest] = _CachedObject(
+                size=len(content), content_type=content_type, last_access=self._clock()
+            )
+        return CoverImage(content=content, content_type=content_type, digest=digest)
+
+    def _evict(self) -> None:
+        total = sum(cached.size for cached in self._objects.values())
+        if total <= self._max_bytes:
+            return
+        by_age = sorted(self._objects.items(), key=lambda entry: entry[1].last_access)
+        for digest, cached in by_age:
+            if total <= self._max_bytes:
+                break
+            self._object_path(digest).unlink(missing_ok=True)
+            total -= cached.size
+            self._forget(digest)
+
+    def _forget(self, digest: str) -> None:
+        self._objects.pop(digest, None)
+        self._urls = {
+            url: value for url, value in self._urls.items() if value != digest
+        }
+        self._thumbnails = {
+            source: thumbnail
+            for source, thumbnail in self._thumbnails.items()
+            if source != digest and thumbnail != digest
+        }
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects_dir / digest[:2] / digest
+
+    def _load_index(self) -> None:
+        if not self._index_file.exists():
+            return
+        try:
+            with self._index_file.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(data, dict):
+            return
+
+        for digest, raw in (data.get("objects") or {}).items():
+            if not isinstance(raw, dict) or not self._object_path(digest).exists():
+                continue
+            self._objects[digest] = _CachedObject(
+                size=int(raw.get("size", 0)),
+                content_type=str(raw.get("contentType", "image/jpeg")),
+                last_access=float(raw.get("lastAccess", 0.0)),
+            )
+        self._urls = {
+            str(url): str(digest)
+            for url, digest in (data.get("urls") or {}).items()
+            if digest in self._objects
+        }
+        self._thumbnails = {
+            str(source): str(thumbnail)
+            for source, thumbnail in (data.get("thumbnails") or {}).items()
+            if source in self._objects and thumbnail in self._objects
+        }
+
+    def _save_index(self) -> None:
+        data = {
+            "urls": self._urls,
+            "thumbnails": self._thumbnails,
+            "objects": {
+                digest: {
+                    "size": cached.size,
+                    "contentType": cached.content_type,
+                    "lastAccess": cached.last_access,
+                }
+                for digest, cached in self._objects.items()
+            },
+        }
+        self._directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self._index_file.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        temp_path.replace(self._index_file)
+
+    def _fetch(self, url: str) -> tuple[bytes, str]:
+        try:
+            response = requests.get(url, timeout=self._timeout_seconds, stream=True)
+        except requests.RequestException as exc:
+            raise CoverImageError("表紙画像を取得できませんでした。") from exc
+
+        with response:
+            if response.status_code != 200:
+                raise CoverImageError("表紙画像の取得に失敗しました。")
+            content_type = response.headers.get("Content-Type", "").split(";")[0]
+            if not content_type.startswith("image/"):
+                raise CoverImageError("表紙画像の形式が不正です。")
+
+            chunks: list[bytes] = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                total += len(chunk)
+                if total > MAX_IMAGE_BYTES:
+                    raise CoverImageError("表紙画像のサイズが大きすぎます。")
+                chunks.append(chunk)
+        return b"".join(chunks), content_type
+
+
+def is_fetchable(url: str) -> bool:
+    if not url:
+        return False
+    parsed = urlparse(url)
+    return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = format_metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def register_gauge(
+        self, name: str, callback: Callable[[], float], **labels: str
+    ) -> None:
+        key = format_metric_key(name, labels)
+        with self._lock:
+            self._gauges[key] = callback
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            values = dict(self._counters)
+            gauges = dict(self._gauges)
+        for key, callback in gauges.items():
+            try:
+                values[key] = float(callback())
+            except Exception:
+                logger.debug("ゲージ %s の取得に失敗しました。", key, exc_info=True)
+                continue
+        return dict(sorted(values.items()))
+
+
+def format_metric_key(name: str, labels: Dict[str, str]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from domain.backups import BackupSnapshot, BackupVerification
+from domain.models import LibraryItem
+from domain.repositories import LibraryBackupRepository
+from infrastructure.persistence.json_library_repository import (
+    library_item_from_dict,
+    library_item_to_dict,
+)
+
+MAX_CHAIN_LENGTH = 24
+COMPRESSION_LEVEL = 6
+_SNAPSHOT_ID_RE = re.compile(r"^\d{8}T\d{6}Z-r\d+(?:-\d+)?$")
+_OBJECT_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BrokenSnapshotChainError(RuntimeError):
+    """Raised when a snapshot's parent chain cannot be resolved."""
+
+
+class ContentAddressedBackupRepository(LibraryBackupRepository):
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._objects_dir = directory / "objects"
+        self._snapshots_dir = directory / "snapshots"
+        self._lock = threading.Lock()
+        self._latest_objects: Optional[tuple[str, List[str]]] = None
+
+    def list_snapshots(self) -> List[BackupSnapshot]:
+        with self._lock:
+            manifests = self._read_manifests()
+        snapshots = [
+            self._to_snapshot(snapshot_id, manifest)
+            for snapshot_id, manifest in manifests.items()
+        ]
+        snapshots.sort(key=lambda snapshot: snapshot.created_at, reverse=True)
+        return snapshots
+
+    def latest(self) -> Optional[BackupSnapshot]:
+        snapshots = self.list_snapshots()
+        return snapshots[0] if snapshots else None
+
+    def create(
+        self,
+        items: Sequence[LibraryItem],
+        revision: int,
+        created_at: datetime,
+        force: bool = False,
+    ) -> BackupSnapshot:
+        with self._lock:
+            payloads = [_encode_item(item) for item in items]
+            object_ids = [hashlib.sha256(payload).hexdigest() for payload in payloads]
+            manifests = self._read_manifests()
+            parent = self._latest_state(manifests)
+            if (
+                not force
+                and parent is not None
+                and parent[1] == object_ids
+                and manifests[parent[0]].get("revision") == revision
+            ):
+                return self._to_snapshot(parent[0], manifests[parent[0]])
+            delta = _build_delta(object_ids, parent, manifests)
+
+            stored_bytes = 0
+            new_objects = 0
+            for object_id, payload in zip(object_ids, payloads, strict=True):
+                written = self._write_object(object_id, payload)
+                if written:
+                    new_objects += 1
+                    stored_bytes += written
+
+            snapshot_id = self._new_snapshot_id(created_at, revision)
+            manifest: Dict[str, object] = {
+                "createdAt": created_at.isoformat(),
+                "revision": revision,
+                "itemCount": len(object_ids),
+                "newObjects": new_objects,
+            }
+            manifest.update(delta)
+            stored_bytes += self._write_manifest(snapshot_id, manifest)
+            manifest["storedBytes"] = stored_bytes
+            self._write_manifest(snapshot_id, manifest)
+            self._latest_objects = (snapshot_id, object_ids)
+            return self._to_snapshot(snapshot_id, manifest)
+
+    def load_items(self, snapshot_id: str) -> Optional[List[LibraryItem]]:
+        with self._lock:
+            manifests = self._read_manifests()
+            if snapshot_id not in manifests:
+                return None
+            object_ids = self._resolve(snapshot_id, manifests, {})
+            return [
+                library_item_from_dict(json.loads(self._read_object(object_id)))
+                for object_id in object_ids
+            ]
+
+    def verify(self, snapshot_id: str) -> Optional[BackupVerification]:
+        with self._lock:
+            manifests = self._read_manifests()
+            if snapshot_id not in manifests:
+                return None
+            try:
+                object_ids = self._resolve(snapshot_id, manifests, {})
+            except BrokenSnapshotChainError:
+                return BackupVerification(
+                    snapshot_id=snapshot_id, checked_objects=0, broken_chain=True
+                )
+
+            missing: List[str] = []
+            corrupt: List[str] = []
+            for object_id in object_ids:
+                path = self._object_path(object_id)
+                if not path.exists():
+                    missing.append(object_id)
+                    continue
+                try:
+                    payload = zlib.decompress(path.read_bytes())
+                except zlib.error:
+                    corrupt.append(object_id)
+                    continue
+                if hashlib.sha256(payload).hexdigest() != object_id:
+                    corrupt.append(object_id)
+            return BackupVerification(
+                snapshot_id=snapshot_id,
+                checked_objects=len(object_ids),
+                missing=missing,
+                corrupt=corrupt,
+            )
+
+    def delete_snapshots(self, snapshot_ids: Sequence[str]) -> int:
+        with self._lock:
+            manifests = self._read_manifests()
+            doomed = {
+                snapshot_id for snapshot_id in snapshot_ids if snapshot_id in manifests
+            }
+            if not doomed:
+                return 0
+
+            resolved: Dict[str, List[str]] = {}
+            for snapshot_id, manifest in manifests.items():
+                if snapshot_id in doomed or manifest.get("parent") not in doomed:
+                    continue
+                object_ids = self._resolve(snapshot_id, manifests, resolved)
+                rebased = {
+                    key: value
+                    for key, value in manifest.items()
+                    if key not in {"parent", "depth", "added", "removed"}
+                }
+                rebased.update({"parent": None, "depth": 0, "objects": object_ids})
+                manifests[snapshot_id] = rebased
+                self._write_manifest(snapshot_id, rebased)
+
+            for snapshot_id in doomed:
+                self._manifest_path(snapshot_id).unlink(missing_ok=True)
+                manifests.pop(snapshot_id, None)
+            if self._latest_objects is not None and self._latest_objects[0] in doomed:
+                self._latest_objects = None
+
+            referenced: set[str] = set()
+            for snapshot_id in manifests:
+                try:
+                    referenced.update(self._resolve(snapshot_id, manifests, resolved))
+                except BrokenSnapshotChainError:
+                    return len(doomed)
+            self._collect_garbage(referenced)
+            return len(doomed)
+
+    def _latest_state(
+        self, manifests: Dict[str, dict]
+    ) -> Optional[tuple[str, List[str]]]:
+        if not manifests:
+            return None
+        latest_id = max(manifests, key=lambda key: str(manifests[key]["createdAt"]))
+        if self._latest_objects is not None and self._latest_objects[0] == latest_id:
+            return self._latest_objects
+        try:
+            return latest_id, self._resolve(latest_id, manifests, {})
+        except BrokenSnapshotChainError:
+            return None
+
+    def _resolve(
+        self,
+        snapshot_id: str,
+        manifests: Dict[str, dict],
+        resolved: Dict[str, List[str]],
+    ) -> List[str]:
+        chain: List[str] = []
+        current: Optional[str] = snapshot_id
+        while current is not None and current not in resolved:
+            manifest = manifests.get(current)
+            if manifest is None or len(chain) > MAX_CHAIN_LENGTH:
+                raise BrokenSnapshotChainError(snapshot_id)
+            chain.append(current)
+            if "objects" in manifest:
+                resolved[current] = [str(value) for value in manifest["objects"]]
+                chain.pop()
+                break
+            current = manifest.get("parent")
+            if current is None:
+                raise BrokenSnapshotChainError(snapshot_id)
+
+        for child_id in reversed(chain):
+            manifest = manifests[child_id]
+            removed = set(manifest.get("removed") or [])
+            object_ids = [
+                object_id
+                for object_id in resolved[str(manifest["parent"])]
+                if object_id not in removed
+            ]
+            for position, object_id in manifest.get("added") or []:
+                object_ids.insert(int(position), str(object_id))
+            resolved[child_id] = object_ids
+        return resolved[snapshot_id]
+
+    def _collect_garbage(self, referenced: set[str]) -> None:
+        if not self._objects_dir.exists():
+            return
+        for path in self._objects_dir.glob("*/*.z"):
+            if path.stem not in referenced:
+                path.unlink(missing_ok=True)
+
+    def _read_manifests(self) -> Dict[str, dict]:
+        if not self._snapshots_dir.exists():
+            return {}
+        manifests: Dict[str, dict] = {}
+        for path in self._snapshots_dir.glob("*.json"):
+            if not _SNAPSHOT_ID_RE.match(path.stem):
+                continue
+            try:
+                with path.open("r", encoding="utf-8") as file:
+                    data = json.load(file)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(data, dict) and "createdAt" in data:
+                manifests[path.stem] = data
+        return manifests
+
+    def _write_manifest(self, snapshot_id: str, manifest: Dict[str, object]) -> int:
+        payload = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        self._snapshots_dir.mkdir(parents=True, exist_ok=True)
+        path = self._manifest_path(snapshot_id)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(payload)
+        temp_path.replace(path)
+        return len(payload)
+
+    def _write_object(self, object_id: str, payload: bytes) -> int:
+        path = self._object_path(object_id)
+        if path.exists():
+            return 0
+        compressed = zlib.compress(payload, COMPRESSION_LEVEL)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(compressed)
+        temp_path.replace(path)
+        return len(compressed)
+
+    def _read_object(self, object_id: str) -> bytes:
+        return zlib.decompress(self._object_path(object_id).read_bytes())
+
+    def _new_snapshot_id(self, created_at: datetime, revision: int) -> str:
+        stamp = created_at.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        snapshot_id = f"{stamp}-r{revision}"
+        suffix = 1
+        while self._manifest_path(snapshot_id).exists():
+            snapshot_id = f"{stamp}-r{revision}-{suffix}"
+            suffix += 1
+        return snapshot_id
+
+    def _manifest_path(self, snapshot_id: str) -> Path:
+        return self._snapshots_dir / f"{snapshot_id}.json"
+
+    def _object_path(self, object_id: str) -> Path:
+        if not _OBJECT_ID_RE.match(object_id):
+            raise ValueError(f"invalid object id: {object_id}")
+        return self._objects_dir / object_id[:2] / f"{object_id}.z"
+
+    @staticmethod
+    def _to_snapshot(snapshot_id: str, manifest: dict) -> BackupSnapshot:
+        return BackupSnapshot(
+            snapshot_id=snapshot_id,
+            created_at=datetime.fromisoformat(str(manifest["createdAt"])),
+            revision=int(manifest.get("revision", 0)),
+            item_count=int(manifest.get("itemCount", 0)),
+            parent_id=manifest.get("parent"),
+            new_objects=int(manifest.get("newObjects", 0)),
+            stored_bytes=int(manifest.get("storedBytes", 0)),
+        )
+
+
+def _build_delta(
+    object_ids: List[str],
+    parent: Optional[tuple[str, List[str]]],
+    manifests: Dict[str, dict],
+) -> Dict[str, object]:
+    full: Dict[str, object] = {"parent": None, "depth": 0, "objects": object_ids}
+    if parent is None:
+        return full
+    parent_id, parent_objects = parent
+    depth = int(manifests[parent_id].get("depth", 0)) + 1
+    if depth > MAX_CHAIN_LENGTH:
+        return full
+
+    current = set(object_ids)
+    previous = set(parent_objects)
+    kept = [object_id for object_id in parent_objects if object_id in current]
+    if kept != [object_id for object_id in object_ids if object_id in previous]:
+        return full
+    return {
+        "parent": parent_id,
+        "depth": depth,
+        "added": [
+            [position, object_id]
+            for position, object_id in enumerate(object_ids)
+            if object_id not in previous
+        ],
+        "removed": [
+            object_id for object_id in parent_objects if object_id not in current
+        ],
+    }
+
+
+def _encode_item(item: LibraryItem) -> bytes:
+    return json.dumps(
+        library_item_to_dict(item),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable, Dict, Optional, Sequence, TypeVar
+
+from domain.models import LibraryChanges, LibraryItem, LibraryMutation, LibrarySnapshot
+from domain.repositories import AsyncLibraryRepository, LibraryRepository
+
+T = TypeVar("T")
+
+
+class ExecutorAsyncLibraryRepository(AsyncLibraryRepository):
+    def __init__(
+        self,
+        repository: LibraryRepository,
+        readers: Executor,
+        writers: Executor,
+    ) -> None:
+        self._repository = repository
+        self._readers = readers
+        self._writers = writers
+        self._write_lock = asyncio.Lock()
+        self._pending_writes = 0
+
+    @property
+    def pending_writes(self) -> int:
+        return self._pending_writes
+
+    async def snapshot(self) -> LibrarySnapshot:
+        return await self._read(self._repository.snapshot)
+
+    async def revision(self) -> int:
+        return await self._read(self._repository.revision)
+
+    async def changes_since(self, revision: int) -> LibraryChanges:
+        return await self._read(self._repository.changes_since, revision)
+
+    async def get(self, item_id: str) -> Optional[LibraryItem]:
+        return await self._read(self._repository.get, item_id)
+
+    async def upsert(
+        self, item: LibraryItem, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        return await self._write(self._repository.upsert, item, expected_revision)
+
+    async def delete(
+        self, item_id: str, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        return await self._write(self._repository.delete, item_id, expected_revision)
+
+    async def load_notes(self, item_ids: Sequence[str]) -> Dict[str, str]:
+        return await self._read(self._repository.load_notes, list(item_ids))
+
+    async def save_notes(self, item_id: str, notes: str) -> LibraryItem:
+        return await self._write(self._repository.save_notes, item_id, notes)
+
+    async def _read(self, action: Callable[..., T], *args: object) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, partial(action, *args))
+
+    async def _write(self, action: Callable[..., T], *args: object) -> T:
+        loop = asyncio.get_running_loop()
+        self._pending_writes += 1
+        try:
+            async with self._write_lock:
+                return await loop.run_in_executor(self._writers, partial(action, *args))
+        finally:
+            self._pending_writes -= 1
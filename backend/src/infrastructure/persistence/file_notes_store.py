@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import secrets
+import threading
+from pathlib import Path
+from typing import Collection, Dict, Iterable, Mapping
+
+VERSION_FILE = "version"
+INITIAL_VERSION = "0"
+
+
+class FileNotesStore:
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._lock = threading.Lock()
+
+    def get_many(self, item_ids: Iterable[str]) -> Dict[str, str]:
+        notes: Dict[str, str] = {}
+        for item_id in item_ids:
+            try:
+                notes[item_id] = self._path(item_id).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+        return notes
+
+    def version(self) -> str:
+        try:
+            version = (self._directory / VERSION_FILE).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return INITIAL_VERSION
+        return version.strip() or INITIAL_VERSION
+
+    def save_many(
+        self, notes: Mapping[str, str], overwrite: Collection[str] = ()
+    ) -> None:
+        if not notes:
+            return
+        with self._lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            changed = False
+            for item_id, value in notes.items():
+                path = self._path(item_id)
+                if item_id not in overwrite and (not value.strip() or path.exists()):
+                    continue
+                if not value.strip():
+                    changed = path.exists() or changed
+                    path.unlink(missing_ok=True)
+                    continue
+                self._write(path, value)
+                changed = True
+            if changed:
+                self._bump_version()
+
+    def delete_many(self, item_ids: Iterable[str]) -> None:
+        with self._lock:
+            changed = False
+            for item_id in item_ids:
+                path = self._path(item_id)
+                changed = path.exists() or changed
+                path.unlink(missing_ok=True)
+            if changed:
+                self._bump_version()
+
+    def _bump_version(self) -> None:
+        self._write(self._directory / VERSION_FILE, secrets.token_hex(8))
+
+    def _write(self, path: Path, value: str) -> None:
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(value, encoding="utf-8")
+        temp_path.replace(path)
+
+    def _path(self, item_id: str) -> Path:
+        digest = hashlib.sha1(item_id.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.txt"
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from domain.repositories import SearchResultCacheRepository
+from domain.search import SearchQuery, SearchResult
+from infrastructure.metrics import MetricsRegistry
+
+
+class InMemorySearchResultCache(SearchResultCacheRepository):
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        metrics: Optional[MetricsRegistry] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(max_entries, 1)
+        self._metrics = metrics
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[SearchQuery, tuple[float, SearchResult]] = (
+            OrderedDict()
+        )
+
+    def get(self, query: SearchQuery) -> Optional[SearchResult]:
+        with self._lock:
+            result = self._lookup(query)
+        if result is None:
+            self._count("search_cache_misses_total")
+        else:
+            self._count("search_cache_hits_total")
+        return result
+
+    def contains(self, query: SearchQuery) -> bool:
+        with self._lock:
+            return self._lookup(query) is not None
+
+    def save(self, query: SearchQuery, result: SearchResult) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[query] = (self._clock() + self._ttl_seconds, result)
+            self._entries.move_to_end(query)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _lookup(self, query: SearchQuery) -> Optional[SearchResult]:
+        entry = self._entries.get(query)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= self._clock():
+            del self._entries[query]
+            return None
+        self._entries.move_to_end(query)
+        return result
+
+    def _count(self, name: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(name)
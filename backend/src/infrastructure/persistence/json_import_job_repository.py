@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional
+
+from domain.imports import ImportJob, ImportRowError
+from domain.repositories import ImportJobRepository
+from domain.tenants import DEFAULT_TENANT_ID
+
+SNIFF_BYTES = 64 * 1024
+_JOB_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+class JsonImportJobRepository(ImportJobRepository):
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        if not _JOB_ID_RE.match(job_id):
+            return None
+        path = self._job_path(job_id)
+        if not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        return self._from_dict(job_id, data)
+
+    def save(self, job: ImportJob) -> None:
+        path = self._job_path(job.job_id)
+        with self._lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as file:
+                json.dump(self._to_dict(job), file, ensure_ascii=False, indent=2)
+            temp_path.replace(path)
+
+    def list_unfinished(self) -> List[ImportJob]:
+        if not self._directory.exists():
+            return []
+        jobs: List[ImportJob] = []
+        for path in sorted(self._directory.glob("*.json")):
+            job = self.get(path.stem)
+            if job is not None and not job.finished:
+                jobs.append(job)
+        jobs.sort(key=lambda job: job.created_at)
+        return jobs
+
+    def open_source_writer(self, job_id: str) -> BinaryIO:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        return self._source_path(job_id).open("wb")
+
+    def read_source(self, job_id: str) -> Iterator[str]:
+        path = self._source_path(job_id)
+        with path.open("rb") as raw:
+            encoding = detect_encoding(raw.read(SNIFF_BYTES))
+            raw.seek(0)
+            with io.TextIOWrapper(
+                raw, encoding=encoding, errors="replace", newline=""
+            ) as text:
+                yield from text
+
+    def _job_path(self, job_id: str) -> Path:
+        return self._directory / f"{job_id}.json"
+
+    def _source_path(self, job_id: str) -> Path:
+        return self._directory / f"{job_id}.source"
+
+    @staticmethod
+    def _from_dict(job_id: str, data: dict) -> Optional[ImportJob]:
+        try:
+            created_at = datetime.fromisoformat(str(data.get("createdAt", "")))
+            updated_at = datetime.fromisoformat(str(data.get("updatedAt", "")))
+        except ValueError:
+            return None
+
+        errors = [
+            ImportRowError(
+                row=int(raw.get("row", 0)),
+                value=str(raw.get("value", "")),
+                reason=str(raw.get("reason", "")),
+            )
+            for raw in data.get("errors") or []
+            if isinstance(raw, dict)
+        ]
+        total = data.get("total")
+        return ImportJob(
+            job_id=job_id,
+            source_format=str(data.get("format", "")),
+            status=str(data.get("status", "")),
+            created_at=created_at,
+            updated_at=updated_at,
+            cursor=int(data.get("cursor", 0)),
+            total=int(total) if total is not None else None,
+            imported=int(data.get("imported", 0)),
+            not_found=int(data.get("notFound", 0)),
+            invalid=int(data.get("invalid", 0)),
+            errors=errors,
+            message=data.get("message"),
+            tenant_id=str(data.get("tenantId") or DEFAULT_TENANT_ID),
+        )
+
+    @staticmethod
+    def _to_dict(job: ImportJob) -> dict:
+        return {
+            "format": job.source_format,
+            "status": job.status,
+            "createdAt": job.created_at.isoformat(),
+            "updatedAt": job.updated_at.isoformat(),
+            "cursor": job.cursor,
+            "total": job.total,
+            "imported": job.imported,
+            "notFound": job.not_found,
+            "invalid": job.invalid,
+            "errors": [
+                {"row": error.row, "value": error.value, "reason": error.reason}
+                for error in job.errors
+            ],
+            "message": job.message,
+            "tenantId": job.tenant_id,
+        }
+
+
+def detect_encoding(head: bytes) -> str:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        if exc.start < len(head) - 3:
+            return "cp932"
+    return "utf-8"
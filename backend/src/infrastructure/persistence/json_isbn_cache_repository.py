@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from domain.isbn import IsbnCacheEntry
+from domain.repositories import IsbnLookupCacheRepository
+from infrastructure.persistence.json_library_repository import (
+    library_item_from_dict,
+    library_item_to_dict,
+)
+
+
+class JsonIsbnCacheRepository(IsbnLookupCacheRepository):
+    def __init__(self, data_file: Path) -> None:
+        self._data_file = data_file
+        self._lock = threading.Lock()
+
+    def get_many(self, isbns: Sequence[str]) -> List[IsbnCacheEntry]:
+        with self._lock:
+            data = self._load()
+        entries: List[IsbnCacheEntry] = []
+        for isbn in isbns:
+            raw = data.get(isbn)
+            if not isinstance(raw, dict):
+                continue
+            entry = self._from_dict(isbn, raw)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def save_many(self, entries: Sequence[IsbnCacheEntry]) -> None:
+        if not entries:
+            return
+        with self._lock:
+            data = self._load()
+            for entry in entries:
+                data[entry.isbn] = self._to_dict(entry)
+            self._save(data)
+
+    def _load(self) -> Dict[str, object]:
+        if not self._data_file.exists():
+            return {}
+        try:
+            with self._data_file.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _save(self, data: Dict[str, object]) -> None:
+        self._data_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._data_file.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+        temp_path.replace(self._data_file)
+
+    @staticmethod
+    def _from_dict(isbn: str, data: dict) -> Optional[IsbnCacheEntry]:
+        try:
+            fetched_at = datetime.fromisoformat(str(data.get("fetchedAt", "")))
+        except ValueError:
+            return None
+
+        raw_item = data.get("item")
+        item = library_item_from_dict(raw_item) if isinstance(raw_item, dict) else None
+        return IsbnCacheEntry(isbn=isbn, item=item, fetched_at=fetched_at)
+
+    @staticmethod
+    def _to_dict(entry: IsbnCacheEntry) -> dict:
+        return {
+            "fetchedAt": entry.fetched_at.isoformat(),
+            "item": library_item_to_dict(entry.item) if entry.item else None,
+        }
@@ -1,21 +1,278 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
-
-from domain.models import LibraryItem
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from domain.errors import LibraryItemNotFoundError, RevisionConflictError
+from domain.models import (
+    LibraryChanges,
+    LibraryItem,
+    LibraryMutation,
+    LibrarySnapshot,
+)
 from domain.repositories import LibraryRepository
-from domain.series_identity import build_series_key, extract_volume_number
+from domain.series_identity import (
+    SERIES_RULES_VERSION,
+    SeriesIdentity,
+    SeriesIdentityResolver,
+    extract_volume_number,
+    series_source_fingerprint,
+)
+from domain.series_matching import build_edition_key
+from infrastructure.metrics import MetricsRegistry
+from infrastructure.persistence.file_notes_store import FileNotesStore
+from infrastructure.persistence.library_change_channel import LibraryChangeChannel
+from infrastructure.persistence.library_change_journal import LibraryChangeJournal
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
 
 
 class JsonLibraryRepository(LibraryRepository):
-    def __init__(self, data_file: Path) -> None:
+    def __init__(
+        self,
+        data_file: Path,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        notes_dir: Optional[Path] = None,
+        change_channel: Optional[LibraryChangeChannel] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
         self._data_file = data_file
+        self._journal = LibraryChangeJournal(data_file.with_suffix(".journal"))
+        self._change_channel = change_channel
+        self._metrics = metrics
+        self._notes = FileNotesStore(notes_dir or data_file.parent / "notes")
+        self._lock_file = data_file.with_suffix(".lock")
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._revision = 0
+        self._synced_revision = 0
+        self._file_signature: Optional[tuple[int, int]] = None
+        self._items: Optional[List[LibraryItem]] = None
+        self._identities = SeriesIdentityResolver()
+        self._item_revisions: Dict[str, int] = {}
+        self._tombstones: Dict[str, tuple[int, datetime]] = {}
+        self._compacted_revision = 0
 
     def list(self) -> List[LibraryItem]:
-        if not self._data_file.exists():
+        with self._lock:
+            return self._load()
+
+    def snapshot(self) -> LibrarySnapshot:
+        with self._lock:
+            items = self._load()
+            return LibrarySnapshot(revision=self._revision, items=items)
+
+    def revision(self) -> int:
+        with self._lock:
+            self._load()
+            return self._revision
+
+    def changes_since(self, revision: int) -> LibraryChanges:
+        with self._lock:
+            items = self._load()
+            if revision < self._compacted_revision or revision > self._revision:
+                return LibraryChanges(
+                    revision=self._revision,
+                    since=revision,
+                    items=items,
+                    deleted=[],
+                    reset=True,
+                )
+            changed = [
+                item
+                for item in items
+                if self._item_revisions.get(item.id, 0) > revision
+            ]
+            deleted = sorted(
+                item_id
+                for item_id, (deleted_revision, _) in self._tombstones.items()
+                if deleted_revision > revision
+            )
+            return LibraryChanges(
+                revision=self._revision,
+                since=revision,
+                items=changed,
+                deleted=deleted,
+                reset=False,
+            )
+
+    def compact_changes(self, deleted_before: datetime) -> int:
+        with self._write_lock():
+            items = self._load(verify=True)
+            expired = [
+                item_id
+                for item_id, (_, deleted_at) in self._tombstones.items()
+                if deleted_at < deleted_before
+            ]
+            if not expired:
+                return 0
+            for item_id in expired:
+                deleted_revision, _ = self._tombstones.pop(item_id)
+                self._compacted_revision = max(
+                    self._compacted_revision, deleted_revision
+                )
+            self._save(
+                [library_item_to_dict(item) for item in items], reset_journal=True
+            )
+            return len(expired)
+
+    def get(self, item_id: str) -> Optional[LibraryItem]:
+        for item in self.list():
+            if item.id == item_id:
+                return item
+        return None
+
+    def upsert(
+        self, item: LibraryItem, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        with self._write_lock():
+            items = self._load(verify=True)
+            self._check_revision(expected_revision)
+            saved = LibraryMergeIndex(items, self._identities).upsert(item)
+            self._save(
+                [library_item_to_dict(stored) for stored in items],
+                overwrite_notes={saved.id} if saved.id == item.id else (),
+            )
+            return LibraryMutation(revision=self._revision, item=saved)
+
+    def upsert_many(
+        self, items: Sequence[LibraryItem], expected_revision: Optional[int] = None
+    ) -> List[LibraryItem]:
+        with self._write_lock():
+            stored_items = self._load(verify=True)
+            self._check_revision(expected_revision)
+            index = LibraryMergeIndex(stored_items, self._identities)
+            saved = [index.upsert(item) for item in items]
+            if saved:
+                self._save(
+                    [library_item_to_dict(stored) for stored in stored_items],
+                    overwrite_notes={
+                        stored.id
+                        for stored, item in zip(saved, items, strict=True)
+                        if stored.id == item.id
+                    },
+                )
+            return saved
+
+    def merge_many(self, items: Sequence[LibraryItem]) -> List[LibraryItem]:
+        with self._write_lock():
+            stored_items = self._load(verify=True)
+            index = LibraryMergeIndex(stored_items, self._identities)
+            saved = [index.merge(item) for item in items]
+            if saved:
+                self._save([library_item_to_dict(stored) for stored in stored_items])
+            return saved
+
+    def delete(
+        self, item_id: str, expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        with self._write_lock():
+            items = self._load(verify=True)
+            self._check_revision(expected_revision)
+            stored = [library_item_to_dict(existing) for existing in items]
+            next_items = [item for item in stored if item.get("id") != item_id]
+            if len(next_items) != len(stored):
+                self._save(next_items)
+                self._notes.delete_many([item_id])
+            return LibraryMutation(revision=self._revision)
+
+    def load_notes(self, item_ids: Sequence[str]) -> Dict[str, str]:
+        return self._notes.get_many(item_ids)
+
+    def notes_version(self) -> str:
+        return self._notes.version()
+
+    def save_notes(self, item_id: str, notes: str) -> LibraryItem:
+        with self._write_lock():
+            for item in self._load(verify=True):
+                if item.id == item_id:
+                    self._notes.save_many({item_id: notes}, overwrite={item_id})
+                    return replace(item, notes=notes)
+        raise LibraryItemNotFoundError(item_id)
+
+    def replace_all(
+        self, items: Sequence[LibraryItem], expected_revision: Optional[int] = None
+    ) -> LibraryMutation:
+        with self._write_lock():
+            self._load(verify=True)
+            self._check_revision(expected_revision)
+            self._save(
+                [library_item_to_dict(item) for item in items],
+                overwrite_notes={item.id for item in items},
+                reset_journal=True,
+            )
+            return LibraryMutation(revision=self._revision)
+
+    def _check_revision(self, expected_revision: Optional[int]) -> None:
+        if expected_revision is not None and expected_revision != self._revision:
+            raise RevisionConflictError(
+                f"expected revision {expected_revision}, found {self._revision}"
+            )
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock_file.open("a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _load(self, verify: bool = False) -> List[LibraryItem]:
+        if not verify and self._items is not None and self._change_channel is not None:
+            latest = self._change_channel.latest_revision()
+            if latest is not None and latest <= self._synced_revision:
+                return list(self._items)
+
+        signature = self._read_file_signature()
+        if signature is not None and signature == self._file_signature:
+            return list(self._items or [])
+        if (
+            signature is not None
+            and self._items is not None
+            and self._revision == self._synced_revision
+        ):
+            changes = self._journal.read_since(self._synced_revision)
+            if changes is not None:
+                for change in changes:
+                    self._apply_change(change)
+                self._file_signature = signature
+                self._count_refresh("journal")
+                return list(self._items)
+
+        self._file_signature = signature
+        self._items = []
+        self._item_revisions = {}
+        self._tombstones = {}
+        self._compacted_revision = 0
+        if signature is None:
             return []
+        self._count_refresh("full")
 
         try:
             with self._data_file.open("r", encoding="utf-8") as file:
@@ -23,121 +280,305 @@ class JsonLibraryRepository(LibraryRepository):
         except json.JSONDecodeError:
             return []
 
-        if not isinstance(data, list):
+        raw_items = data
+        stored_revision = 0
+        if isinstance(data, dict):
+            stored_revision = to_non_negative_int(data.get("revision", 0))
+            raw_items = data.get("items")
+            self._read_change_log(data)
+        self._synced_revision = stored_revision
+        if stored_revision > self._revision:
+            self._revision = stored_revision
+        else:
+            self._revision += 1
+        if not isinstance(raw_items, list):
             return []
 
+        self._identities, stale_identities = read_series_identities(raw_items)
+        identities = self._identities
         items = [
-            normalize_library_item(self._from_dict(item))
-            for item in data
+            normalize_library_item(library_item_from_dict(item), identities)
+            for item in raw_items
             if isinstance(item, dict)
         ]
-        merged_items = merge_library_items(items)
-
-        source_dicts = [self._to_dict(item) for item in items]
-        merged_dicts = [self._to_dict(item) for item in merged_items]
-        if len(items) != len(data) or source_dicts != merged_dicts:
-            self._save(merged_dicts)
-
-        return merged_items
-
-    def upsert(self, item: LibraryItem) -> LibraryItem:
-        item = normalize_library_item(item)
-        items = self.list()
-
-        for index, existing in enumerate(items):
-            if existing.id == item.id:
-                items[index] = item
-                self._save([self._to_dict(stored) for stored in items])
-                return item
-
-        incoming_key = build_series_key(item.title, item.author)
-        for index, existing in enumerate(items):
-            existing_key = build_series_key(existing.title, existing.author)
-            if existing_key != incoming_key:
-                continue
-
-            merged = merge_library_item(existing, item)
-            items[index] = merged
-            self._save([self._to_dict(stored) for stored in items])
-            return merged
-
-        items.append(item)
-        self._save([self._to_dict(stored) for stored in items])
-        return item
-
-    def delete(self, item_id: str) -> None:
-        items = self.list()
-        stored = [self._to_dict(existing) for existing in items]
-        next_items = [item for item in stored if item.get("id") != item_id]
-        self._save(next_items)
-
-    def _save(self, items: List[dict]) -> None:
+        merged_items = merge_library_items(items, identities)
+        self._items = items
+        if self._metrics is not None and identities.derived:
+            self._metrics.increment(
+                "library_series_identities_derived_total", identities.derived
+            )
+
+        source_dicts = [library_item_to_dict(item) for item in items]
+        merged_dicts = [library_item_to_dict(item) for item in merged_items]
+        has_inline_notes = any(
+            "notes" in item for item in raw_items if isinstance(item, dict)
+        )
+        if (
+            len(items) != len(raw_items)
+            or source_dicts != merged_dicts
+            or has_inline_notes
+            or stale_identities
+        ):
+            self._save(merged_dicts, reset_journal=True)
+            return list(self._items or [])
+
+        self._items = merged_items
+        return list(merged_items)
+
+    def _save(
+        self,
+        items: List[dict],
+        overwrite_notes: Collection[str] = (),
+        reset_journal: bool = False,
+    ) -> None:
+        notes: Dict[str, str] = {}
+        for item in items:
+            value = item.pop("notes", None)
+            if value is not None:
+                notes[str(item.get("id", ""))] = value
+        self._notes.save_many(notes, overwrite=overwrite_notes)
+
+        base_revision = self._revision
+        previous_ids = [item.id for item in self._items or []]
+        revision = base_revision + 1
+        self._record_changes(items, revision)
         self._data_file.parent.mkdir(parents=True, exist_ok=True)
+        records = self._with_series_identities(items)
         temp_path = self._data_file.with_suffix(".tmp")
         with temp_path.open("w", encoding="utf-8") as file:
-            json.dump(items, file, ensure_ascii=False, indent=2)
+            json.dump(
+                {
+                    "revision": revision,
+                    "items": records,
+                    "itemRevisions": self._item_revisions,
+                    "tombstones": {
+                        item_id: {
+                            "revision": deleted_revision,
+                            "deletedAt": deleted_at.isoformat(),
+                        }
+                        for item_id, (
+                            deleted_revision,
+                            deleted_at,
+                        ) in self._tombstones.items()
+                    },
+                    "compactedRevision": self._compacted_revision,
+                },
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
         temp_path.replace(self._data_file)
+        self._revision = revision
+        self._synced_revision = revision
+        self._file_signature = self._read_file_signature()
+        self._items = [library_item_from_dict(item) for item in items]
+        self._publish_change(items, previous_ids, base_revision, reset_journal)
+
+    def _with_series_identities(self, items: List[dict]) -> List[dict]:
+        previous = self._identities
+        identities = SeriesIdentityResolver()
+        records: List[dict] = []
+        for item in items:
+            title = str(item.get("title", ""))
+            author = str(item.get("author", ""))
+            identity = previous.resolve(title, author)
+            identities.remember(title, author, identity)
+            records.append(
+                {**item, "derived": series_identity_to_dict(title, author, identity)}
+            )
+        self._identities = identities
+        return records
+
+    def _publish_change(
+        self,
+        items: List[dict],
+        previous_ids: List[str],
+        base_revision: int,
+        reset: bool,
+    ) -> None:
+        revision = self._revision
+        entry: Dict[str, object] = {"revision": revision, "base": base_revision}
+        current_ids = [str(item.get("id", "")) for item in items]
+        deleted = set(previous_ids) - set(current_ids)
+        known = set(previous_ids)
+        expected_ids = [item_id for item_id in previous_ids if item_id not in deleted]
+        expected_ids.extend(item_id for item_id in current_ids if item_id not in known)
+        if reset or expected_ids != current_ids:
+            entry["reset"] = True
+        else:
+            entry["items"] = [
+                item
+                for item in items
+                if self._item_revisions.get(str(item.get("id", ""))) == revision
+            ]
+            entry["deleted"] = {
+                item_id: self._tombstones[item_id][1].isoformat()
+                for item_id in sorted(deleted)
+                if item_id in self._tombstones
+            }
+        try:
+            self._journal.append(entry)
+            if self._change_channel is not None:
+                self._change_channel.publish(revision)
+        except OSError:
+            logger.warning("本棚の変更通知を書き込めませんでした。", exc_info=True)
+
+    def _apply_change(self, entry: dict) -> None:
+        revision = to_non_negative_int(entry.get("revision"))
+        items = list(self._items or [])
+        positions = {item.id: index for index, item in enumerate(items)}
+        for raw in entry.get("items") or []:
+            if not isinstance(raw, dict):
+                continue
+            item = library_item_from_dict(raw)
+            position = positions.get(item.id)
+            if position is None:
+                positions[item.id] = len(items)
+                items.append(item)
+            else:
+                items[position] = item
+            self._item_revisions[item.id] = revision
+            self._tombstones.pop(item.id, None)
+
+        deleted = entry.get("deleted") or {}
+        if isinstance(deleted, dict) and deleted:
+            items = [item for item in items if item.id not in deleted]
+            for item_id, raw_deleted_at in deleted.items():
+                self._item_revisions.pop(item_id, None)
+                try:
+                    deleted_at = datetime.fromisoformat(str(raw_deleted_at))
+                except ValueError:
+                    deleted_at = self._clock()
+                self._tombstones[item_id] = (revision, deleted_at)
+        self._items = items
+        self._revision = revision
+        self._synced_revision = revision
+
+    def _count_refresh(self, mode: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment("library_cache_refreshes_total", mode=mode)
+
+    def _record_changes(self, items: List[dict], revision: int) -> None:
+        previous = {item.id: library_item_to_record(item) for item in self._items or []}
+        current_ids = set()
+        for item in items:
+            item_id = str(item.get("id", ""))
+            current_ids.add(item_id)
+            if previous.get(item_id) != item:
+                self._item_revisions[item_id] = revision
+            self._tombstones.pop(item_id, None)
+
+        deleted_at = self._clock()
+        for item_id in previous.keys() - current_ids:
+            self._tombstones[item_id] = (revision, deleted_at)
+        self._item_revisions = {
+            item_id: item_revision
+            for item_id, item_revision in self._item_revisions.items()
+            if item_id in current_ids
+        }
 
-    @staticmethod
-    def _from_dict(data: dict) -> LibraryItem:
-        owned_volumes = data.get("ownedVolumes", [])
-        if not isinstance(owned_volumes, list):
-            owned_volumes = []
-
-        genre = data.get("genre", [])
-        if not isinstance(genre, list):
-            genre = []
-
-        return LibraryItem(
-            id=str(data.get("id", "")),
-            title=str(data.get("title", "")),
-            author=str(data.get("author", "")),
-            publisher=to_optional_string(data.get("publisher")),
-            published_date=to_optional_string(data.get("publishedDate")),
-            latest_volume=to_non_negative_int(data.get("latestVolume", 1)),
-            owned_volumes=[to_non_negative_int(value) for value in owned_volumes],
-            next_release_date=to_optional_string(data.get("nextReleaseDate")),
-            is_favorite=bool(data.get("isFavorite", False)),
-            notes=str(data.get("notes", "")),
-            cover_url=str(data.get("coverUrl", "")),
-            genre=[str(value) for value in genre],
-            isbn=to_optional_string(data.get("isbn")),
-            source=to_optional_string(data.get("source")),
-            source_url=to_optional_string(data.get("sourceUrl")),
-        )
-
-    @staticmethod
-    def _to_dict(item: LibraryItem) -> dict:
-        return {
-            "id": item.id,
-            "title": item.title,
-            "author": item.author,
-            "publisher": item.publisher,
-            "publishedDate": item.published_date,
-            "latestVolume": item.latest_volume,
-            "ownedVolumes": item.owned_volumes,
-            "nextReleaseDate": item.next_release_date,
-            "isFavorite": item.is_favorite,
-            "notes": item.notes,
-            "coverUrl": item.cover_url,
-            "genre": item.genre,
-            "isbn": item.isbn,
-            "source": item.source,
-            "sourceUrl": item.source_url,
+    def _read_change_log(self, data: dict) -> None:
+        raw_revisions = data.get("itemRevisions")
+        if isinstance(raw_revisions, dict):
+            self._item_revisions = {
+                str(item_id): to_non_negative_int(value)
+                for item_id, value in raw_revisions.items()
+            }
+
+        raw_tombstones = data.get("tombstones")
+        if isinstance(raw_tombstones, dict):
+            for item_id, raw in raw_tombstones.items():
+                if not isinstance(raw, dict):
+                    continue
+                try:
+                    deleted_at = datetime.fromisoformat(str(raw.get("deletedAt", "")))
+                except ValueError:
+                    continue
+                self._tombstones[str(item_id)] = (
+                    to_non_negative_int(raw.get("revision", 0)),
+                    deleted_at,
+                )
+        self._compacted_revision = to_non_negative_int(data.get("compactedRevision", 0))
+
+    def _read_file_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self._data_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+class LibraryMergeIndex:
+    def __init__(
+        self,
+        items: List[LibraryItem],
+        identities: Optional[SeriesIdentityResolver] = None,
+    ) -> None:
+        self._items = items
+        self._identities = identities or SeriesIdentityResolver()
+        self._id_positions = {item.id: index for index, item in enumerate(items)}
+        self._series_positions = {
+            self._identities.resolve(item.title, item.author).series_key: index
+            for index, item in enumerate(items)
         }
+        self._edition_positions: Dict[str, int] = {}
+        for index, item in enumerate(items):
+            self._edition_positions.setdefault(
+                build_edition_key(item.title, item.author), index
+            )
 
+    def upsert(self, item: LibraryItem) -> LibraryItem:
+        return self._apply(item, replace_by_id=True)
+
+    def merge(self, item: LibraryItem) -> LibraryItem:
+        return self._apply(item, replace_by_id=False)
+
+    def _apply(self, item: LibraryItem, replace_by_id: bool) -> LibraryItem:
+        identities = self._identities
+        item = normalize_library_item(item, identities)
+        series_key = identities.resolve(item.title, item.author).series_key
+        edition_key = build_edition_key(item.title, item.author)
+
+        position = self._id_positions.get(item.id)
+        if position is not None:
+            if not replace_by_id:
+                item = merge_library_item(self._items[position], item, identities)
+            self._items[position] = item
+            self._series_positions[series_key] = position
+            self._edition_positions.setdefault(edition_key, position)
+            return item
+
+        position = self._series_positions.get(series_key)
+        if position is None:
+            position = self._edition_positions.get(edition_key)
+        if position is not None:
+            merged = merge_library_item(self._items[position], item, identities)
+            self._items[position] = merged
+            self._series_positions[series_key] = position
+            return merged
 
-def merge_library_items(items: List[LibraryItem]) -> List[LibraryItem]:
+        self._items.append(item)
+        position = len(self._items) - 1
+        self._id_positions[item.id] = position
+        self._series_positions[series_key] = position
+        self._edition_positions.setdefault(edition_key, position)
+        return item
+
+
+def merge_library_items(
+    items: List[LibraryItem], identities: Optional[SeriesIdentityResolver] = None
+) -> List[LibraryItem]:
+    identities = identities or SeriesIdentityResolver()
     merged: List[LibraryItem] = []
     id_index: dict[str, int] = {}
     series_index: dict[str, int] = {}
 
     for item in items:
-        normalized_item = normalize_library_item(item)
+        normalized_item = normalize_library_item(item, identities)
         existing_index = id_index.get(normalized_item.id)
-        item_series_key = build_series_key(
+        item_series_key = identities.resolve(
             normalized_item.title, normalized_item.author
-        )
+        ).series_key
         if existing_index is None:
             existing_index = series_index.get(item_series_key)
 
@@ -148,10 +589,14 @@ def merge_library_items(items: List[LibraryItem]) -> List[LibraryItem]:
             series_index[item_series_key] = index
             continue
 
-        merged_item = merge_library_item(merged[existing_index], normalized_item)
+        merged_item = merge_library_item(
+            merged[existing_index], normalized_item, identities
+        )
         merged[existing_index] = merged_item
 
-        merged_series_key = build_series_key(merged_item.title, merged_item.author)
+        merged_series_key = identities.resolve(
+            merged_item.title, merged_item.author
+        ).series_key
         id_index[merged_item.id] = existing_index
         id_index[normalized_item.id] = existing_index
         series_index[item_series_key] = existing_index
@@ -160,8 +605,10 @@ def merge_library_items(items: List[LibraryItem]) -> List[LibraryItem]:
     return merged
 
 
-def normalize_library_item(item: LibraryItem) -> LibraryItem:
-    extracted_volume = extract_volume_number(item.title) or 0
+def normalize_library_item(
+    item: LibraryItem, identities: Optional[SeriesIdentityResolver] = None
+) -> LibraryItem:
+    extracted_volume = volume_of(item, identities)
     owned_candidates = [to_non_negative_int(value) for value in item.owned_volumes]
     if extracted_volume > 0:
         owned_candidates.append(extracted_volume)
@@ -190,9 +637,13 @@ def normalize_library_item(item: LibraryItem) -> LibraryItem:
     )
 
 
-def merge_library_item(existing: LibraryItem, incoming: LibraryItem) -> LibraryItem:
-    existing_volume = extract_volume_number(existing.title) or 0
-    incoming_volume = extract_volume_number(incoming.title) or 0
+def merge_library_item(
+    existing: LibraryItem,
+    incoming: LibraryItem,
+    identities: Optional[SeriesIdentityResolver] = None,
+) -> LibraryItem:
+    existing_volume = volume_of(existing, identities)
+    incoming_volume = volume_of(incoming, identities)
 
     latest_volume = max(
         to_non_negative_int(existing.latest_volume),
@@ -222,16 +673,25 @@ def merge_library_item(existing: LibraryItem, incoming: LibraryItem) -> LibraryI
                 existing.next_release_date, incoming.next_release_date
             ),
             is_favorite=existing.is_favorite or incoming.is_favorite,
-            notes=pick_existing_required(existing.notes, incoming.notes),
+            notes=pick_existing_notes(existing.notes, incoming.notes),
             cover_url=pick_existing_required(existing.cover_url, incoming.cover_url),
             genre=merge_genre(existing.genre, incoming.genre),
             isbn=pick_existing_optional(existing.isbn, incoming.isbn),
             source=pick_existing_optional(existing.source, incoming.source),
             source_url=pick_existing_optional(existing.source_url, incoming.source_url),
-        )
+        ),
+        identities,
     )
 
 
+def volume_of(
+    item: LibraryItem, identities: Optional[SeriesIdentityResolver] = None
+) -> int:
+    if identities is None:
+        return extract_volume_number(item.title) or 0
+    return identities.resolve(item.title, item.author).volume or 0
+
+
 def merge_genre(primary: List[str], secondary: List[str]) -> List[str]:
     merged = list(primary)
     for value in secondary:
@@ -259,6 +719,14 @@ def pick_existing_required(primary: str, fallback: str) -> str:
     return fallback
 
 
+def pick_existing_notes(
+    primary: Optional[str], fallback: Optional[str]
+) -> Optional[str]:
+    if has_text(primary) or not has_text(fallback):
+        return primary
+    return fallback
+
+
 def pick_existing_optional(
     primary: Optional[str], fallback: Optional[str]
 ) -> Optional[str]:
@@ -273,6 +741,12 @@ def has_text(value: Optional[str]) -> bool:
     return isinstance(value, str) and value.strip() != ""
 
 
+def to_optional_text(value: object) -> Optional[str]:
+    if value is None:
+        return None
+    return str(value)
+
+
 def to_optional_string(value: object) -> Optional[str]:
     if value is None:
         return None
@@ -296,3 +770,102 @@ def to_non_negative_int(value: object) -> int:
             return 0
         return max(0, number)
     return 0
+
+
+def library_item_from_dict(data: dict) -> LibraryItem:
+    owned_volumes = data.get("ownedVolumes", [])
+    if not isinstance(owned_volumes, list):
+        owned_volumes = []
+
+    genre = data.get("genre", [])
+    if not isinstance(genre, list):
+        genre = []
+
+    return LibraryItem(
+        id=str(data.get("id", "")),
+        title=str(data.get("title", "")),
+        author=str(data.get("author", "")),
+        publisher=to_optional_string(data.get("publisher")),
+        published_date=to_optional_string(data.get("publishedDate")),
+        latest_volume=to_non_negative_int(data.get("latestVolume", 1)),
+        owned_volumes=[to_non_negative_int(value) for value in owned_volumes],
+        next_release_date=to_optional_string(data.get("nextReleaseDate")),
+        is_favorite=bool(data.get("isFavorite", False)),
+        notes=to_optional_text(data.get("notes")),
+        cover_url=str(data.get("coverUrl", "")),
+        genre=[str(value) for value in genre],
+        isbn=to_optional_string(data.get("isbn")),
+        source=to_optional_string(data.get("source")),
+        source_url=to_optional_string(data.get("sourceUrl")),
+    )
+
+
+def library_item_to_record(item: LibraryItem) -> dict:
+    record = library_item_to_dict(item)
+    record.pop("notes")
+    return record
+
+
+def library_item_to_dict(item: LibraryItem) -> dict:
+    return {
+        "id": item.id,
+        "title": item.title,
+        "author": item.author,
+        "publisher": item.publisher,
+        "publishedDate": item.published_date,
+        "latestVolume": item.latest_volume,
+        "ownedVolumes": item.owned_volumes,
+        "nextReleaseDate": item.next_release_date,
+        "isFavorite": item.is_favorite,
+        "notes": item.notes,
+        "coverUrl": item.cover_url,
+        "genre": item.genre,
+        "isbn": item.isbn,
+        "source": item.source,
+        "sourceUrl": item.source_url,
+    }
+
+
+def read_series_identities(
+    raw_items: List[object],
+) -> Tuple[SeriesIdentityResolver, int]:
+    identities = SeriesIdentityResolver()
+    stale = 0
+    for raw in raw_items:
+        if not isinstance(raw, dict):
+            continue
+        title = str(raw.get("title", ""))
+        author = str(raw.get("author", ""))
+        identity = series_identity_from_dict(title, author, raw.get("derived"))
+        if identity is None:
+            stale += 1
+        else:
+            identities.remember(title, author, identity)
+    return identities, stale
+
+
+def series_identity_from_dict(
+    title: str, author: str, data: object
+) -> Optional[SeriesIdentity]:
+    if not isinstance(data, dict):
+        return None
+    if data.get("rules") != SERIES_RULES_VERSION:
+        return None
+    if data.get("source") != series_source_fingerprint(title, author):
+        return None
+    series_key = data.get("seriesKey")
+    volume = data.get("volume")
+    if not isinstance(series_key, str):
+        return None
+    if volume is not None and (isinstance(volume, bool) or not isinstance(volume, int)):
+        return None
+    return SeriesIdentity(series_key=series_key, volume=volume)
+
+
+def series_identity_to_dict(title: str, author: str, identity: SeriesIdentity) -> dict:
+    return {
+        "rules": SERIES_RULES_VERSION,
+        "source": series_source_fingerprint(title, author),
+        "seriesKey": identity.series_key,
+        "volume": identity.volume,
+    }
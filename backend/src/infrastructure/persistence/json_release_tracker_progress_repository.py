@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from domain.release_tracking import ReleaseTrackerProgress
+from domain.repositories import ReleaseTrackerProgressRepository
+
+
+class JsonReleaseTrackerProgressRepository(ReleaseTrackerProgressRepository):
+    def __init__(self, data_file: Path) -> None:
+        self._data_file = data_file
+
+    def load(self) -> ReleaseTrackerProgress:
+        if not self._data_file.exists():
+            return ReleaseTrackerProgress()
+
+        try:
+            with self._data_file.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            return ReleaseTrackerProgress()
+
+        raw_checked = data.get("checkedAt") if isinstance(data, dict) else None
+        if not isinstance(raw_checked, dict):
+            return ReleaseTrackerProgress()
+
+        progress = ReleaseTrackerProgress()
+        for series_key, raw_value in raw_checked.items():
+            try:
+                checked_at = datetime.fromisoformat(str(raw_value))
+            except ValueError:
+                continue
+            progress.mark_checked(str(series_key), checked_at)
+        return progress
+
+    def save(self, progress: ReleaseTrackerProgress) -> None:
+        data = {
+            "checkedAt": {
+                series_key: checked_at.isoformat()
+                for series_key, checked_at in progress.checked_at.items()
+            }
+        }
+        self._data_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._data_file.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+        temp_path.replace(self._data_file)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from domain.repositories import SeriesCatalogRepository
+from domain.series_catalog import SeriesCatalogEntry
+
+logger = logging.getLogger(__name__)
+
+
+class JsonSeriesCatalogRepository(SeriesCatalogRepository):
+    def __init__(self, data_file: Path, flush_delay_seconds: float = 0.0) -> None:
+        self._data_file = data_file
+        self._flush_delay_seconds = max(flush_delay_seconds, 0.0)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, SeriesCatalogEntry] = {}
+        self._file_signature: Optional[tuple[int, int]] = None
+        self._loaded = False
+        self._pending: Dict[str, SeriesCatalogEntry] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def get(self, series_key: str) -> Optional[SeriesCatalogEntry]:
+        entries = self.get_many([series_key])
+        return entries[0] if entries else None
+
+    def get_many(self, series_keys: Sequence[str]) -> List[SeriesCatalogEntry]:
+        with self._lock:
+            self._refresh()
+            return [
+                _copy_entry(self._entries[series_key])
+                for series_key in series_keys
+                if series_key in self._entries
+            ]
+
+    def list_all(self) -> List[SeriesCatalogEntry]:
+        with self._lock:
+            self._refresh()
+            return [_copy_entry(entry) for entry in self._entries.values()]
+
+    def save_many(self, entries: Sequence[SeriesCatalogEntry]) -> None:
+        if not entries:
+            return
+        with self._lock:
+            self._refresh()
+            for entry in entries:
+                self._entries[entry.series_key] = _copy_entry(entry)
+                self._pending[entry.series_key] = _copy_entry(entry)
+            if self._flush_delay_seconds <= 0:
+                self._flush_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self._flush_delay_seconds, self._flush_scheduled
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._flush_pending()
+
+    def _flush_scheduled(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            try:
+                self._flush_pending()
+            except OSError:
+                logger.warning(
+                    "シリーズ巻カタログを保存できませんでした。", exc_info=True
+                )
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        self._refresh()
+        data = {
+            series_key: self._to_dict(entry)
+            for series_key, entry in self._entries.items()
+        }
+        self._save(data)
+        self._pending = {}
+
+    def _refresh(self) -> None:
+        signature = self._read_file_signature()
+        if self._loaded and signature == self._file_signature:
+            return
+        entries: Dict[str, SeriesCatalogEntry] = {}
+        for series_key, raw in self._load().items():
+            if not isinstance(raw, dict):
+                continue
+            entry = self._from_dict(series_key, raw)
+            if entry is not None:
+                entries[series_key] = entry
+        entries.update(
+            (series_key, _copy_entry(entry))
+            for series_key, entry in self._pending.items()
+        )
+        self._entries = entries
+        self._file_signature = signature
+        self._loaded = True
+
+    def _load(self) -> Dict[str, object]:
+        if not self._data_file.exists():
+            return {}
+        try:
+            with self._data_file.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _save(self, data: Dict[str, object]) -> None:
+        self._data_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._data_file.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+        temp_path.replace(self._data_file)
+        self._file_signature = self._read_file_signature()
+
+    def _read_file_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self._data_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _from_dict(series_key: str, data: dict) -> Optional[SeriesCatalogEntry]:
+        try:
+            refreshed_at = datetime.fromisoformat(str(data.get("refreshedAt", "")))
+        except ValueError:
+            return None
+
+        volumes: Dict[int, Optional[str]] = {}
+        raw_volumes = data.get("volumes")
+        if isinstance(raw_volumes, dict):
+            for raw_volume, raw_isbn in raw_volumes.items():
+                try:
+                    volume = int(raw_volume)
+                except ValueError:
+                    continue
+                volumes[volume] = str(raw_isbn) if raw_isbn else None
+
+        return SeriesCatalogEntry(
+            series_key=series_key,
+            title=str(data.get("title", "")),
+            author=str(data.get("author", "")),
+            refreshed_at=refreshed_at,
+            volumes=volumes,
+        )
+
+    @staticmethod
+    def _to_dict(entry: SeriesCatalogEntry) -> dict:
+        return {
+            "title": entry.title,
+            "author": entry.author,
+            "refreshedAt": entry.refreshed_at.isoformat(),
+            "volumes": {
+                str(volume): isbn for volume, isbn in sorted(entry.volumes.items())
+            },
+        }
+
+
+def _copy_entry(entry: SeriesCatalogEntry) -> SeriesCatalogEntry:
+    return replace(entry, volumes=dict(entry.volumes))
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CHANGE_CHANNEL_FILE = "file"
+CHANGE_CHANNEL_LOCAL = "local"
+CHANGE_CHANNEL_OFF = "off"
+
+
+class LibraryChangeChannel(ABC):
+    @abstractmethod
+    def latest_revision(self) -> Optional[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def publish(self, revision: int) -> None:
+        raise NotImplementedError
+
+
+class LibraryChangeBroker(ABC):
+    @abstractmethod
+    def channel(self, data_file: Path) -> LibraryChangeChannel:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        return None
+
+
+class LocalLibraryChangeChannel(LibraryChangeChannel):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._revision = 0
+
+    def latest_revision(self) -> Optional[int]:
+        return self._revision
+
+    def publish(self, revision: int) -> None:
+        with self._lock:
+            self._revision = max(self._revision, revision)
+
+
+class LocalLibraryChangeBroker(LibraryChangeBroker):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._channels: weakref.WeakValueDictionary[Path, LocalLibraryChangeChannel] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def channel(self, data_file: Path) -> LibraryChangeChannel:
+        with self._lock:
+            channel = self._channels.get(data_file)
+            if channel is None:
+                channel = LocalLibraryChangeChannel()
+                self._channels[data_file] = channel
+            return channel
+
+
+class RevisionFileChannel(LibraryChangeChannel):
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._revision: Optional[int] = None
+        self._signature: Optional[tuple[int, int, int]] = None
+
+    def latest_revision(self) -> Optional[int]:
+        return self._revision
+
+    def publish(self, revision: int) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        temp_path.write_text(str(revision), encoding="utf-8")
+        temp_path.replace(self._path)
+        with self._lock:
+            self._revision = max(self._revision or 0, revision)
+
+    def poll(self) -> None:
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return
+        try:
+            revision = int(self._path.read_text(encoding="utf-8").strip())
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            self._signature = signature
+            self._revision = max(self._revision or 0, revision)
+
+
+class RevisionFileChangeBroker(LibraryChangeBroker):
+    def __init__(self, poll_seconds: float = 0.25) -> None:
+        self._poll_seconds = max(poll_seconds, 0.01)
+        self._lock = threading.Lock()
+        self._channels: weakref.WeakValueDictionary[Path, RevisionFileChannel] = (
+            weakref.WeakValueDictionary()
+        )
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def channel(self, data_file: Path) -> LibraryChangeChannel:
+        with self._lock:
+            channel = self._channels.get(data_file)
+            if channel is None:
+                channel = RevisionFileChannel(data_file.with_suffix(".revision"))
+                channel.poll()
+                self._channels[data_file] = channel
+            if self._thread is None and not self._stop_event.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="library-change-watcher", daemon=True
+                )
+                self._thread.start()
+            return channel
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self._poll_seconds * 4)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._poll_seconds):
+            with self._lock:
+                channels = list(self._channels.values())
+            for channel in channels:
+                try:
+                    channel.poll()
+                except Exception:
+                    logger.exception("本棚の更新通知の確認に失敗しました。")
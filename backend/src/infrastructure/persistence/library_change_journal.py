@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import uuid
+from pathlib import Path
+from typing import List, Mapping, Optional
+
+JOURNAL_MAX_BYTES = 1024 * 1024
+
+
+class LibraryChangeJournal:
+    def __init__(self, path: Path, max_bytes: int = JOURNAL_MAX_BYTES) -> None:
+        self._path = path
+        self._max_bytes = max(max_bytes, 1)
+        self._generation: Optional[str] = None
+        self._offset = 0
+
+    def append(self, entry: Mapping[str, object]) -> None:
+        line = (
+            json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        ).encode("utf-8")
+        try:
+            size: Optional[int] = self._path.stat().st_size
+        except OSError:
+            size = None
+        if size is None or size + len(line) > self._max_bytes:
+            self._rotate()
+        with self._path.open("ab") as file:
+            file.write(line)
+
+    def read_since(self, revision: int) -> Optional[List[dict]]:
+        try:
+            file = self._path.open("rb")
+        except OSError:
+            return None
+        with file:
+            try:
+                header = json.loads(file.readline())
+            except ValueError:
+                return None
+            generation = header.get("generation") if isinstance(header, dict) else None
+            if not generation:
+                return None
+            if generation != self._generation:
+                self._generation = generation
+                self._offset = file.tell()
+            file.seek(self._offset)
+
+            entries: List[dict] = []
+            expected_base = revision
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                self._offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    return None
+                if not isinstance(entry, dict):
+                    return None
+                entry_revision = entry.get("revision")
+                if not isinstance(entry_revision, int) or entry_revision <= revision:
+                    continue
+                if entry.get("reset") or entry.get("base") != expected_base:
+                    return None
+                entries.append(entry)
+                expected_base = entry_revision
+        return entries or None
+
+    def _rotate(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        header = json.dumps({"generation": uuid.uuid4().hex}) + "\n"
+        temp_path.write_text(header, encoding="utf-8")
+        temp_path.replace(self._path)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional
+
+from domain.services import RateLimiter
+from infrastructure.metrics import MetricsRegistry
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    requests_per_second: float
+    burst: float = 1.0
+
+
+@dataclass
+class BucketState:
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketStore(ABC):
+    @abstractmethod
+    def take(self, key: str, budget: RateBudget, now: float) -> float:
+        raise NotImplementedError
+
+    @abstractmethod
+    def peek(self, key: str, budget: RateBudget, now: float) -> float:
+        raise NotImplementedError
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: Dict[str, BucketState] = {}
+
+    def take(self, key: str, budget: RateBudget, now: float) -> float:
+        with self._lock:
+            state, wait_seconds = consume(self._states.get(key), budget, now)
+            self._states[key] = state
+            return wait_seconds
+
+    def peek(self, key: str, budget: RateBudget, now: float) -> float:
+        with self._lock:
+            return refill(self._states.get(key), budget, now).tokens
+
+
+class FileTokenBucketStore(TokenBucketStore):
+    def __init__(self, directory: Path) -> None:
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucketStore requires fcntl.")
+        self._directory = directory
+        self._lock = threading.Lock()
+
+    def take(self, key: str, budget: RateBudget, now: float) -> float:
+        wait_seconds = 0.0
+
+        def update(state: Optional[BucketState]) -> BucketState:
+            nonlocal wait_seconds
+            next_state, wait_seconds = consume(state, budget, now)
+            return next_state
+
+        self._locked_update(key, update)
+        return wait_seconds
+
+    def peek(self, key: str, budget: RateBudget, now: float) -> float:
+        state = self._locked_update(key, lambda state: refill(state, budget, now))
+        return state.tokens
+
+    def _locked_update(
+        self, key: str, update: Callable[[Optional[BucketState]], BucketState]
+    ) -> BucketState:
+        assert fcntl is not None
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"{key}.json"
+        with self._lock:
+            descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(descriptor, "r+", encoding="utf-8") as file:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+                try:
+                    state = update(read_state(file.read()))
+                    file.seek(0)
+                    file.truncate()
+                    json.dump(
+                        {"tokens": state.tokens, "updatedAt": state.updated_at}, file
+                    )
+                    file.flush()
+                finally:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return state
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    def __init__(
+        self,
+        budgets: Mapping[str, RateBudget],
+        store: Optional[TokenBucketStore] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        metric_prefix: str = "rate_limit",
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._budgets = {
+            key: budget
+            for key, budget in budgets.items()
+            if budget.requests_per_second > 0
+        }
+        self._store = store or InMemoryTokenBucketStore()
+        self._metrics = metrics
+        self._metric_prefix = metric_prefix
+        self._clock = clock
+        self._sleep = sleep
+        if metrics is not None:
+            for key in self._budgets:
+                metrics.register_gauge(
+                    f"{metric_prefix}_remaining_tokens",
+                    lambda key=key: self.remaining(key) or 0.0,
+                    provider=key,
+                )
+
+    def try_acquire(self, key: str, timeout_seconds: float = 0.0) -> bool:
+        budget = self._budgets.get(key)
+        if budget is None:
+            return True
+
+        deadline = self._clock() + max(timeout_seconds, 0.0)
+        while True:
+            now = self._clock()
+            wait_seconds = self._store.take(key, budget, now)
+            if wait_seconds <= 0:
+                self._count("acquired", key)
+                return True
+            if now + wait_seconds > deadline:
+                self._count("rejected", key)
+                return False
+            self._count("waited", key)
+            self._sleep(wait_seconds)
+
+    def remaining(self, key: str) -> Optional[float]:
+        budget = self._budgets.get(key)
+        if budget is None:
+            return None
+        return round(self._store.peek(key, budget, self._clock()), 3)
+
+    def _count(self, outcome: str, key: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(
+                f"{self._metric_prefix}_{outcome}_total", provider=key
+            )
+
+
+def refill(state: Optional[BucketState], budget: RateBudget, now: float) -> BucketState:
+    if state is None:
+        return BucketState(tokens=budget.burst, updated_at=now)
+    elapsed = max(now - state.updated_at, 0.0)
+    tokens = min(budget.burst, state.tokens + elapsed * budget.requests_per_second)
+    return BucketState(tokens=tokens, updated_at=max(now, state.updated_at))
+
+
+def consume(
+    state: Optional[BucketState], budget: RateBudget, now: float
+) -> tuple[BucketState, float]:
+    refilled = refill(state, budget, now)
+    if refilled.tokens >= 1.0:
+        refilled.tokens -= 1.0
+        return refilled, 0.0
+    return refilled, (1.0 - refilled.tokens) / budget.requests_per_second
+
+
+def read_state(raw: str) -> Optional[BucketState]:
+    if not raw.strip():
+        return None
+    try:
+        data = json.loads(raw)
+        return BucketState(
+            tokens=float(data["tokens"]), updated_at=float(data["updatedAt"])
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
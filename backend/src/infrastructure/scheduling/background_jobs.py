@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobRunner:
+    def __init__(self, name: str, max_workers: int = 1) -> None:
+        self._name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1), thread_name_prefix=name
+        )
+        self.stop_event = threading.Event()
+
+    def submit(self, action: Callable[[], object]) -> Future[object]:
+        future = self._executor.submit(action)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def shutdown(self) -> None:
+        self.stop_event.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _log_failure(self, future: Future[object]) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error(
+                "バックグラウンドジョブ %s の実行に失敗しました。",
+                self._name,
+                exc_info=exc,
+            )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from contextlib import suppress
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    def __init__(
+        self,
+        name: str,
+        action: Callable[[], object],
+        interval_seconds: float,
+        jitter_ratio: float = 0.2,
+        initial_delay_seconds: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._name = name
+        self._action = action
+        self._interval_seconds = max(interval_seconds, 0.0)
+        self._jitter_ratio = min(max(jitter_ratio, 0.0), 1.0)
+        self._initial_delay_seconds = max(initial_delay_seconds, 0.0)
+        self._rng = rng or random.Random()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def next_delay(self, base_seconds: float) -> float:
+        spread = base_seconds * self._jitter_ratio
+        return max(base_seconds + self._rng.uniform(-spread, spread), 0.0)
+
+    async def _run(self) -> None:
+        await asyncio.sleep(self.next_delay(self._initial_delay_seconds))
+        while True:
+            try:
+                await asyncio.to_thread(self._action)
+            except Exception:
+                logger.exception("定期タスク %s の実行に失敗しました。", self._name)
+            await asyncio.sleep(self.next_delay(self._interval_seconds))
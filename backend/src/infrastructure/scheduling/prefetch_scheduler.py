@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Optional
+
+from infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchJob:
+    key: Hashable
+    group: Hashable
+    action: Callable[[], object]
+    submitted_at: float
+    started: bool = False
+    done: threading.Event = field(default_factory=threading.Event)
+    future: Optional[Future[None]] = None
+
+
+class PrefetchScheduler:
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 1,
+        max_pending: int = 8,
+        max_wait_seconds: float = 10.0,
+        metrics: Optional[MetricsRegistry] = None,
+        metric_prefix: str = "prefetch",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1), thread_name_prefix=name
+        )
+        self._max_pending = max(max_pending, 1)
+        self._max_wait_seconds = max_wait_seconds
+        self._metrics = metrics
+        self._metric_prefix = metric_prefix
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._jobs: Dict[Hashable, PrefetchJob] = {}
+        self._latest_by_group: Dict[Hashable, Hashable] = {}
+        self._stopped = False
+
+    def submit(
+        self, key: Hashable, group: Hashable, action: Callable[[], object]
+    ) -> bool:
+        with self._lock:
+            if self._stopped or key in self._jobs:
+                return False
+            previous = self._latest_by_group.get(group)
+            if previous is not None:
+                self._cancel_pending(previous)
+            pending = [job for job in self._jobs.values() if not job.started]
+            while len(pending) >= self._max_pending:
+                self._cancel_pending(pending.pop(0).key)
+
+            job = PrefetchJob(
+                key=key, group=group, action=action, submitted_at=self._clock()
+            )
+            self._jobs[key] = job
+            self._latest_by_group[group] = key
+            job.future = self._executor.submit(self._run, job)
+        self._count("scheduled")
+        return True
+
+    def join(self, key: Hashable, timeout_seconds: float) -> None:
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return
+            if not job.started:
+                self._cancel_pending(key)
+                return
+        if job.done.wait(timeout_seconds):
+            self._count("joined")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._stopped = True
+            for key in [key for key, job in self._jobs.items() if not job.started]:
+                self._cancel_pending(key)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, job: PrefetchJob) -> None:
+        with self._lock:
+            if self._jobs.get(job.key) is not job:
+                return
+            if self._clock() - job.submitted_at > self._max_wait_seconds:
+                self._forget(job)
+                job.done.set()
+                self._count("expired")
+                return
+            job.started = True
+        try:
+            job.action()
+            self._count("completed")
+        except Exception:
+            logger.exception("先読みジョブ %s の実行に失敗しました。", self._name)
+            self._count("failed")
+        finally:
+            with self._lock:
+                self._forget(job)
+            job.done.set()
+
+    def _cancel_pending(self, key: Hashable) -> None:
+        job = self._jobs.get(key)
+        if job is None or job.started:
+            return
+        if job.future is not None:
+            job.future.cancel()
+        self._forget(job)
+        job.done.set()
+        self._count("cancelled")
+
+    def _forget(self, job: PrefetchJob) -> None:
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if self._latest_by_group.get(job.group) == job.key:
+            del self._latest_by_group[job.group]
+
+    def _count(self, outcome: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(f"{self._metric_prefix}_{outcome}_total")
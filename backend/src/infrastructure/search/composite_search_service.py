@@ -1,85 +1,137 @@
 from __future__ import annotations
 
-import re
-import unicodedata
-from typing import Iterable, List, Sequence
-
-from domain.errors import SearchServiceError
+import logging
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from domain.cancellation import is_cancelled
+from domain.errors import (
+    OperationCancelledError,
+    SearchOverloadedError,
+    SearchServiceError,
+)
 from domain.models import LibraryItem
+from domain.publication_date import is_published_between
 from domain.search import SearchQuery, SearchResult
-from domain.services import BookSearchService
-
-
-class CompositeBookSearchService(BookSearchService):
-    def __init__(self, services: Sequence[BookSearchService]) -> None:
-        self._services = list(services)
+from domain.search_merging import SearchResultMerger
+from domain.search_planning import (
+    CALL_MODE_LOOKUP,
+    PlannedCall,
+    ProviderCapabilities,
+    SearchPlan,
+    plan_search,
+)
+from domain.services import BookSearchService, IsbnLookupService, SearchPlanner
+from infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class CompositeBookSearchService(BookSearchService, SearchPlanner):
+    name = "composite"
+
+    def __init__(
+        self,
+        services: Sequence[BookSearchService],
+        early_stop: bool = True,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
+        self._services = {service.name: service for service in services}
+        self._capabilities = [
+            ProviderCapabilities(
+                name=service.name,
+                filters=service.search_filters,
+                isbn_lookup=isinstance(service, IsbnLookupService),
+            )
+            for service in services
+        ]
+        self._early_stop = early_stop
+        self._metrics = metrics
+
+    def plan(self, query: SearchQuery) -> SearchPlan:
+        return plan_search(query, self._capabilities, early_stop=self._early_stop)
 
     def search(self, query: SearchQuery) -> SearchResult:
         page = max(query.page, 1)
         limit = max(query.limit, 1)
-        fetch_limit = limit * page
-
-        results: List[LibraryItem] = []
-        total = 0
+        plan = self.plan(query)
+        logger.debug(
+            "検索プラン kind=%s calls=%s",
+            plan.kind,
+            [call.provider for call in plan.calls],
+        )
+        self._count("search_plans_total", kind=plan.kind)
+        if not plan.calls:
+            return SearchResult(items=[], total=0, page=page, limit=limit)
+
+        merger = SearchResultMerger()
+        reported_total = 0
         succeeded = 0
-
-        for service in self._services:
-            try:
-                result = service.search(
-                    SearchQuery(
-                        q=query.q,
-                        title=query.title,
-                        author=query.author,
-                        publisher=query.publisher,
-                        from_date=query.from_date,
-                        until=query.until,
-                        page=1,
-                        limit=fetch_limit,
+        overloaded = 0
+
+        for position, call in enumerate(plan.calls):
+            if is_cancelled():
+                for skipped in plan.calls[position:]:
+                    self._count(
+                        "search_provider_calls_cancelled_total",
+                        provider=skipped.provider,
                     )
-                )
+                raise OperationCancelledError("呼び出し元が検索を中断しました。")
+            self._count("search_provider_calls_total", provider=call.provider)
+            try:
+                items, provider_total = self._execute(call, plan)
+            except SearchOverloadedError:
+                overloaded += 1
+                continue
             except SearchServiceError:
                 continue
 
             succeeded += 1
-            total += result.total
-            results.extend(result.items)
-
+            if call.local_filters:
+                items = filter_published_between(items, query, call.local_filters)
+            else:
+                reported_total = max(reported_total, provider_total)
+            merger.add(items)
+            if plan.stop_after and len(merger) >= plan.stop_after:
+                break
+
+        if succeeded == 0 and overloaded:
+            raise SearchOverloadedError("検索APIが混雑しています。")
         if succeeded == 0:
             raise SearchServiceError("検索APIに接続できませんでした。")
 
-        deduped = deduplicate(results)
+        merged = merger.results()
         start = (page - 1) * limit
-        sliced = deduped[start : start + limit]
-        return SearchResult(items=sliced, total=len(deduped), page=page, limit=limit)
-
-
-def deduplicate(items: Iterable[LibraryItem]) -> List[LibraryItem]:
-    seen: set[str] = set()
-    unique: List[LibraryItem] = []
-    for item in items:
-        key = build_dedupe_key(item)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(item)
-    return unique
-
-
-def build_dedupe_key(item: LibraryItem) -> str:
-    if item.isbn:
-        isbn = normalize_isbn(item.isbn)
-        if isbn:
-            return f"isbn:{isbn}"
-    title = normalize_text(item.title)
-    author = normalize_text(item.author)
-    return f"title:{title}|author:{author}"
-
-
-def normalize_text(value: str) -> str:
-    normalized = unicodedata.normalize("NFKC", value or "")
-    normalized = re.sub(r"\s+", " ", normalized).strip().lower()
-    return normalized
-
-
-def normalize_isbn(value: str) -> str:
-    return re.sub(r"[^0-9xX]", "", value or "").upper()
+        sliced = merged[start : start + limit]
+        total = max(len(merged), reported_total)
+        return SearchResult(items=sliced, total=total, page=page, limit=limit)
+
+    def _execute(
+        self, call: PlannedCall, plan: SearchPlan
+    ) -> Tuple[List[LibraryItem], int]:
+        service = self._services[call.provider]
+        if (
+            call.mode == CALL_MODE_LOOKUP
+            and plan.isbn is not None
+            and isinstance(service, IsbnLookupService)
+        ):
+            items = list(service.lookup_isbns([plan.isbn]).values())
+            return items, len(items)
+        result = service.search(call.query)
+        return result.items, result.total
+
+    def _count(self, name: str, **labels: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(name, **labels)
+
+
+def filter_published_between(
+    items: Iterable[LibraryItem], query: SearchQuery, local_filters: Iterable[str]
+) -> List[LibraryItem]:
+    names = set(local_filters)
+    from_date = query.from_date if "from_date" in names else None
+    until = query.until if "until" in names else None
+    return [
+        item
+        for item in items
+        if is_published_between(item.published_date, from_date, until)
+    ]
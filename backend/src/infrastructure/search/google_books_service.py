@@ -1,26 +1,42 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
 
 import requests
 
 from domain.errors import SearchServiceError
+from domain.isbn import to_isbn13
 from domain.models import LibraryItem
-from domain.search import SearchQuery, SearchResult
+from domain.search import SearchQuery, SearchResult, includes_field
 from domain.series_identity import extract_volume_number
-from domain.services import BookSearchService
+from domain.services import BookSearchService, IsbnLookupService, RateLimiter
+from infrastructure.search.provider_http import ProviderHttpClient
 
 MAX_RESULTS = 40
+# Google Books は User-Agent に "gzip" を含むリクエストにだけ圧縮レスポンスを返す。
+REQUEST_HEADERS = {"User-Agent": "manga-shelf-backend (gzip)"}
 
 
-class GoogleBooksService(BookSearchService):
+class GoogleBooksService(BookSearchService, IsbnLookupService):
+    name = "google"
+    max_batch_size = 20
+
     def __init__(
-        self, endpoint: str, api_key: Optional[str], timeout_seconds: int = 10
+        self,
+        endpoint: str,
+        api_key: Optional[str],
+        timeout_seconds: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_wait_seconds: float = 0.0,
+        http_client: Optional[ProviderHttpClient] = None,
     ) -> None:
         self._endpoint = endpoint
         self._api_key = api_key
         self._timeout_seconds = timeout_seconds
+        self._rate_limiter = rate_limiter
+        self._rate_limit_wait_seconds = rate_limit_wait_seconds
+        self._http = http_client or ProviderHttpClient()
 
     def search(self, query: SearchQuery) -> SearchResult:
         page = max(query.page, 1)
@@ -36,13 +52,45 @@ class GoogleBooksService(BookSearchService):
             "printType": "books",
             "startIndex": start_index,
             "maxResults": limit,
+            "fields": build_fields_param(query.fields),
         }
+        data = self._request(params)
+        total = parse_total(data)
+        with self._http.decoding(self.name):
+            items = build_items(data.get("items") or [], query.fields)
+        return SearchResult(items=items, total=total, page=page, limit=limit)
+
+    def lookup_isbns(self, isbns: Sequence[str]) -> Dict[str, LibraryItem]:
+        if not isbns:
+            return {}
+        data = self._request(
+            {
+                "q": " OR ".join(f"isbn:{isbn}" for isbn in isbns),
+                "printType": "books",
+                "maxResults": MAX_RESULTS,
+                "fields": build_fields_param(),
+            }
+        )
+        with self._http.decoding(self.name):
+            items = build_items(data.get("items") or [])
+        return index_by_isbn(items, isbns)
+
+    def _request(self, params: dict[str, Any]) -> dict[str, Any]:
         if self._api_key:
             params["key"] = self._api_key
 
+        if self._rate_limiter is not None and not self._rate_limiter.try_acquire(
+            self.name, self._rate_limit_wait_seconds
+        ):
+            raise SearchServiceError("Google Books APIの利用上限に達しています。")
+
         try:
-            response = requests.get(
-                self._endpoint, params=params, timeout=self._timeout_seconds
+            response = self._http.get(
+                self.name,
+                self._endpoint,
+                params,
+                self._timeout_seconds,
+                headers=REQUEST_HEADERS,
             )
         except requests.RequestException as exc:
             raise SearchServiceError(
@@ -53,13 +101,13 @@ class GoogleBooksService(BookSearchService):
             raise SearchServiceError("Google Books APIからの応答が不正です。")
 
         try:
-            data = response.json()
+            with self._http.decoding(self.name):
+                data = response.json()
         except ValueError as exc:
             raise SearchServiceError("Google Books APIの応答が不正です。") from exc
-
-        total = parse_total(data)
-        items = build_items(data.get("items") or [])
-        return SearchResult(items=items, total=total, page=page, limit=limit)
+        if not isinstance(data, dict):
+            raise SearchServiceError("Google Books APIの応答が不正です。")
+        return data
 
 
 def clamp(value: int, minimum: int, maximum: int) -> int:
@@ -79,6 +127,21 @@ def build_query(query: SearchQuery) -> str:
     return " ".join(part for part in parts if part).strip()
 
 
+def build_fields_param(fields: Optional[FrozenSet[str]] = None) -> str:
+    volume_fields = ["title", "authors", "industryIdentifiers(type,identifier)"]
+    if includes_field(fields, "publisher"):
+        volume_fields.append("publisher")
+    if includes_field(fields, "published_date"):
+        volume_fields.append("publishedDate")
+    if includes_field(fields, "cover_url"):
+        volume_fields.append("imageLinks")
+    if includes_field(fields, "genre"):
+        volume_fields.append("categories")
+    if includes_field(fields, "source_url"):
+        volume_fields.append("infoLink")
+    return f"totalItems,items(id,volumeInfo({','.join(volume_fields)}))"
+
+
 def parse_total(data: dict[str, Any]) -> int:
     value = data.get("totalItems")
     if isinstance(value, bool):
@@ -103,7 +166,16 @@ def parse_total(data: dict[str, Any]) -> int:
     return 0
 
 
-def build_items(raw_items: List[dict[str, Any]]) -> List[LibraryItem]:
+def build_items(
+    raw_items: List[dict[str, Any]], fields: Optional[FrozenSet[str]] = None
+) -> List[LibraryItem]:
+    with_publisher = includes_field(fields, "publisher")
+    with_published_date = includes_field(fields, "published_date")
+    with_cover = includes_field(fields, "cover_url")
+    with_genre = includes_field(fields, "genre")
+    with_source_url = includes_field(fields, "source_url")
+    with_latest_volume = includes_field(fields, "latest_volume")
+
     items: List[LibraryItem] = []
     for raw in raw_items:
         if not isinstance(raw, dict):
@@ -114,15 +186,27 @@ def build_items(raw_items: List[dict[str, Any]]) -> List[LibraryItem]:
             continue
         authors = volume.get("authors") or []
         author = " / ".join([str(a).strip() for a in authors if str(a).strip()])
-        publisher = str(volume.get("publisher") or "").strip() or None
-        published_date = str(volume.get("publishedDate") or "").strip() or None
+        publisher = None
+        if with_publisher:
+            publisher = str(volume.get("publisher") or "").strip() or None
+        published_date = None
+        if with_published_date:
+            published_date = str(volume.get("publishedDate") or "").strip() or None
         isbn = extract_isbn(volume.get("industryIdentifiers") or [])
-        cover_url = extract_cover_url(volume.get("imageLinks") or {})
-        categories = volume.get("categories") or []
-        genre = [str(c).strip() for c in categories if str(c).strip()]
-        info_link = str(volume.get("infoLink") or "").strip() or None
+        cover_url = ""
+        if with_cover:
+            cover_url = extract_cover_url(volume.get("imageLinks") or {})
+        genre: List[str] = []
+        if with_genre:
+            categories = volume.get("categories") or []
+            genre = [str(c).strip() for c in categories if str(c).strip()]
+        info_link = None
+        if with_source_url:
+            info_link = str(volume.get("infoLink") or "").strip() or None
         item_id = build_google_id(raw, title, author)
-        latest_volume = extract_volume_number(title) or 1
+        latest_volume = 1
+        if with_latest_volume:
+            latest_volume = extract_volume_number(title) or 1
 
         items.append(
             LibraryItem(
@@ -135,7 +219,6 @@ def build_items(raw_items: List[dict[str, Any]]) -> List[LibraryItem]:
                 owned_volumes=[],
                 next_release_date=None,
                 is_favorite=False,
-                notes="",
                 cover_url=cover_url,
                 genre=genre,
                 isbn=isbn,
@@ -185,3 +268,16 @@ def build_google_id(raw: dict[str, Any], title: str, author: str) -> str:
     seed = f"{title}|{author}"
     digest = hashlib.sha1(seed.encode("utf-8")).hexdigest()
     return f"google:{digest}"
+
+
+def index_by_isbn(
+    items: Sequence[LibraryItem], isbns: Sequence[str]
+) -> Dict[str, LibraryItem]:
+    wanted = set(isbns)
+    found: Dict[str, LibraryItem] = {}
+    for item in items:
+        isbn = to_isbn13(item.isbn)
+        if isbn is None or isbn not in wanted or isbn in found:
+            continue
+        found[isbn] = item
+    return found
@@ -3,15 +3,23 @@ from __future__ import annotations
 import hashlib
 import re
 import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Sequence
 
 import requests
 
 from domain.errors import SearchServiceError
+from domain.isbn import to_isbn13
 from domain.models import LibraryItem
-from domain.search import SearchQuery, SearchResult
+from domain.search import (
+    SEARCH_DATE_FILTERS,
+    SEARCH_TEXT_FILTERS,
+    SearchQuery,
+    SearchResult,
+    includes_field,
+)
 from domain.series_identity import extract_volume_number
-from domain.services import BookSearchService
+from domain.services import BookSearchService, IsbnLookupService, RateLimiter
+from infrastructure.search.provider_http import ProviderHttpClient
 
 NS = {
     "dc": "http://purl.org/dc/elements/1.1/",
@@ -22,13 +30,25 @@ NS = {
 XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
 
 
-class NDLOpenSearchService(BookSearchService):
+class NDLOpenSearchService(BookSearchService, IsbnLookupService):
+    name = "ndl"
+    search_filters = SEARCH_TEXT_FILTERS | SEARCH_DATE_FILTERS
+
     def __init__(
-        self, endpoint: str, thumbnail_base: str, timeout_seconds: int = 10
+        self,
+        endpoint: str,
+        thumbnail_base: str,
+        timeout_seconds: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_wait_seconds: float = 0.0,
+        http_client: Optional[ProviderHttpClient] = None,
     ) -> None:
         self._endpoint = endpoint
         self._thumbnail_base = thumbnail_base
         self._timeout_seconds = timeout_seconds
+        self._rate_limiter = rate_limiter
+        self._rate_limit_wait_seconds = rate_limit_wait_seconds
+        self._http = http_client or ProviderHttpClient()
 
     def search(self, query: SearchQuery) -> SearchResult:
         page = max(query.page, 1)
@@ -54,22 +74,52 @@ class NDLOpenSearchService(BookSearchService):
         if query.until:
             params["until"] = query.until.isoformat()
 
+        content = self._request(params)
+        with self._http.decoding(self.name):
+            items, total = parse_opensearch(content, self._thumbnail_base, query.fields)
+        return SearchResult(items=items, total=total, page=page, limit=limit)
+
+    def lookup_isbns(self, isbns: Sequence[str]) -> Dict[str, LibraryItem]:
+        found: Dict[str, LibraryItem] = {}
+        for isbn in isbns:
+            content = self._request(
+                {
+                    "cnt": "5",
+                    "dpgroupid": "book",
+                    "mediatype": "books",
+                    "isbn": isbn,
+                }
+            )
+            with self._http.decoding(self.name):
+                items, _total = parse_opensearch(content, self._thumbnail_base)
+            for item in items:
+                if to_isbn13(item.isbn) == isbn:
+                    found[isbn] = item
+                    break
+        return found
+
+    def _request(self, params: dict[str, str]) -> bytes:
+        if self._rate_limiter is not None and not self._rate_limiter.try_acquire(
+            self.name, self._rate_limit_wait_seconds
+        ):
+            raise SearchServiceError("検索APIの利用上限に達しています。")
+
         try:
-            response = requests.get(
-                self._endpoint, params=params, timeout=self._timeout_seconds
+            response = self._http.get(
+                self.name, self._endpoint, params, self._timeout_seconds
             )
         except requests.RequestException as exc:
             raise SearchServiceError("検索APIに接続できませんでした。") from exc
 
         if response.status_code != 200:
             raise SearchServiceError("検索APIからの応答が不正です。")
-
-        items, total = parse_opensearch(response.content, self._thumbnail_base)
-        return SearchResult(items=items, total=total, page=page, limit=limit)
+        return response.content
 
 
 def parse_opensearch(
-    xml_bytes: bytes, thumbnail_base: str
+    xml_bytes: bytes,
+    thumbnail_base: str,
+    fields: Optional[FrozenSet[str]] = None,
 ) -> tuple[List[LibraryItem], int]:
     root = ET.fromstring(xml_bytes)
     channel = root.find("channel")
@@ -82,6 +132,10 @@ def parse_opensearch(
     except ValueError:
         total = 0
 
+    with_cover = includes_field(fields, "cover_url")
+    with_genre = includes_field(fields, "genre")
+    with_latest_volume = includes_field(fields, "latest_volume")
+
     items: List[LibraryItem] = []
     for item in channel.findall("item"):
         title = find_text(item, "dc:title") or find_text(item, "title")
@@ -91,15 +145,19 @@ def parse_opensearch(
         publisher = find_text(item, "dc:publisher")
         issued = find_text(item, "dcterms:issued")
         link = find_text(item, "link")
-        subjects = [
-            node.text.strip()
-            for node in item.findall("dc:subject", NS)
-            if node.text and node.text.strip()
-        ]
+        subjects: List[str] = []
+        if with_genre:
+            subjects = [
+                node.text.strip()
+                for node in item.findall("dc:subject", NS)
+                if node.text and node.text.strip()
+            ]
         isbn = extract_isbn(item)
         seed = link or isbn or f"{title}|{author}|{publisher}|{issued}"
         item_id = build_ndl_id(seed)
-        latest_volume = extract_volume_number(title) or 1
+        latest_volume = 1
+        if with_latest_volume:
+            latest_volume = extract_volume_number(title) or 1
 
         items.append(
             LibraryItem(
@@ -112,8 +170,7 @@ def parse_opensearch(
                 owned_volumes=[],
                 next_release_date=None,
                 is_favorite=False,
-                notes="",
-                cover_url=build_cover_url(thumbnail_base, isbn),
+                cover_url=build_cover_url(thumbnail_base, isbn) if with_cover else "",
                 genre=subjects,
                 isbn=isbn,
                 source="ndl",
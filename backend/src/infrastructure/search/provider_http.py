@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Mapping, Optional
+
+import requests
+
+from domain.cancellation import is_cancelled, raise_if_cancelled
+from domain.errors import OperationCancelledError, SearchOverloadedError
+from infrastructure.admission import ConcurrencyLimiter
+from infrastructure.metrics import MetricsRegistry
+
+
+class ProviderHttpClient:
+    def __init__(
+        self,
+        metrics: Optional[MetricsRegistry] = None,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        queue_timeout_seconds: float = 0.0,
+    ) -> None:
+        self._metrics = metrics
+        self._limiter = limiter
+        self._queue_timeout_seconds = queue_timeout_seconds
+
+    def get(
+        self,
+        provider: str,
+        endpoint: str,
+        params: Mapping[str, Any],
+        timeout_seconds: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        raise_if_cancelled()
+        if self._limiter is None:
+            return self._fetch(provider, endpoint, params, timeout_seconds, headers)
+        if not self._limiter.acquire(provider, self._queue_timeout_seconds):
+            raise SearchOverloadedError("検索APIの同時接続数が上限に達しています。")
+        try:
+            return self._fetch(provider, endpoint, params, timeout_seconds, headers)
+        finally:
+            self._limiter.release(provider)
+
+    @contextmanager
+    def decoding(self, provider: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._metrics is not None:
+                self._metrics.increment(
+                    "provider_decode_seconds_total",
+                    time.perf_counter() - started,
+                    provider=provider,
+                )
+
+    def _fetch(
+        self,
+        provider: str,
+        endpoint: str,
+        params: Mapping[str, Any],
+        timeout_seconds: float,
+        headers: Optional[Mapping[str, str]],
+    ) -> requests.Response:
+        response = requests.get(
+            endpoint,
+            params=params,
+            headers=headers,
+            timeout=timeout_seconds,
+            stream=True,
+        )
+        if is_cancelled():
+            response.close()
+            if self._metrics is not None:
+                self._metrics.increment(
+                    "provider_responses_cancelled_total", provider=provider
+                )
+            raise OperationCancelledError("呼び出し元が処理を中断しました。")
+        content = response.content
+        if self._metrics is not None:
+            self._metrics.increment("provider_responses_total", provider=provider)
+            self._metrics.increment(
+                "provider_response_wire_bytes_total",
+                wire_bytes(response, len(content)),
+                provider=provider,
+            )
+            self._metrics.increment(
+                "provider_response_bytes_total", len(content), provider=provider
+            )
+        return response
+
+
+def wire_bytes(response: requests.Response, fallback: int) -> int:
+    raw = getattr(response, "raw", None)
+    tell = getattr(raw, "tell", None)
+    if callable(tell):
+        try:
+            value = int(tell())
+        except (OSError, TypeError, ValueError):
+            value = 0
+        if value > 0:
+            return value
+    return fallback
@@ -1,32 +1,42 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
 
 import requests
 
 from domain.errors import SearchServiceError
+from domain.isbn import to_isbn13
 from domain.models import LibraryItem
-from domain.search import SearchQuery, SearchResult
+from domain.search import SearchQuery, SearchResult, includes_field
 from domain.series_identity import extract_volume_number
-from domain.services import BookSearchService
+from domain.services import BookSearchService, IsbnLookupService, RateLimiter
+from infrastructure.search.provider_http import ProviderHttpClient
 
 MAX_HITS = 30
 MAX_PAGE = 100
 
 
-class RakutenBooksService(BookSearchService):
+class RakutenBooksService(BookSearchService, IsbnLookupService):
+    name = "rakuten"
+
     def __init__(
         self,
         endpoint: str,
         application_id: str,
         timeout_seconds: int = 10,
         default_size: int = 9,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_wait_seconds: float = 0.0,
+        http_client: Optional[ProviderHttpClient] = None,
     ) -> None:
         self._endpoint = endpoint
         self._application_id = application_id
         self._timeout_seconds = timeout_seconds
         self._default_size = default_size
+        self._rate_limiter = rate_limiter
+        self._rate_limit_wait_seconds = rate_limit_wait_seconds
+        self._http = http_client or ProviderHttpClient()
 
     def search(self, query: SearchQuery) -> SearchResult:
         if not self._application_id:
@@ -41,6 +51,7 @@ class RakutenBooksService(BookSearchService):
             "size": self._default_size,
             "hits": limit,
             "page": page,
+            "elements": build_elements_param(query.fields),
         }
 
         title = query.title or query.q
@@ -51,9 +62,45 @@ class RakutenBooksService(BookSearchService):
         if query.publisher:
             params["publisherName"] = query.publisher
 
+        data = self._request(params)
+        raw_items = extract_items(data)
+        total = extract_total(data, len(raw_items))
+        with self._http.decoding(self.name):
+            items = build_items(raw_items, query.fields)
+        return SearchResult(items=items, total=total, page=page, limit=limit)
+
+    def lookup_isbns(self, isbns: Sequence[str]) -> Dict[str, LibraryItem]:
+        found: Dict[str, LibraryItem] = {}
+        for isbn in isbns:
+            data = self._request(
+                {
+                    "applicationId": self._application_id,
+                    "formatVersion": 2,
+                    "isbn": isbn,
+                    "hits": 1,
+                    "elements": build_elements_param(),
+                }
+            )
+            with self._http.decoding(self.name):
+                items = build_items(extract_items(data))
+            for item in items:
+                if to_isbn13(item.isbn) == isbn:
+                    found[isbn] = item
+                    break
+        return found
+
+    def _request(self, params: dict[str, Any]) -> dict[str, Any]:
+        if not self._application_id:
+            raise SearchServiceError("楽天ブックスAPIの設定が不足しています。")
+
+        if self._rate_limiter is not None and not self._rate_limiter.try_acquire(
+            self.name, self._rate_limit_wait_seconds
+        ):
+            raise SearchServiceError("楽天ブックスAPIの利用上限に達しています。")
+
         try:
-            response = requests.get(
-                self._endpoint, params=params, timeout=self._timeout_seconds
+            response = self._http.get(
+                self.name, self._endpoint, params, self._timeout_seconds
             )
         except requests.RequestException as exc:
             raise SearchServiceError("楽天ブックスAPIに接続できませんでした。") from exc
@@ -62,20 +109,30 @@ class RakutenBooksService(BookSearchService):
             raise SearchServiceError("楽天ブックスAPIからの応答が不正です。")
 
         try:
-            data = response.json()
+            with self._http.decoding(self.name):
+                data = response.json()
         except ValueError as exc:
             raise SearchServiceError("楽天ブックスAPIの応答が不正です。") from exc
-
-        raw_items = extract_items(data)
-        total = extract_total(data, len(raw_items))
-        items = build_items(raw_items)
-        return SearchResult(items=items, total=total, page=page, limit=limit)
+        if not isinstance(data, dict):
+            raise SearchServiceError("楽天ブックスAPIの応答が不正です。")
+        return data
 
 
 def clamp(value: int, minimum: int, maximum: int) -> int:
     return max(minimum, min(value, maximum))
 
 
+def build_elements_param(fields: Optional[FrozenSet[str]] = None) -> str:
+    elements = ["count", "title", "author", "isbn", "itemUrl"]
+    if includes_field(fields, "publisher"):
+        elements.append("publisherName")
+    if includes_field(fields, "published_date"):
+        elements.append("salesDate")
+    if includes_field(fields, "cover_url"):
+        elements.extend(["largeImageUrl", "mediumImageUrl", "smallImageUrl"])
+    return ",".join(elements)
+
+
 def extract_items(data: dict[str, Any]) -> List[dict[str, Any]]:
     raw_items = data.get("items") or data.get("Items") or []
     items: List[dict[str, Any]] = []
@@ -101,23 +158,38 @@ def extract_total(data: dict[str, Any], fallback: int) -> int:
     return fallback
 
 
-def build_items(raw_items: List[dict[str, Any]]) -> List[LibraryItem]:
+def build_items(
+    raw_items: List[dict[str, Any]], fields: Optional[FrozenSet[str]] = None
+) -> List[LibraryItem]:
+    with_publisher = includes_field(fields, "publisher")
+    with_published_date = includes_field(fields, "published_date")
+    with_cover = includes_field(fields, "cover_url")
+    with_latest_volume = includes_field(fields, "latest_volume")
+
     items: List[LibraryItem] = []
     for raw in raw_items:
         title = str(raw.get("title") or "").strip()
         if not title:
             continue
         author = str(raw.get("author") or "").strip()
-        publisher = str(raw.get("publisherName") or "").strip() or None
-        sales_date = str(raw.get("salesDate") or "").strip() or None
+        publisher = None
+        if with_publisher:
+            publisher = str(raw.get("publisherName") or "").strip() or None
+        sales_date = None
+        if with_published_date:
+            sales_date = str(raw.get("salesDate") or "").strip() or None
         isbn = str(raw.get("isbn") or "").strip() or None
         item_url = str(raw.get("itemUrl") or "").strip() or None
-        cover_url = (
-            str(raw.get("largeImageUrl") or "").strip()
-            or str(raw.get("mediumImageUrl") or "").strip()
-            or str(raw.get("smallImageUrl") or "").strip()
-        )
-        latest_volume = extract_volume_number(title) or 1
+        cover_url = ""
+        if with_cover:
+            cover_url = (
+                str(raw.get("largeImageUrl") or "").strip()
+                or str(raw.get("mediumImageUrl") or "").strip()
+                or str(raw.get("smallImageUrl") or "").strip()
+            )
+        latest_volume = 1
+        if with_latest_volume:
+            latest_volume = extract_volume_number(title) or 1
 
         items.append(
             LibraryItem(
@@ -130,7 +202,6 @@ def build_items(raw_items: List[dict[str, Any]]) -> List[LibraryItem]:
                 owned_volumes=[],
                 next_release_date=None,
                 is_favorite=False,
-                notes="",
                 cover_url=cover_url,
                 genre=[],
                 isbn=isbn,
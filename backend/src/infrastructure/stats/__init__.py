@@ -0,0 +1 @@
+"""Library statistics adapters."""
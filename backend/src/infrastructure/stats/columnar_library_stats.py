@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from domain.library_stats import (
+    LibraryStats,
+    SeriesCompletion,
+    StatsBucket,
+    least_complete,
+    month_buckets,
+    month_index,
+    owned_volume_count,
+    rank_buckets,
+    release_month,
+)
+from domain.models import LibraryItem
+from domain.services import LibraryStatsIndex
+
+INITIAL_CAPACITY = 256
+INITIAL_GENRES = 16
+
+
+class _Codes:
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: Optional[str]) -> int:
+        key = (value or "").strip()
+        if not key:
+            return -1
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self._codes[key] = code
+            self.values.append(key)
+        return code
+
+
+class ColumnarLibraryStatsIndex(LibraryStatsIndex):
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self._capacity = max(capacity, 1)
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._used = 0
+        self._ids: List[str] = []
+        self._titles: List[str] = []
+        self._authors = _Codes()
+        self._publishers = _Codes()
+        self._genres = _Codes()
+        self._alive = np.zeros(self._capacity, dtype=bool)
+        self._author = np.full(self._capacity, -1, dtype=np.int32)
+        self._publisher = np.full(self._capacity, -1, dtype=np.int32)
+        self._owned = np.zeros(self._capacity, dtype=np.int32)
+        self._latest = np.ones(self._capacity, dtype=np.int32)
+        self._favorite = np.zeros(self._capacity, dtype=bool)
+        self._release_month = np.full(self._capacity, -1, dtype=np.int32)
+        self._release_day = np.zeros(self._capacity, dtype=np.int8)
+        self._genre = np.zeros((self._capacity, INITIAL_GENRES), dtype=bool)
+
+    def reset(self, items: Sequence[LibraryItem]) -> None:
+        self._rows = {}
+        self._free = []
+        self._used = 0
+        self._ids = []
+        self._titles = []
+        self._authors = _Codes()
+        self._publishers = _Codes()
+        self._genres = _Codes()
+        self._alive[:] = False
+        self._genre[:] = False
+        self.update(items, ())
+
+    def update(self, items: Sequence[LibraryItem], deleted: Sequence[str]) -> None:
+        for item_id in deleted:
+            row = self._rows.pop(item_id, None)
+            if row is None:
+                continue
+            self._alive[row] = False
+            self._genre[row] = False
+            self._free.append(row)
+        for item in items:
+            self._write(self._row_for(item.id), item)
+
+    def aggregate(self, today: date, limit: int) -> LibraryStats:
+        used = self._used
+        alive = self._alive[:used]
+        owned = self._owned[:used]
+        latest = self._latest[:used]
+        ratio = np.minimum(owned / np.maximum(latest, 1), 1.0)
+
+        month = self._release_month[:used]
+        current = month_index(today)
+        upcoming = alive & (
+            (month > current)
+            | (
+                (month == current)
+                & (
+                    (self._release_day[:used] == 0)
+                    | (self._release_day[:used] >= today.day)
+                )
+            )
+        )
+        upcoming_counts = np.bincount(month[upcoming] - current)
+
+        live_rows = np.flatnonzero(alive)
+        series = int(live_rows.size)
+        candidates = live_rows
+        if series > limit:
+            live_ratio = ratio[live_rows]
+            threshold = np.partition(live_ratio, limit - 1)[limit - 1]
+            candidates = live_rows[live_ratio <= threshold]
+        completion = least_complete(
+            (
+                SeriesCompletion(
+                    item_id=self._ids[row],
+                    title=self._titles[row],
+                    owned_volumes=int(owned[row]),
+                    latest_volume=int(latest[row]),
+                    ratio=float(ratio[row]),
+                )
+                for row in candidates.tolist()
+            ),
+            limit,
+        )
+        genre_counts = self._genre[:used][alive].sum(axis=0)
+        return LibraryStats(
+            revision=0,
+            series=series,
+            owned_volumes=int(owned[alive].sum()),
+            favorites=int(np.count_nonzero(self._favorite[:used] & alive)),
+            completed_series=int(np.count_nonzero((owned >= latest) & alive)),
+            average_completion=float(ratio[alive].mean()) if series else 0.0,
+            volumes_by_author=self._ranked(self._authors, self._author, limit),
+            volumes_by_publisher=self._ranked(self._publishers, self._publisher, limit),
+            completion=completion,
+            upcoming_releases=month_buckets(
+                {
+                    current + offset: int(count)
+                    for offset, count in enumerate(upcoming_counts.tolist())
+                }
+            ),
+            genres=rank_buckets(
+                {
+                    genre: int(genre_counts[code])
+                    for code, genre in enumerate(self._genres.values)
+                },
+                limit,
+            ),
+        )
+
+    def _ranked(self, codes: _Codes, column: Any, limit: int) -> List[StatsBucket]:
+        used = self._used
+        valid = self._alive[:used] & (column[:used] >= 0)
+        totals = np.bincount(
+            column[:used][valid],
+            weights=self._owned[:used][valid],
+            minlength=len(codes),
+        )
+        return rank_buckets(
+            {value: int(totals[code]) for code, value in enumerate(codes.values)},
+            limit,
+        )
+
+    def _row_for(self, item_id: str) -> int:
+        row = self._rows.get(item_id)
+        if row is not None:
+            return row
+        if self._free:
+            row = self._free.pop()
+            self._ids[row] = item_id
+        else:
+            row = self._used
+            if row >= self._capacity:
+                self._grow_rows(self._capacity * 2)
+            self._used += 1
+            self._ids.append(item_id)
+            self._titles.append("")
+        self._rows[item_id] = row
+        return row
+
+    def _write(self, row: int, item: LibraryItem) -> None:
+        self._titles[row] = item.title
+        self._alive[row] = True
+        self._author[row] = self._authors.code(item.author)
+        self._publisher[row] = self._publishers.code(item.publisher)
+        self._owned[row] = owned_volume_count(item)
+        self._latest[row] = item.latest_volume
+        self._favorite[row] = item.is_favorite
+        self._release_month[row], self._release_day[row] = release_month(
+            item.next_release_date
+        )
+        genres = [self._genres.code(genre) for genre in item.genre]
+        if len(self._genres) > self._genre.shape[1]:
+            self._grow_genres(max(len(self._genres), self._genre.shape[1] * 2))
+        self._genre[row] = False
+        self._genre[row, [code for code in genres if code >= 0]] = True
+
+    def _grow_rows(self, capacity: int) -> None:
+        extra = capacity - self._capacity
+        self._alive = np.concatenate([self._alive, np.zeros(extra, dtype=bool)])
+        self._author = np.concatenate(
+            [self._author, np.full(extra, -1, dtype=np.int32)]
+        )
+        self._publisher = np.concatenate(
+            [self._publisher, np.full(extra, -1, dtype=np.int32)]
+        )
+        self._owned = np.concatenate([self._owned, np.zeros(extra, dtype=np.int32)])
+        self._latest = np.concatenate([self._latest, np.ones(extra, dtype=np.int32)])
+        self._favorite = np.concatenate([self._favorite, np.zeros(extra, dtype=bool)])
+        self._release_month = np.concatenate(
+            [self._release_month, np.full(extra, -1, dtype=np.int32)]
+        )
+        self._release_day = np.concatenate(
+            [self._release_day, np.zeros(extra, dtype=np.int8)]
+        )
+        self._genre = np.concatenate(
+            [self._genre, np.zeros((extra, self._genre.shape[1]), dtype=bool)]
+        )
+        self._capacity = capacity
+
+    def _grow_genres(self, columns: int) -> None:
+        extra = columns - self._genre.shape[1]
+        self._genre = np.concatenate(
+            [self._genre, np.zeros((self._capacity, extra), dtype=bool)], axis=1
+        )
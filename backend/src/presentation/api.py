@@ -1,30 +1,185 @@
 from __future__ import annotations
 
-from typing import Any, cast
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, cast
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from application.commands.create_library_backup import CreateLibraryBackupCommand
+from application.commands.refresh_suggestion_catalog import (
+    RefreshSuggestionCatalogCommand,
+)
+from application.commands.run_library_import import RunLibraryImportCommand
 from infrastructure.config import get_settings
+from infrastructure.scheduling.periodic_task import PeriodicTask
+from presentation.dependencies import (
+    get_compact_library_changes_command,
+    get_compact_library_changes_handler,
+    get_create_library_backup_handler,
+    get_import_job_repository,
+    get_import_job_runner,
+    get_library_change_broker,
+    get_library_reader_pool,
+    get_library_shards,
+    get_library_writer_pool,
+    get_refresh_suggestion_catalog_handler,
+    get_run_library_import_handler,
+    get_search_prefetch_scheduler,
+    get_search_providers,
+    get_series_catalog_repository,
+    get_track_new_releases_command,
+    get_track_new_releases_handler,
+    list_library_tenant_ids,
+)
+from presentation.library_shards import LibraryShard
+from presentation.routers.admin import router as admin_router
+from presentation.routers.backups import router as backups_router
+from presentation.routers.covers import router as covers_router
 from presentation.routers.health import router as health_router
+from presentation.routers.imports import router as imports_router
+from presentation.routers.isbn import router as isbn_router
 from presentation.routers.library import router as library_router
+from presentation.routers.metrics import router as metrics_router
 from presentation.routers.search import router as search_router
+from presentation.routers.stats import router as stats_router
+from presentation.routers.suggest import router as suggest_router
+
+logger = logging.getLogger(__name__)
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
 
-    app = FastAPI(title="MangaShelf API")
+    app = FastAPI(title="MangaShelf API", lifespan=lifespan)
     # ty currently flags CORSMiddleware's type; cast keeps runtime behavior intact.
     app.add_middleware(
         cast(Any, CORSMiddleware),
         allow_origins=list(settings.cors_origins),
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
 
     app.include_router(health_router)
     app.include_router(library_router)
     app.include_router(search_router)
+    app.include_router(suggest_router)
+    app.include_router(stats_router)
+    app.include_router(isbn_router)
+    app.include_router(imports_router)
+    app.include_router(covers_router)
+    app.include_router(admin_router)
+    app.include_router(backups_router)
+    app.include_router(metrics_router)
 
     return app
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    get_search_providers()
+    tasks: list[PeriodicTask] = [
+        PeriodicTask(
+            name="library-compaction",
+            action=run_library_compaction,
+            interval_seconds=settings.library_compaction_interval_seconds,
+            initial_delay_seconds=min(
+                300.0, settings.library_compaction_interval_seconds
+            ),
+        )
+    ]
+    if settings.suggest_catalog_refresh_seconds > 0:
+        tasks.append(
+            PeriodicTask(
+                name="suggestion-catalog",
+                action=run_suggestion_catalog_refresh,
+                interval_seconds=settings.suggest_catalog_refresh_seconds,
+            )
+        )
+    if settings.backup_enabled:
+        tasks.append(
+            PeriodicTask(
+                name="library-backup",
+                action=run_library_backup,
+                interval_seconds=settings.backup_interval_seconds,
+                initial_delay_seconds=min(120.0, settings.backup_interval_seconds),
+            )
+        )
+    if settings.release_tracker_enabled:
+        tasks.append(
+            PeriodicTask(
+                name="release-tracker",
+                action=run_release_tracker,
+                interval_seconds=settings.release_tracker_interval_seconds,
+                initial_delay_seconds=min(
+                    60.0, settings.release_tracker_interval_seconds
+                ),
+            )
+        )
+
+    for task in tasks:
+        task.start()
+    resume_library_imports()
+    try:
+        yield
+    finally:
+        for task in tasks:
+            await task.stop()
+        await asyncio.to_thread(get_import_job_runner().shutdown)
+        await asyncio.to_thread(get_search_prefetch_scheduler().shutdown)
+        await asyncio.to_thread(get_series_catalog_repository().flush)
+        await asyncio.to_thread(get_library_writer_pool().shutdown)
+        await asyncio.to_thread(get_library_reader_pool().shutdown)
+        broker = get_library_change_broker()
+        if broker is not None:
+            broker.stop()
+
+
+def run_release_tracker() -> None:
+    command = get_track_new_releases_command()
+    for_each_library_shard(
+        "release-tracker",
+        lambda shard: get_track_new_releases_handler(shard).handle(command),
+    )
+
+
+def run_library_compaction() -> None:
+    command = get_compact_library_changes_command()
+    for_each_library_shard(
+        "library-compaction",
+        lambda shard: get_compact_library_changes_handler(shard).handle(command),
+    )
+
+
+def run_library_backup() -> None:
+    for_each_library_shard(
+        "library-backup",
+        lambda shard: get_create_library_backup_handler(shard).handle(
+            CreateLibraryBackupCommand()
+        ),
+    )
+
+
+def for_each_library_shard(name: str, action: Callable[[LibraryShard], object]) -> None:
+    shards = get_library_shards()
+    for tenant_id in list_library_tenant_ids():
+        try:
+            action(shards.get(tenant_id))
+        except Exception:
+            logger.exception("本棚 %s の定期処理 %s に失敗しました。", tenant_id, name)
+
+
+def run_suggestion_catalog_refresh() -> None:
+    get_refresh_suggestion_catalog_handler().handle(RefreshSuggestionCatalogCommand())
+
+
+def resume_library_imports() -> None:
+    runner = get_import_job_runner()
+    handler = get_run_library_import_handler()
+    for job in get_import_job_repository().list_unfinished():
+        command = RunLibraryImportCommand(job.job_id)
+        runner.submit(lambda command=command: handler.handle(command))
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, TypeVar
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+
+from domain.cancellation import CancellationToken, cancellation_scope
+
+DISCONNECT_POLL_SECONDS = 0.05
+
+T = TypeVar("T")
+
+
+async def run_until_disconnected(
+    request: Request,
+    action: Callable[[], T],
+    poll_seconds: float = DISCONNECT_POLL_SECONDS,
+) -> T:
+    token = CancellationToken()
+
+    def run() -> T:
+        with cancellation_scope(token):
+            return action()
+
+    task = asyncio.ensure_future(run_in_threadpool(run))
+    try:
+        while not task.done():
+            await asyncio.wait({task}, timeout=poll_seconds)
+            if task.done() or token.cancelled:
+                continue
+            if await request.is_disconnected():
+                token.cancel()
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
+    return task.result()
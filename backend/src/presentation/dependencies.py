@@ -1,30 +1,352 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from functools import lru_cache
+from pathlib import Path
 
+from fastapi import Depends, Header, HTTPException, Query
+
+from application.commands.compact_library_changes import (
+    CompactLibraryChangesCommand,
+    CompactLibraryChangesHandler,
+)
+from application.commands.create_library_backup import CreateLibraryBackupHandler
+from application.commands.create_library_import import CreateLibraryImportHandler
 from application.commands.delete_library_item import DeleteLibraryItemHandler
+from application.commands.prefetch_cover_image import PrefetchCoverImageHandler
+from application.commands.prefetch_search_page import (
+    PREFETCH_BUDGET_KEY,
+    PrefetchSearchPageHandler,
+)
+from application.commands.record_series_catalog import RecordSeriesCatalogHandler
+from application.commands.refresh_suggestion_catalog import (
+    RefreshSuggestionCatalogHandler,
+)
+from application.commands.restore_library_backup import RestoreLibraryBackupHandler
+from application.commands.run_library_import import RunLibraryImportHandler
+from application.commands.track_new_releases import (
+    TrackNewReleasesCommand,
+    TrackNewReleasesHandler,
+)
+from application.commands.update_library_notes import UpdateLibraryNotesHandler
 from application.commands.upsert_library_item import UpsertLibraryItemHandler
-from application.queries.get_library import GetLibraryHandler
+from application.queries.explain_search import ExplainSearchHandler
+from application.queries.find_series_duplicates import FindSeriesDuplicatesHandler
+from application.queries.get_cover_image import GetCoverImageHandler
+from application.queries.get_import_job import GetImportJobHandler
+from application.queries.get_library import GetLibrarySnapshotHandler
+from application.queries.get_library_changes import GetLibraryChangesHandler
+from application.queries.get_library_item import GetLibraryItemHandler
+from application.queries.get_library_stats import GetLibraryStatsHandler
+from application.queries.get_missing_volumes import GetMissingVolumesHandler
+from application.queries.list_library_backups import ListLibraryBackupsHandler
+from application.queries.lookup_isbns import LookupIsbnsHandler
 from application.queries.search_books import SearchBooksHandler
-from domain.repositories import LibraryRepository
-from domain.services import BookSearchService
+from application.queries.suggest_titles import SuggestTitlesHandler
+from application.queries.verify_library_backup import VerifyLibraryBackupHandler
+from domain.backups import BackupRetentionPolicy
+from domain.repositories import (
+    ImportJobRepository,
+    IsbnLookupCacheRepository,
+    LibraryRepository,
+    SearchResultCacheRepository,
+    SeriesCatalogRepository,
+)
+from domain.services import (
+    BookSearchService,
+    CoverImageStore,
+    IsbnLookupService,
+    RateLimiter,
+    SearchPlanner,
+)
+from domain.suggestions import PrefixIndex
+from domain.tenants import DEFAULT_TENANT_ID, normalize_tenant_id
+from infrastructure.admission import (
+    AsyncConcurrencyLimiter,
+    ConcurrencyLimit,
+    ConcurrencyLimiter,
+)
 from infrastructure.config import get_settings
+from infrastructure.covers.disk_cover_cache import DiskCoverCache
+from infrastructure.metrics import MetricsRegistry
+from infrastructure.persistence.content_addressed_backup_repository import (
+    ContentAddressedBackupRepository,
+)
+from infrastructure.persistence.executor_async_library_repository import (
+    ExecutorAsyncLibraryRepository,
+)
+from infrastructure.persistence.in_memory_search_result_cache import (
+    InMemorySearchResultCache,
+)
+from infrastructure.persistence.json_import_job_repository import (
+    JsonImportJobRepository,
+)
+from infrastructure.persistence.json_isbn_cache_repository import (
+    JsonIsbnCacheRepository,
+)
 from infrastructure.persistence.json_library_repository import JsonLibraryRepository
+from infrastructure.persistence.json_release_tracker_progress_repository import (
+    JsonReleaseTrackerProgressRepository,
+)
+from infrastructure.persistence.json_series_catalog_repository import (
+    JsonSeriesCatalogRepository,
+)
+from infrastructure.persistence.library_change_channel import (
+    CHANGE_CHANNEL_FILE,
+    CHANGE_CHANNEL_LOCAL,
+    LibraryChangeBroker,
+    LocalLibraryChangeBroker,
+    RevisionFileChangeBroker,
+)
+from infrastructure.rate_limit import (
+    FileTokenBucketStore,
+    RateBudget,
+    TokenBucketRateLimiter,
+    TokenBucketStore,
+)
+from infrastructure.scheduling.background_jobs import BackgroundJobRunner
+from infrastructure.scheduling.prefetch_scheduler import PrefetchScheduler
 from infrastructure.search.composite_search_service import CompositeBookSearchService
 from infrastructure.search.google_books_service import GoogleBooksService
 from infrastructure.search.ndl_opensearch_service import NDLOpenSearchService
+from infrastructure.search.provider_http import ProviderHttpClient
 from infrastructure.search.rakuten_books_service import RakutenBooksService
+from infrastructure.stats.columnar_library_stats import ColumnarLibraryStatsIndex
+from presentation.library_response_cache import LibraryResponseCache
+from presentation.library_shards import LibraryShard, LibraryShardRegistry
+from presentation.schemas import parse_library_fields
+
+SEARCH_ADMISSION_KEY = "search"
+TENANT_BACKUPS_DIR = "tenants"
+
+
+@lru_cache
+def get_library_change_broker() -> LibraryChangeBroker | None:
+    settings = get_settings()
+    if settings.library_change_channel == CHANGE_CHANNEL_FILE:
+        return RevisionFileChangeBroker(settings.library_change_poll_seconds)
+    if settings.library_change_channel == CHANGE_CHANNEL_LOCAL:
+        return LocalLibraryChangeBroker()
+    return None
+
+
+def build_json_library_repository(data_file: Path) -> JsonLibraryRepository:
+    broker = get_library_change_broker()
+    return JsonLibraryRepository(
+        data_file,
+        change_channel=broker.channel(data_file) if broker is not None else None,
+        metrics=get_metrics_registry(),
+    )
 
 
 @lru_cache
 def get_library_repository() -> LibraryRepository:
     settings = get_settings()
-    return JsonLibraryRepository(settings.data_file)
+    return build_json_library_repository(settings.data_file)
 
 
 @lru_cache
-def get_search_service() -> BookSearchService:
+def get_library_reader_pool() -> ThreadPoolExecutor:
+    settings = get_settings()
+    return ThreadPoolExecutor(
+        max_workers=max(settings.library_reader_workers, 1),
+        thread_name_prefix="library-reader",
+    )
+
+
+@lru_cache
+def get_library_writer_pool() -> ThreadPoolExecutor:
+    settings = get_settings()
+    return ThreadPoolExecutor(
+        max_workers=max(settings.library_writer_workers, 1),
+        thread_name_prefix="library-writer",
+    )
+
+
+def build_library_shard(tenant_id: str) -> LibraryShard:
+    settings = get_settings()
+    if tenant_id == DEFAULT_TENANT_ID:
+        repository = get_library_repository()
+        backup_dir = settings.backup_dir
+        release_progress_file = settings.release_tracker_progress_file
+    else:
+        shard_dir = settings.library_shards_dir / tenant_id
+        repository = build_json_library_repository(shard_dir / "library.json")
+        backup_dir = settings.backup_dir / TENANT_BACKUPS_DIR / tenant_id
+        release_progress_file = shard_dir / "release_tracker.json"
+    return LibraryShard(
+        tenant_id=tenant_id,
+        repository=repository,
+        async_repository=ExecutorAsyncLibraryRepository(
+            repository, get_library_reader_pool(), get_library_writer_pool()
+        ),
+        response_cache=LibraryResponseCache(GetLibrarySnapshotHandler(repository)),
+        stats_handler=GetLibraryStatsHandler(repository, ColumnarLibraryStatsIndex()),
+        suggest_handler=SuggestTitlesHandler(
+            repository, PrefixIndex(), get_catalog_suggestion_index()
+        ),
+        backup_repository=ContentAddressedBackupRepository(backup_dir),
+        release_progress_repository=JsonReleaseTrackerProgressRepository(
+            release_progress_file
+        ),
+    )
+
+
+@lru_cache
+def get_library_shards() -> LibraryShardRegistry:
+    settings = get_settings()
+    return LibraryShardRegistry(
+        build_library_shard,
+        max_open_shards=settings.library_max_open_shards,
+        metrics=get_metrics_registry(),
+    )
+
+
+def get_tenant_id(x_user_id: str | None = Header(None)) -> str:
+    try:
+        return normalize_tenant_id(x_user_id)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail="X-User-Id は英数字・-・_ の 64 文字以内で指定してください。",
+        ) from exc
+
+
+def get_library_shard(tenant_id: str = Depends(get_tenant_id)) -> LibraryShard:
+    return get_library_shards().get(tenant_id)
+
+
+def list_library_tenant_ids() -> list[str]:
+    settings = get_settings()
+    tenant_ids = {DEFAULT_TENANT_ID}
+    if settings.library_shards_dir.is_dir():
+        for path in settings.library_shards_dir.iterdir():
+            if not (path / "library.json").is_file():
+                continue
+            try:
+                tenant_id = normalize_tenant_id(path.name)
+            except ValueError:
+                continue
+            if tenant_id == path.name:
+                tenant_ids.add(tenant_id)
+    return sorted(tenant_ids)
+
+
+def get_library_repository_for(tenant_id: str) -> LibraryRepository:
+    return get_library_shards().get(tenant_id).repository
+
+
+@lru_cache
+def get_series_catalog_repository() -> SeriesCatalogRepository:
+    settings = get_settings()
+    return JsonSeriesCatalogRepository(
+        settings.series_catalog_file,
+        flush_delay_seconds=settings.series_catalog_flush_seconds,
+    )
+
+
+@lru_cache
+def get_isbn_cache_repository() -> IsbnLookupCacheRepository:
+    settings = get_settings()
+    return JsonIsbnCacheRepository(settings.isbn_cache_file)
+
+
+@lru_cache
+def get_import_job_repository() -> ImportJobRepository:
+    settings = get_settings()
+    return JsonImportJobRepository(settings.import_dir)
+
+
+@lru_cache
+def get_import_job_runner() -> BackgroundJobRunner:
+    return BackgroundJobRunner("library-import")
+
+
+@lru_cache
+def get_cover_image_store() -> CoverImageStore:
+    settings = get_settings()
+    return DiskCoverCache(
+        settings.cover_cache_dir,
+        max_bytes=settings.cover_cache_max_bytes,
+        timeout_seconds=settings.search_timeout_seconds,
+    )
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@lru_cache
+def get_provider_rate_limiter() -> RateLimiter:
     settings = get_settings()
+    store: TokenBucketStore | None = None
+    if settings.rate_limit_shared:
+        store = FileTokenBucketStore(settings.rate_limit_dir)
+    return TokenBucketRateLimiter(
+        {
+            RakutenBooksService.name: RateBudget(
+                settings.rakuten_requests_per_second, burst=1.0
+            ),
+            GoogleBooksService.name: RateBudget(
+                settings.google_books_requests_per_second, burst=2.0
+            ),
+            NDLOpenSearchService.name: RateBudget(
+                settings.ndl_requests_per_second, burst=2.0
+            ),
+        },
+        store=store,
+        metrics=get_metrics_registry(),
+    )
+
+
+@lru_cache
+def get_provider_concurrency_limiter() -> ConcurrencyLimiter:
+    settings = get_settings()
+    limit = ConcurrencyLimit(
+        settings.provider_max_concurrency, max_queued=settings.provider_max_queued
+    )
+    return ConcurrencyLimiter(
+        {
+            RakutenBooksService.name: limit,
+            GoogleBooksService.name: limit,
+            NDLOpenSearchService.name: limit,
+        },
+        metrics=get_metrics_registry(),
+        metric_prefix="provider_admission",
+    )
+
+
+@lru_cache
+def get_provider_http_client() -> ProviderHttpClient:
+    settings = get_settings()
+    return ProviderHttpClient(
+        metrics=get_metrics_registry(),
+        limiter=get_provider_concurrency_limiter(),
+        queue_timeout_seconds=settings.provider_queue_timeout_seconds,
+    )
+
+
+@lru_cache
+def get_search_admission_limiter() -> AsyncConcurrencyLimiter:
+    settings = get_settings()
+    return AsyncConcurrencyLimiter(
+        {
+            SEARCH_ADMISSION_KEY: ConcurrencyLimit(
+                settings.search_max_concurrency, max_queued=settings.search_max_queued
+            )
+        },
+        metrics=get_metrics_registry(),
+        metric_prefix="search_admission",
+    )
+
+
+@lru_cache
+def get_search_providers() -> tuple[BookSearchService, ...]:
+    settings = get_settings()
+    rate_limiter = get_provider_rate_limiter()
+    http_client = get_provider_http_client()
     services: list[BookSearchService] = []
     if settings.rakuten_application_id:
         services.append(
@@ -32,6 +354,9 @@ def get_search_service() -> BookSearchService:
                 endpoint=settings.rakuten_books_endpoint,
                 application_id=settings.rakuten_application_id,
                 timeout_seconds=settings.search_timeout_seconds,
+                rate_limiter=rate_limiter,
+                rate_limit_wait_seconds=settings.rate_limit_wait_seconds,
+                http_client=http_client,
             )
         )
     services.append(
@@ -39,6 +364,9 @@ def get_search_service() -> BookSearchService:
             endpoint=settings.google_books_endpoint,
             api_key=settings.google_books_api_key,
             timeout_seconds=settings.search_timeout_seconds,
+            rate_limiter=rate_limiter,
+            rate_limit_wait_seconds=settings.rate_limit_wait_seconds,
+            http_client=http_client,
         )
     )
     services.append(
@@ -46,26 +374,321 @@ def get_search_service() -> BookSearchService:
             endpoint=settings.ndl_endpoint,
             thumbnail_base=settings.ndl_thumbnail_base,
             timeout_seconds=settings.search_timeout_seconds,
+            rate_limiter=rate_limiter,
+            rate_limit_wait_seconds=settings.rate_limit_wait_seconds,
+            http_client=http_client,
         )
     )
-    return CompositeBookSearchService(services)
+    return tuple(services)
 
 
 @lru_cache
-def get_get_library_handler() -> GetLibraryHandler:
-    return GetLibraryHandler(get_library_repository())
+def get_composite_search_service() -> CompositeBookSearchService:
+    settings = get_settings()
+    return CompositeBookSearchService(
+        get_search_providers(),
+        early_stop=settings.search_planner_early_stop,
+        metrics=get_metrics_registry(),
+    )
 
 
 @lru_cache
-def get_upsert_library_handler() -> UpsertLibraryItemHandler:
-    return UpsertLibraryItemHandler(get_library_repository())
+def get_search_service() -> BookSearchService:
+    return get_composite_search_service()
 
 
 @lru_cache
-def get_delete_library_handler() -> DeleteLibraryItemHandler:
-    return DeleteLibraryItemHandler(get_library_repository())
+def get_search_planner() -> SearchPlanner:
+    return get_composite_search_service()
+
+
+@lru_cache
+def get_isbn_lookup_providers() -> tuple[IsbnLookupService, ...]:
+    providers = [
+        provider
+        for provider in get_search_providers()
+        if isinstance(provider, IsbnLookupService)
+    ]
+    providers.sort(key=lambda provider: -provider.max_batch_size)
+    return tuple(providers)
+
+
+def get_requested_fields(fields: str | None = Query(None)) -> frozenset[str] | None:
+    if fields is None:
+        return None
+    try:
+        return parse_library_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422, detail=f"fields に不明な項目があります: {exc}"
+        ) from exc
+
+
+def get_library_response_cache(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> LibraryResponseCache:
+    return shard.response_cache
+
+
+def get_get_library_stats_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> GetLibraryStatsHandler:
+    return shard.stats_handler
+
+
+def get_get_library_changes_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> GetLibraryChangesHandler:
+    return GetLibraryChangesHandler(shard.async_repository)
+
+
+def get_compact_library_changes_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> CompactLibraryChangesHandler:
+    return CompactLibraryChangesHandler(shard.repository)
+
+
+def get_compact_library_changes_command() -> CompactLibraryChangesCommand:
+    settings = get_settings()
+    return CompactLibraryChangesCommand(
+        retention=timedelta(days=settings.library_tombstone_retention_days)
+    )
+
+
+def get_create_library_backup_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> CreateLibraryBackupHandler:
+    settings = get_settings()
+    return CreateLibraryBackupHandler(
+        shard.repository,
+        shard.backup_repository,
+        BackupRetentionPolicy(
+            keep_last=settings.backup_keep_last,
+            keep_daily=settings.backup_keep_daily,
+            keep_weekly=settings.backup_keep_weekly,
+        ),
+    )
+
+
+def get_restore_library_backup_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> RestoreLibraryBackupHandler:
+    return RestoreLibraryBackupHandler(shard.repository, shard.backup_repository)
+
+
+def get_list_library_backups_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> ListLibraryBackupsHandler:
+    return ListLibraryBackupsHandler(shard.backup_repository)
+
+
+def get_verify_library_backup_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> VerifyLibraryBackupHandler:
+    return VerifyLibraryBackupHandler(shard.backup_repository)
+
+
+def get_get_library_item_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> GetLibraryItemHandler:
+    return GetLibraryItemHandler(shard.async_repository)
+
+
+def get_update_library_notes_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> UpdateLibraryNotesHandler:
+    return UpdateLibraryNotesHandler(shard.async_repository)
+
+
+def get_upsert_library_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> UpsertLibraryItemHandler:
+    return UpsertLibraryItemHandler(shard.async_repository)
+
+
+def get_delete_library_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> DeleteLibraryItemHandler:
+    return DeleteLibraryItemHandler(shard.async_repository)
+
+
+def get_get_cover_image_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> GetCoverImageHandler:
+    return GetCoverImageHandler(shard.repository, get_cover_image_store())
+
+
+@lru_cache
+def get_prefetch_cover_image_handler() -> PrefetchCoverImageHandler:
+    return PrefetchCoverImageHandler(get_cover_image_store())
+
+
+def get_find_series_duplicates_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> FindSeriesDuplicatesHandler:
+    return FindSeriesDuplicatesHandler(shard.repository)
+
+
+@lru_cache
+def get_record_series_catalog_handler() -> RecordSeriesCatalogHandler:
+    settings = get_settings()
+    return RecordSeriesCatalogHandler(
+        get_series_catalog_repository(),
+        ttl=timedelta(hours=settings.series_catalog_ttl_hours),
+    )
+
+
+def get_get_missing_volumes_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> GetMissingVolumesHandler:
+    settings = get_settings()
+    return GetMissingVolumesHandler(
+        shard.repository,
+        get_series_catalog_repository(),
+        ttl=timedelta(hours=settings.series_catalog_ttl_hours),
+    )
+
+
+@lru_cache
+def get_explain_search_handler() -> ExplainSearchHandler:
+    return ExplainSearchHandler(get_search_planner())
+
+
+@lru_cache
+def get_catalog_suggestion_index() -> PrefixIndex:
+    return PrefixIndex()
+
+
+def get_suggest_titles_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> SuggestTitlesHandler:
+    return shard.suggest_handler
+
+
+@lru_cache
+def get_refresh_suggestion_catalog_handler() -> RefreshSuggestionCatalogHandler:
+    return RefreshSuggestionCatalogHandler(
+        get_series_catalog_repository(), get_catalog_suggestion_index()
+    )
+
+
+@lru_cache
+def get_search_result_cache() -> SearchResultCacheRepository:
+    settings = get_settings()
+    return InMemorySearchResultCache(
+        ttl_seconds=settings.search_cache_ttl_seconds,
+        max_entries=settings.search_cache_max_entries,
+        metrics=get_metrics_registry(),
+    )
 
 
 @lru_cache
 def get_search_books_handler() -> SearchBooksHandler:
-    return SearchBooksHandler(get_search_service())
+    return SearchBooksHandler(
+        get_search_service(),
+        catalog_recorder=get_record_series_catalog_handler(),
+        cache=get_search_result_cache(),
+    )
+
+
+@lru_cache
+def get_prefetch_search_page_handler() -> PrefetchSearchPageHandler:
+    settings = get_settings()
+    return PrefetchSearchPageHandler(
+        get_search_books_handler(),
+        get_search_result_cache(),
+        budget=TokenBucketRateLimiter(
+            {
+                PREFETCH_BUDGET_KEY: RateBudget(
+                    settings.search_prefetch_requests_per_minute / 60.0, burst=2.0
+                )
+            },
+            metrics=get_metrics_registry(),
+            metric_prefix="search_prefetch_rate_limit",
+        ),
+    )
+
+
+@lru_cache
+def get_search_prefetch_scheduler() -> PrefetchScheduler:
+    settings = get_settings()
+    return PrefetchScheduler(
+        "search-prefetch",
+        max_workers=settings.search_prefetch_workers,
+        max_wait_seconds=settings.search_timeout_seconds,
+        metrics=get_metrics_registry(),
+        metric_prefix="search_prefetch",
+    )
+
+
+@lru_cache
+def get_lookup_isbns_handler() -> LookupIsbnsHandler:
+    settings = get_settings()
+    return LookupIsbnsHandler(
+        get_isbn_lookup_providers(),
+        get_isbn_cache_repository(),
+        found_ttl=timedelta(hours=settings.isbn_cache_found_ttl_hours),
+        miss_ttl=timedelta(hours=settings.isbn_cache_miss_ttl_hours),
+        max_workers=settings.isbn_lookup_max_workers,
+    )
+
+
+@lru_cache
+def get_create_library_import_handler() -> CreateLibraryImportHandler:
+    return CreateLibraryImportHandler(get_import_job_repository())
+
+
+@lru_cache
+def get_get_import_job_handler() -> GetImportJobHandler:
+    return GetImportJobHandler(get_import_job_repository())
+
+
+@lru_cache
+def get_run_library_import_handler() -> RunLibraryImportHandler:
+    settings = get_settings()
+    return RunLibraryImportHandler(
+        get_library_repository_for,
+        get_import_job_repository(),
+        get_lookup_isbns_handler(),
+        title_search=get_search_service(),
+        title_search_budget=settings.import_title_search_budget,
+        lookup_workers=settings.import_lookup_workers,
+        lookup_batch_size=settings.import_lookup_batch_size,
+        write_batch_size=settings.import_write_batch_size,
+        stop_event=get_import_job_runner().stop_event,
+    )
+
+
+@lru_cache
+def get_release_tracker_rate_limiter() -> RateLimiter:
+    settings = get_settings()
+    budget = RateBudget(
+        requests_per_second=settings.release_tracker_requests_per_minute / 60.0,
+        burst=1.0,
+    )
+    return TokenBucketRateLimiter(
+        {provider.name: budget for provider in get_search_providers()},
+        metrics=get_metrics_registry(),
+        metric_prefix="release_tracker_rate_limit",
+    )
+
+
+def get_track_new_releases_handler(
+    shard: LibraryShard = Depends(get_library_shard),
+) -> TrackNewReleasesHandler:
+    return TrackNewReleasesHandler(
+        repository=shard.repository,
+        providers=get_search_providers(),
+        progress_repository=shard.release_progress_repository,
+        rate_limiter=get_release_tracker_rate_limiter(),
+        catalog_recorder=get_record_series_catalog_handler(),
+        workers=get_settings().provider_max_concurrency,
+    )
+
+
+def get_track_new_releases_command() -> TrackNewReleasesCommand:
+    settings = get_settings()
+    return TrackNewReleasesCommand(
+        batch_size=settings.release_tracker_batch_size,
+        refresh_interval=timedelta(hours=settings.release_tracker_refresh_hours),
+    )
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from application.queries.get_library import (
+    GetLibrarySnapshotHandler,
+    GetLibrarySnapshotQuery,
+)
+from domain.models import LibrarySnapshot
+from presentation.schemas import (
+    COMPACT_LIBRARY_ITEM_FIELDS,
+    HEAVY_LIBRARY_ITEM_FIELDS,
+    project_library_items,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+MIN_COMPRESS_BYTES = 1024
+MAX_CACHED_PROJECTIONS = 8
+ENCODING_GZIP = "gzip"
+ENCODING_BROTLI = "br"
+_ETAG_RE = re.compile(r'^(?:W/)?"library-(\d+)(?:-n([0-9a-f]+))?(?:-[a-z]+)?"$')
+
+
+@dataclass(frozen=True)
+class EncodedLibrary:
+    revision: int
+    body: bytes
+    variants: Dict[str, bytes] = field(default_factory=dict)
+    notes_version: Optional[str] = None
+
+    @property
+    def etag(self) -> str:
+        return library_etag(self.revision, notes_version=self.notes_version)
+
+    def select(self, accept_encoding: Optional[str]) -> tuple[bytes, Optional[str]]:
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in (ENCODING_BROTLI, ENCODING_GZIP):
+            variant = self.variants.get(encoding)
+            if variant is not None and (encoding in accepted or "*" in accepted):
+                return variant, encoding
+        return self.body, None
+
+
+class LibraryResponseCache:
+    def __init__(
+        self,
+        handler: GetLibrarySnapshotHandler,
+        max_projections: int = MAX_CACHED_PROJECTIONS,
+    ) -> None:
+        self._handler = handler
+        self._max_projections = max(max_projections, 1)
+        self._lock = threading.Lock()
+        self._encoded: Dict[frozenset[str], EncodedLibrary] = {}
+
+    def get(
+        self, fields: frozenset[str] = COMPACT_LIBRARY_ITEM_FIELDS
+    ) -> EncodedLibrary:
+        encoded = self._encoded.get(fields)
+        snapshot = self._handler.handle(
+            GetLibrarySnapshotQuery(
+                known_revision=encoded.revision if encoded is not None else None,
+                include_notes=not fields.isdisjoint(HEAVY_LIBRARY_ITEM_FIELDS),
+                known_notes_version=(
+                    encoded.notes_version if encoded is not None else None
+                ),
+            )
+        )
+        if snapshot is None and encoded is not None:
+            return encoded
+        assert snapshot is not None
+
+        with self._lock:
+            current = self._encoded.get(fields)
+            if current is not None and (
+                current.revision > snapshot.revision
+                or (current.revision, current.notes_version)
+                == (snapshot.revision, snapshot.notes_version)
+            ):
+                return current
+            encoded = encode_library(snapshot, fields)
+            self._encoded.pop(fields, None)
+            while len(self._encoded) >= self._max_projections:
+                self._encoded.pop(next(iter(self._encoded)))
+            self._encoded[fields] = encoded
+            return encoded
+
+
+def encode_library(
+    snapshot: LibrarySnapshot, fields: frozenset[str] = COMPACT_LIBRARY_ITEM_FIELDS
+) -> EncodedLibrary:
+    payload = project_library_items(snapshot.items, fields)
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    variants: Dict[str, bytes] = {}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        variants[ENCODING_GZIP] = gzip.compress(body, compresslevel=6, mtime=0)
+        if brotli is not None:
+            variants[ENCODING_BROTLI] = brotli.compress(body, quality=5)
+    return EncodedLibrary(
+        revision=snapshot.revision,
+        body=body,
+        variants=variants,
+        notes_version=snapshot.notes_version,
+    )
+
+
+def parse_accept_encoding(value: Optional[str]) -> set[str]:
+    accepted: set[str] = set()
+    for part in (value or "").split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, raw = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(token)
+    return accepted
+
+
+def library_etag(
+    revision: int,
+    encoding: Optional[str] = None,
+    notes_version: Optional[str] = None,
+) -> str:
+    tag = f"library-{revision}"
+    if notes_version is not None:
+        tag = f"{tag}-n{notes_version}"
+    if encoding is not None:
+        tag = f"{tag}-{encoding}"
+    return f'"{tag}"'
+
+
+def parse_library_etags(value: Optional[str]) -> Optional[set[int]]:
+    validators = parse_library_validators(value)
+    if validators is None:
+        return None
+    return {revision for revision, _ in validators}
+
+
+def parse_library_validators(
+    value: Optional[str],
+) -> Optional[set[tuple[int, Optional[str]]]]:
+    if value is None:
+        return set()
+    validators: set[tuple[int, Optional[str]]] = set()
+    for part in value.split(","):
+        tag = part.strip()
+        if tag == "*":
+            return None
+        match = _ETAG_RE.match(tag)
+        if match is not None:
+            validators.add((int(match.group(1)), match.group(2)))
+    return validators
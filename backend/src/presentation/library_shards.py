@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from application.queries.get_library_stats import GetLibraryStatsHandler
+from application.queries.suggest_titles import SuggestTitlesHandler
+from domain.repositories import (
+    LibraryBackupRepository,
+    LibraryRepository,
+    ReleaseTrackerProgressRepository,
+)
+from infrastructure.metrics import MetricsRegistry
+from infrastructure.persistence.executor_async_library_repository import (
+    ExecutorAsyncLibraryRepository,
+)
+from presentation.library_response_cache import LibraryResponseCache
+
+
+@dataclass(frozen=True)
+class LibraryShard:
+    tenant_id: str
+    repository: LibraryRepository
+    async_repository: ExecutorAsyncLibraryRepository
+    response_cache: LibraryResponseCache
+    stats_handler: GetLibraryStatsHandler
+    suggest_handler: SuggestTitlesHandler
+    backup_repository: LibraryBackupRepository
+    release_progress_repository: ReleaseTrackerProgressRepository
+
+
+class LibraryShardRegistry:
+    def __init__(
+        self,
+        factory: Callable[[str], LibraryShard],
+        max_open_shards: int = 64,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
+        self._factory = factory
+        self._max_open_shards = max(max_open_shards, 1)
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self._shards: OrderedDict[str, LibraryShard] = OrderedDict()
+        if metrics is not None:
+            metrics.register_gauge("library_open_shards", lambda: len(self._shards))
+            metrics.register_gauge(
+                "library_pending_writes",
+                lambda: sum(
+                    shard.async_repository.pending_writes for shard in self.shards()
+                ),
+            )
+
+    def get(self, tenant_id: str) -> LibraryShard:
+        with self._lock:
+            shard = self._shards.get(tenant_id)
+            if shard is not None:
+                self._shards.move_to_end(tenant_id)
+                return shard
+            shard = self._factory(tenant_id)
+            self._shards[tenant_id] = shard
+            self._count("library_shard_opens_total")
+            self._evict_idle(keep=tenant_id)
+            return shard
+
+    def shards(self) -> List[LibraryShard]:
+        with self._lock:
+            return list(self._shards.values())
+
+    def _evict_idle(self, keep: str) -> None:
+        excess = len(self._shards) - self._max_open_shards
+        if excess <= 0:
+            return
+        idle = [
+            tenant_id
+            for tenant_id, shard in self._shards.items()
+            if tenant_id != keep and shard.async_repository.pending_writes == 0
+        ]
+        for tenant_id in idle[:excess]:
+            del self._shards[tenant_id]
+            self._count("library_shard_evictions_total")
+
+    def _count(self, name: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(name)
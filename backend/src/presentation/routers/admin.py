@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from application.queries.find_series_duplicates import (
+    FindSeriesDuplicatesHandler,
+    FindSeriesDuplicatesQuery,
+)
+from domain.series_matching import REPORT_AUTHOR_THRESHOLD, REPORT_TITLE_THRESHOLD
+from presentation.dependencies import get_find_series_duplicates_handler
+from presentation.schemas import SeriesDuplicateSchema
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.get("/series-duplicates", response_model=List[SeriesDuplicateSchema])
+def get_series_duplicates(
+    title_threshold: float = Query(REPORT_TITLE_THRESHOLD, ge=0.0, le=1.0),
+    author_threshold: float = Query(REPORT_AUTHOR_THRESHOLD, ge=0.0, le=1.0),
+    handler: FindSeriesDuplicatesHandler = Depends(get_find_series_duplicates_handler),
+) -> List[SeriesDuplicateSchema]:
+    candidates = handler.handle(
+        FindSeriesDuplicatesQuery(
+            title_threshold=title_threshold,
+            author_threshold=author_threshold,
+        )
+    )
+    return [SeriesDuplicateSchema.from_domain(candidate) for candidate in candidates]
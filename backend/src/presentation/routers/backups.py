@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+
+from application.commands.create_library_backup import (
+    CreateLibraryBackupCommand,
+    CreateLibraryBackupHandler,
+)
+from application.commands.restore_library_backup import (
+    RestoreLibraryBackupCommand,
+    RestoreLibraryBackupHandler,
+)
+from application.queries.list_library_backups import (
+    ListLibraryBackupsHandler,
+    ListLibraryBackupsQuery,
+)
+from application.queries.verify_library_backup import (
+    VerifyLibraryBackupHandler,
+    VerifyLibraryBackupQuery,
+)
+from domain.errors import (
+    BackupIntegrityError,
+    BackupSnapshotNotFoundError,
+    RevisionConflictError,
+)
+from presentation.dependencies import (
+    get_create_library_backup_handler,
+    get_list_library_backups_handler,
+    get_restore_library_backup_handler,
+    get_verify_library_backup_handler,
+)
+from presentation.library_response_cache import library_etag, parse_library_etags
+from presentation.schemas import (
+    BackupRestoreSchema,
+    BackupSnapshotSchema,
+    BackupVerificationSchema,
+)
+
+router = APIRouter(prefix="/api/admin/backups", tags=["backups"])
+
+
+@router.get("", response_model=List[BackupSnapshotSchema])
+def list_backups(
+    handler: ListLibraryBackupsHandler = Depends(get_list_library_backups_handler),
+) -> List[BackupSnapshotSchema]:
+    snapshots = handler.handle(ListLibraryBackupsQuery())
+    return [BackupSnapshotSchema.from_domain(snapshot) for snapshot in snapshots]
+
+
+@router.post("", response_model=BackupSnapshotSchema)
+async def create_backup(
+    response: Response,
+    force: bool = False,
+    handler: CreateLibraryBackupHandler = Depends(get_create_library_backup_handler),
+) -> BackupSnapshotSchema:
+    result = await run_in_threadpool(
+        handler.handle, CreateLibraryBackupCommand(force=force)
+    )
+    response.status_code = 201 if result.created else 200
+    return BackupSnapshotSchema.from_domain(result.snapshot)
+
+
+@router.get("/{snapshot_id}/verify", response_model=BackupVerificationSchema)
+def verify_backup(
+    snapshot_id: str,
+    handler: VerifyLibraryBackupHandler = Depends(get_verify_library_backup_handler),
+) -> BackupVerificationSchema:
+    try:
+        verification = handler.handle(VerifyLibraryBackupQuery(snapshot_id))
+    except BackupSnapshotNotFoundError as exc:
+        raise _snapshot_not_found() from exc
+    return BackupVerificationSchema.from_domain(verification)
+
+
+@router.post("/{snapshot_id}/restore", response_model=BackupRestoreSchema)
+def restore_backup(
+    snapshot_id: str,
+    response: Response,
+    if_match: str | None = Header(None),
+    handler: RestoreLibraryBackupHandler = Depends(get_restore_library_backup_handler),
+) -> BackupRestoreSchema:
+    expected_revision = None
+    revisions = parse_library_etags(if_match)
+    if if_match is not None and revisions is not None:
+        if len(revisions) != 1:
+            raise _precondition_failed()
+        expected_revision = next(iter(revisions))
+
+    try:
+        mutation = handler.handle(
+            RestoreLibraryBackupCommand(
+                snapshot_id=snapshot_id, expected_revision=expected_revision
+            )
+        )
+    except BackupSnapshotNotFoundError as exc:
+        raise _snapshot_not_found() from exc
+    except BackupIntegrityError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail="バックアップが破損しているため復元できません。",
+        ) from exc
+    except RevisionConflictError as exc:
+        raise _precondition_failed() from exc
+    response.headers["ETag"] = library_etag(mutation.revision)
+    return BackupRestoreSchema(snapshotId=snapshot_id, revision=mutation.revision)
+
+
+def _snapshot_not_found() -> HTTPException:
+    return HTTPException(status_code=404, detail="バックアップが見つかりません。")
+
+
+def _precondition_failed() -> HTTPException:
+    return HTTPException(
+        status_code=412,
+        detail="本棚が他の操作で更新されています。再読み込みしてください。",
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+
+from application.queries.get_cover_image import (
+    GetCoverImageHandler,
+    GetCoverImageQuery,
+)
+from domain.covers import COVER_SIZE_ORIGINAL, COVER_SIZES
+from domain.errors import CoverImageError, LibraryItemNotFoundError
+from presentation.dependencies import get_get_cover_image_handler
+
+router = APIRouter(prefix="/api", tags=["covers"])
+
+COVER_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+
+
+@router.get("/covers/{item_id}")
+def get_cover(
+    item_id: str,
+    size: str = Query(COVER_SIZE_ORIGINAL),
+    if_none_match: str | None = Header(None),
+    handler: GetCoverImageHandler = Depends(get_get_cover_image_handler),
+) -> Response:
+    if size not in COVER_SIZES:
+        raise HTTPException(status_code=422, detail="size の指定が不正です。")
+
+    try:
+        image = handler.handle(GetCoverImageQuery(item_id=item_id, size=size))
+    except LibraryItemNotFoundError as exc:
+        raise HTTPException(
+            status_code=404, detail="本棚にアイテムが見つかりません。"
+        ) from exc
+    except CoverImageError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+    if image is None:
+        raise HTTPException(status_code=404, detail="表紙画像がありません。")
+
+    etag = f'"{image.digest}"'
+    headers = {"ETag": etag, "Cache-Control": COVER_CACHE_CONTROL}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=image.content, media_type=image.content_type, headers=headers
+    )
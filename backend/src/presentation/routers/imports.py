@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import tempfile
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from application.commands.create_library_import import (
+    CreateLibraryImportCommand,
+    CreateLibraryImportHandler,
+)
+from application.commands.run_library_import import (
+    RunLibraryImportCommand,
+    RunLibraryImportHandler,
+)
+from application.queries.get_import_job import GetImportJobHandler, GetImportJobQuery
+from domain.errors import ImportJobNotFoundError
+from domain.imports import IMPORT_FORMAT_CSV, IMPORT_FORMATS
+from infrastructure.config import get_settings
+from infrastructure.scheduling.background_jobs import BackgroundJobRunner
+from presentation.dependencies import (
+    get_create_library_import_handler,
+    get_get_import_job_handler,
+    get_import_job_runner,
+    get_run_library_import_handler,
+    get_tenant_id,
+)
+from presentation.schemas import ImportJobSchema
+
+router = APIRouter(prefix="/api", tags=["imports"])
+
+SPOOL_MEMORY_BYTES = 1024 * 1024
+
+
+@router.post("/imports", response_model=ImportJobSchema, status_code=202)
+async def create_import(
+    request: Request,
+    source_format: str = Query(IMPORT_FORMAT_CSV, alias="format"),
+    tenant_id: str = Depends(get_tenant_id),
+    handler: CreateLibraryImportHandler = Depends(get_create_library_import_handler),
+    run_handler: RunLibraryImportHandler = Depends(get_run_library_import_handler),
+    runner: BackgroundJobRunner = Depends(get_import_job_runner),
+) -> ImportJobSchema:
+    if source_format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=422, detail="format の指定が不正です。")
+
+    max_bytes = get_settings().import_max_bytes
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES) as spool:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_bytes:
+                raise HTTPException(
+                    status_code=413, detail="インポートファイルが大きすぎます。"
+                )
+            spool.write(chunk)
+        if received == 0:
+            raise HTTPException(status_code=422, detail="インポートデータが空です。")
+        spool.seek(0)
+        job = await run_in_threadpool(
+            handler.handle,
+            CreateLibraryImportCommand(
+                source_format=source_format, source=spool, tenant_id=tenant_id
+            ),
+        )
+
+    runner.submit(lambda: run_handler.handle(RunLibraryImportCommand(job.job_id)))
+    return ImportJobSchema.from_domain(job)
+
+
+@router.get("/imports/{job_id}", response_model=ImportJobSchema)
+def get_import(
+    job_id: str,
+    tenant_id: str = Depends(get_tenant_id),
+    handler: GetImportJobHandler = Depends(get_get_import_job_handler),
+) -> ImportJobSchema:
+    try:
+        job = handler.handle(GetImportJobQuery(job_id=job_id, tenant_id=tenant_id))
+    except ImportJobNotFoundError as exc:
+        raise HTTPException(
+            status_code=404, detail="インポートジョブが見つかりません。"
+        ) from exc
+    return ImportJobSchema.from_domain(job)
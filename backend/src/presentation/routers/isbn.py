@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from application.queries.lookup_isbns import LookupIsbnsHandler, LookupIsbnsQuery
+from presentation.dependencies import get_lookup_isbns_handler
+from presentation.schemas import IsbnLookupRequestSchema, IsbnLookupResponseSchema
+
+router = APIRouter(prefix="/api/isbn", tags=["isbn"])
+
+
+@router.post("/lookup", response_model=IsbnLookupResponseSchema)
+def lookup_isbns(
+    payload: IsbnLookupRequestSchema,
+    handler: LookupIsbnsHandler = Depends(get_lookup_isbns_handler),
+) -> IsbnLookupResponseSchema:
+    result = handler.handle(LookupIsbnsQuery(isbns=payload.isbns))
+    return IsbnLookupResponseSchema.from_domain(result)
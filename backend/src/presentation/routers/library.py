@@ -2,47 +2,215 @@ from __future__ import annotations
 
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+)
 
 from application.commands.delete_library_item import (
     DeleteLibraryItemCommand,
     DeleteLibraryItemHandler,
 )
+from application.commands.prefetch_cover_image import (
+    PrefetchCoverImageCommand,
+    PrefetchCoverImageHandler,
+)
+from application.commands.update_library_notes import (
+    UpdateLibraryNotesCommand,
+    UpdateLibraryNotesHandler,
+)
 from application.commands.upsert_library_item import (
     UpsertLibraryItemCommand,
     UpsertLibraryItemHandler,
 )
-from application.queries.get_library import GetLibraryHandler, GetLibraryQuery
+from application.queries.get_library_changes import (
+    GetLibraryChangesHandler,
+    GetLibraryChangesQuery,
+)
+from application.queries.get_library_item import (
+    GetLibraryItemHandler,
+    GetLibraryItemQuery,
+)
+from application.queries.get_missing_volumes import (
+    GetMissingVolumesHandler,
+    GetMissingVolumesQuery,
+)
+from domain.errors import LibraryItemNotFoundError, RevisionConflictError
 from presentation.dependencies import (
     get_delete_library_handler,
-    get_get_library_handler,
+    get_get_library_changes_handler,
+    get_get_library_item_handler,
+    get_get_missing_volumes_handler,
+    get_library_response_cache,
+    get_prefetch_cover_image_handler,
+    get_requested_fields,
+    get_update_library_notes_handler,
     get_upsert_library_handler,
 )
-from presentation.schemas import LibraryItemSchema
+from presentation.library_response_cache import (
+    LibraryResponseCache,
+    library_etag,
+    parse_library_etags,
+    parse_library_validators,
+)
+from presentation.schemas import (
+    COMPACT_LIBRARY_ITEM_FIELDS,
+    LibraryChangesSchema,
+    LibraryItemSchema,
+    LibraryNotesSchema,
+    MissingVolumesSchema,
+)
 
 router = APIRouter(prefix="/api", tags=["library"])
 
 
 @router.get("/library", response_model=List[LibraryItemSchema])
 def get_library(
-    handler: GetLibraryHandler = Depends(get_get_library_handler),
-) -> List[LibraryItemSchema]:
-    items = handler.handle(GetLibraryQuery())
-    return [LibraryItemSchema.from_domain(item) for item in items]
+    fields: frozenset[str] | None = Depends(get_requested_fields),
+    accept_encoding: str | None = Header(None),
+    if_none_match: str | None = Header(None),
+    cache: LibraryResponseCache = Depends(get_library_response_cache),
+) -> Response:
+    encoded = cache.get(fields or COMPACT_LIBRARY_ITEM_FIELDS)
+    body, encoding = encoded.select(accept_encoding)
+    headers = {
+        "Vary": "Accept-Encoding",
+        "ETag": library_etag(encoded.revision, encoding, encoded.notes_version),
+    }
+    known = parse_library_validators(if_none_match)
+    if known is None or (encoded.revision, encoded.notes_version) in known:
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/library/changes", response_model=LibraryChangesSchema)
+async def get_library_changes(
+    response: Response,
+    since: int = Query(0, ge=0),
+    handler: GetLibraryChangesHandler = Depends(get_get_library_changes_handler),
+) -> LibraryChangesSchema:
+    changes = await handler.handle(GetLibraryChangesQuery(since=since))
+    response.headers["ETag"] = library_etag(changes.revision)
+    return LibraryChangesSchema.from_domain(changes)
+
+
+@router.get("/library/{item_id}", response_model=LibraryItemSchema)
+async def get_library_item(
+    item_id: str,
+    handler: GetLibraryItemHandler = Depends(get_get_library_item_handler),
+) -> LibraryItemSchema:
+    try:
+        item = await handler.handle(GetLibraryItemQuery(item_id=item_id))
+    except LibraryItemNotFoundError as exc:
+        raise _item_not_found() from exc
+    return LibraryItemSchema.from_domain(item)
+
+
+@router.get("/library/{item_id}/notes", response_model=LibraryNotesSchema)
+async def get_library_notes(
+    item_id: str,
+    handler: GetLibraryItemHandler = Depends(get_get_library_item_handler),
+) -> LibraryNotesSchema:
+    try:
+        item = await handler.handle(GetLibraryItemQuery(item_id=item_id))
+    except LibraryItemNotFoundError as exc:
+        raise _item_not_found() from exc
+    return LibraryNotesSchema(notes=item.notes or "")
+
+
+@router.put("/library/{item_id}/notes", response_model=LibraryItemSchema)
+async def update_library_notes(
+    item_id: str,
+    payload: LibraryNotesSchema,
+    handler: UpdateLibraryNotesHandler = Depends(get_update_library_notes_handler),
+) -> LibraryItemSchema:
+    try:
+        item = await handler.handle(
+            UpdateLibraryNotesCommand(item_id=item_id, notes=payload.notes)
+        )
+    except LibraryItemNotFoundError as exc:
+        raise _item_not_found() from exc
+    return LibraryItemSchema.from_domain(item)
 
 
 @router.post("/library", response_model=LibraryItemSchema)
-def upsert_library(
+async def upsert_library(
     payload: LibraryItemSchema,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    if_match: str | None = Header(None),
     handler: UpsertLibraryItemHandler = Depends(get_upsert_library_handler),
+    prefetch_handler: PrefetchCoverImageHandler = Depends(
+        get_prefetch_cover_image_handler
+    ),
 ) -> LibraryItemSchema:
-    saved = handler.handle(UpsertLibraryItemCommand(payload.to_domain()))
-    return LibraryItemSchema.from_domain(saved)
+    command = UpsertLibraryItemCommand(
+        payload.to_domain(), expected_revision=_expected_revision(if_match)
+    )
+    try:
+        mutation = await handler.handle(command)
+    except RevisionConflictError as exc:
+        raise _precondition_failed() from exc
+    assert mutation.item is not None
+    background_tasks.add_task(
+        prefetch_handler.handle, PrefetchCoverImageCommand(mutation.item.cover_url)
+    )
+    response.headers["ETag"] = library_etag(mutation.revision)
+    return LibraryItemSchema.from_domain(mutation.item)
 
 
 @router.delete("/library/{item_id}", status_code=204)
-def delete_library(
+async def delete_library(
     item_id: str,
+    if_match: str | None = Header(None),
     handler: DeleteLibraryItemHandler = Depends(get_delete_library_handler),
-) -> None:
-    handler.handle(DeleteLibraryItemCommand(item_id=item_id))
+) -> Response:
+    command = DeleteLibraryItemCommand(
+        item_id=item_id, expected_revision=_expected_revision(if_match)
+    )
+    try:
+        mutation = await handler.handle(command)
+    except RevisionConflictError as exc:
+        raise _precondition_failed() from exc
+    return Response(status_code=204, headers={"ETag": library_etag(mutation.revision)})
+
+
+@router.get("/library/{item_id}/missing", response_model=MissingVolumesSchema)
+def get_missing_volumes(
+    item_id: str,
+    handler: GetMissingVolumesHandler = Depends(get_get_missing_volumes_handler),
+) -> MissingVolumesSchema:
+    try:
+        missing = handler.handle(GetMissingVolumesQuery(item_id=item_id))
+    except LibraryItemNotFoundError as exc:
+        raise _item_not_found() from exc
+    return MissingVolumesSchema.from_domain(missing)
+
+
+def _expected_revision(if_match: str | None) -> int | None:
+    if if_match is None:
+        return None
+    revisions = parse_library_etags(if_match)
+    if revisions is None:
+        return None
+    if len(revisions) != 1:
+        raise _precondition_failed()
+    return next(iter(revisions))
+
+
+def _item_not_found() -> HTTPException:
+    return HTTPException(status_code=404, detail="本棚にアイテムが見つかりません。")
+
+
+def _precondition_failed() -> HTTPException:
+    return HTTPException(
+        status_code=412,
+        detail="本棚が他の操作で更新されています。再読み込みしてください。",
+    )
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Dict
+
+from fastapi import APIRouter, Depends
+
+from infrastructure.metrics import MetricsRegistry
+from presentation.dependencies import get_metrics_registry
+
+router = APIRouter(prefix="/api", tags=["metrics"])
+
+
+@router.get("/metrics")
+def metrics(
+    registry: MetricsRegistry = Depends(get_metrics_registry),
+) -> Dict[str, float]:
+    return registry.snapshot()
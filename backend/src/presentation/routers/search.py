@@ -1,17 +1,54 @@
 from __future__ import annotations
 
+import logging
+from dataclasses import replace
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 
+from application.commands.prefetch_search_page import (
+    PrefetchSearchPageCommand,
+    PrefetchSearchPageHandler,
+)
+from application.queries.explain_search import ExplainSearchHandler
 from application.queries.search_books import SearchBooksHandler
-from domain.errors import SearchServiceError
-from domain.search import SearchQuery
-from presentation.dependencies import get_search_books_handler
-from presentation.schemas import SearchResponseSchema
+from domain.errors import (
+    OperationCancelledError,
+    SearchOverloadedError,
+    SearchServiceError,
+)
+from domain.repositories import SearchResultCacheRepository
+from domain.search import SearchQuery, SearchResult
+from infrastructure.admission import AsyncConcurrencyLimiter
+from infrastructure.config import get_settings
+from infrastructure.metrics import MetricsRegistry
+from infrastructure.scheduling.prefetch_scheduler import PrefetchScheduler
+from presentation.client_disconnect import run_until_disconnected
+from presentation.dependencies import (
+    SEARCH_ADMISSION_KEY,
+    get_explain_search_handler,
+    get_metrics_registry,
+    get_prefetch_search_page_handler,
+    get_requested_fields,
+    get_search_admission_limiter,
+    get_search_books_handler,
+    get_search_prefetch_scheduler,
+    get_search_result_cache,
+)
+from presentation.schemas import (
+    SearchPlanSchema,
+    SearchResponseSchema,
+    project_library_items,
+    to_item_attributes,
+)
 
 router = APIRouter(prefix="/api", tags=["search"])
 
+logger = logging.getLogger(__name__)
+
+CLIENT_CLOSED_REQUEST = 499
+
 
 def _normalize(value: str | None) -> str | None:
     if value is None:
@@ -20,8 +57,7 @@ def _normalize(value: str | None) -> str | None:
     return trimmed or None
 
 
-@router.get("/search", response_model=SearchResponseSchema)
-def search(
+def _search_query(
     q: str | None = None,
     title: str | None = None,
     author: str | None = None,
@@ -30,9 +66,8 @@ def search(
     until: date | None = None,
     page: int = 1,
     limit: int = 20,
-    handler: SearchBooksHandler = Depends(get_search_books_handler),
-) -> SearchResponseSchema:
-    query = SearchQuery(
+) -> SearchQuery:
+    return SearchQuery(
         q=_normalize(q),
         title=_normalize(title),
         author=_normalize(author),
@@ -43,9 +78,95 @@ def search(
         limit=limit,
     )
 
+
+@router.get("/search", response_model=SearchResponseSchema)
+async def search(
+    request: Request,
+    query: SearchQuery = Depends(_search_query),
+    fields: frozenset[str] | None = Depends(get_requested_fields),
+    handler: SearchBooksHandler = Depends(get_search_books_handler),
+    prefetch_handler: PrefetchSearchPageHandler = Depends(
+        get_prefetch_search_page_handler
+    ),
+    scheduler: PrefetchScheduler = Depends(get_search_prefetch_scheduler),
+    metrics: MetricsRegistry = Depends(get_metrics_registry),
+    admission: AsyncConcurrencyLimiter = Depends(get_search_admission_limiter),
+    cache: SearchResultCacheRepository = Depends(get_search_result_cache),
+) -> SearchResponseSchema | Response:
+    if fields is not None:
+        query = replace(query, fields=to_item_attributes(fields))
+
+    settings = get_settings()
+
+    def run_search() -> SearchResult:
+        scheduler.join(query, settings.search_timeout_seconds)
+        return handler.handle(query)
+
+    if not await admission.acquire(
+        SEARCH_ADMISSION_KEY, settings.search_queue_timeout_seconds
+    ):
+        return _project(_serve_shed(query, cache, metrics), fields)
     try:
-        result = handler.handle(query)
+        result = await run_until_disconnected(request, run_search)
+    except OperationCancelledError:
+        logger.info("クライアントが切断したため検索を中断しました。")
+        metrics.increment("search_cancelled_total")
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except SearchOverloadedError:
+        return _project(_serve_shed(query, cache, metrics), fields)
     except SearchServiceError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
+    finally:
+        admission.release(SEARCH_ADMISSION_KEY)
+
+    if settings.search_prefetch_enabled:
+        command = PrefetchSearchPageCommand(query=query, returned=len(result.items))
+        next_query = prefetch_handler.next_query(command)
+        if next_query is not None:
+            scheduler.submit(
+                next_query,
+                replace(query, page=1),
+                lambda: prefetch_handler.handle(command),
+            )
+
+    return _project(result, fields)
+
+
+def _serve_shed(
+    query: SearchQuery,
+    cache: SearchResultCacheRepository,
+    metrics: MetricsRegistry,
+) -> SearchResult:
+    cached = cache.get(query)
+    if cached is not None:
+        metrics.increment("search_shed_total", outcome="cache")
+        return cached
+    metrics.increment("search_shed_total", outcome="rejected")
+    raise HTTPException(
+        status_code=503,
+        detail="検索が混雑しています。しばらくしてから再度お試しください。",
+        headers={"Retry-After": str(get_settings().search_retry_after_seconds)},
+    )
+
+
+def _project(
+    result: SearchResult, fields: frozenset[str] | None
+) -> SearchResponseSchema | Response:
+    if fields is None:
+        return SearchResponseSchema.from_domain(result)
+    return JSONResponse(
+        {
+            "items": project_library_items(result.items, fields),
+            "total": result.total,
+            "page": result.page,
+            "limit": result.limit,
+        }
+    )
+
 
-    return SearchResponseSchema.from_domain(result)
+@router.get("/search/plan", response_model=SearchPlanSchema)
+def search_plan(
+    query: SearchQuery = Depends(_search_query),
+    handler: ExplainSearchHandler = Depends(get_explain_search_handler),
+) -> SearchPlanSchema:
+    return SearchPlanSchema.from_domain(handler.handle(query))
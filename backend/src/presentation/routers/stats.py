@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from application.queries.get_library_stats import (
+    GetLibraryStatsHandler,
+    GetLibraryStatsQuery,
+)
+from presentation.dependencies import get_get_library_stats_handler
+from presentation.schemas import LibraryStatsSchema
+
+router = APIRouter(prefix="/api", tags=["stats"])
+
+MAX_RANKED_BUCKETS = 100
+
+
+@router.get("/stats", response_model=LibraryStatsSchema)
+def get_library_stats(
+    limit: int = Query(10, ge=1, le=MAX_RANKED_BUCKETS),
+    handler: GetLibraryStatsHandler = Depends(get_get_library_stats_handler),
+) -> LibraryStatsSchema:
+    stats = handler.handle(GetLibraryStatsQuery(limit=limit))
+    return LibraryStatsSchema.from_domain(stats)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from application.queries.suggest_titles import SuggestTitlesHandler, SuggestTitlesQuery
+from presentation.dependencies import get_suggest_titles_handler
+from presentation.schemas import SuggestionSchema, SuggestResponseSchema
+
+router = APIRouter(prefix="/api", tags=["suggest"])
+
+MAX_SUGGESTIONS = 20
+
+
+@router.get("/suggest", response_model=SuggestResponseSchema)
+def suggest(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS),
+    handler: SuggestTitlesHandler = Depends(get_suggest_titles_handler),
+) -> SuggestResponseSchema:
+    suggestions = handler.handle(SuggestTitlesQuery(prefix=prefix, limit=limit))
+    return SuggestResponseSchema(
+        prefix=prefix,
+        suggestions=[SuggestionSchema.from_domain(item) for item in suggestions],
+    )
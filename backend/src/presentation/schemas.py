@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, Field
 
-from domain.models import LibraryItem
-from domain.search import SearchResult
+from application.queries.find_series_duplicates import SeriesDuplicateCandidate
+from application.queries.get_missing_volumes import MissingVolumes
+from application.queries.lookup_isbns import IsbnLookupResult
+from domain.backups import BackupSnapshot, BackupVerification
+from domain.imports import ImportJob
+from domain.library_stats import LibraryStats, SeriesCompletion, StatsBucket
+from domain.models import LibraryChanges, LibraryItem
+from domain.search import SearchQuery, SearchResult
+from domain.search_planning import PlannedCall, SearchPlan
+from domain.suggestions import Suggestion
 
 
 class LibraryItemSchema(BaseModel):
@@ -18,7 +26,7 @@ class LibraryItemSchema(BaseModel):
     ownedVolumes: List[int] = Field(default_factory=list)
     nextReleaseDate: Optional[str] = None
     isFavorite: bool = False
-    notes: str = ""
+    notes: Optional[str] = None
     coverUrl: str = ""
     genre: List[str] = Field(default_factory=list)
     isbn: Optional[str] = None
@@ -65,6 +73,78 @@ class LibraryItemSchema(BaseModel):
         )
 
 
+LIBRARY_ITEM_ATTRIBUTES: Dict[str, str] = {
+    "id": "id",
+    "title": "title",
+    "author": "author",
+    "publisher": "publisher",
+    "publishedDate": "published_date",
+    "latestVolume": "latest_volume",
+    "ownedVolumes": "owned_volumes",
+    "nextReleaseDate": "next_release_date",
+    "isFavorite": "is_favorite",
+    "notes": "notes",
+    "coverUrl": "cover_url",
+    "genre": "genre",
+    "isbn": "isbn",
+    "source": "source",
+    "sourceUrl": "source_url",
+}
+LIBRARY_ITEM_FIELDS = frozenset(LIBRARY_ITEM_ATTRIBUTES)
+HEAVY_LIBRARY_ITEM_FIELDS = frozenset({"notes"})
+COMPACT_LIBRARY_ITEM_FIELDS = LIBRARY_ITEM_FIELDS - HEAVY_LIBRARY_ITEM_FIELDS
+
+
+def parse_library_fields(value: str) -> frozenset[str]:
+    requested = {part.strip() for part in value.split(",") if part.strip()}
+    if "*" in requested:
+        return LIBRARY_ITEM_FIELDS
+    unknown = requested - LIBRARY_ITEM_FIELDS
+    if unknown:
+        raise ValueError(", ".join(sorted(unknown)))
+    return frozenset(requested | {"id"})
+
+
+def to_item_attributes(fields: frozenset[str]) -> frozenset[str]:
+    return frozenset(LIBRARY_ITEM_ATTRIBUTES[name] for name in fields)
+
+
+def project_library_items(
+    items: Sequence[LibraryItem], fields: frozenset[str]
+) -> List[Dict[str, Any]]:
+    columns = [
+        (name, attribute)
+        for name, attribute in LIBRARY_ITEM_ATTRIBUTES.items()
+        if name in fields
+    ]
+    return [
+        {name: getattr(item, attribute) for name, attribute in columns}
+        for item in items
+    ]
+
+
+class LibraryNotesSchema(BaseModel):
+    notes: str
+
+
+class LibraryChangesSchema(BaseModel):
+    revision: int
+    since: int
+    reset: bool
+    items: List[LibraryItemSchema]
+    deleted: List[str]
+
+    @classmethod
+    def from_domain(cls, changes: LibraryChanges) -> "LibraryChangesSchema":
+        return cls(
+            revision=changes.revision,
+            since=changes.since,
+            reset=changes.reset,
+            items=[LibraryItemSchema.from_domain(item) for item in changes.items],
+            deleted=changes.deleted,
+        )
+
+
 class SearchResponseSchema(BaseModel):
     items: List[LibraryItemSchema]
     total: int
@@ -79,3 +159,315 @@ class SearchResponseSchema(BaseModel):
             page=result.page,
             limit=result.limit,
         )
+
+
+SEARCH_PARAMETER_NAMES = {"from_date": "from", "until": "until"}
+
+
+class PlannedCallSchema(BaseModel):
+    provider: str
+    mode: str
+    params: Dict[str, Any]
+    localFilters: List[str]
+
+    @classmethod
+    def from_domain(cls, call: PlannedCall) -> "PlannedCallSchema":
+        return cls(
+            provider=call.provider,
+            mode=call.mode,
+            params=to_search_params(call.query),
+            localFilters=sorted(
+                SEARCH_PARAMETER_NAMES.get(name, name) for name in call.local_filters
+            ),
+        )
+
+
+class SkippedProviderSchema(BaseModel):
+    provider: str
+    reason: str
+
+
+class SearchPlanSchema(BaseModel):
+    kind: str
+    isbn: Optional[str] = None
+    stopAfter: int
+    calls: List[PlannedCallSchema]
+    skipped: List[SkippedProviderSchema]
+
+    @classmethod
+    def from_domain(cls, plan: SearchPlan) -> "SearchPlanSchema":
+        return cls(
+            kind=plan.kind,
+            isbn=plan.isbn,
+            stopAfter=plan.stop_after,
+            calls=[PlannedCallSchema.from_domain(call) for call in plan.calls],
+            skipped=[
+                SkippedProviderSchema(provider=skipped.provider, reason=skipped.reason)
+                for skipped in plan.skipped
+            ],
+        )
+
+
+def to_search_params(query: SearchQuery) -> Dict[str, Any]:
+    values: Dict[str, Any] = {
+        "q": query.q,
+        "title": query.title,
+        "author": query.author,
+        "publisher": query.publisher,
+        "from": query.from_date.isoformat() if query.from_date else None,
+        "until": query.until.isoformat() if query.until else None,
+        "page": query.page,
+        "limit": query.limit,
+    }
+    return {key: value for key, value in values.items() if value is not None}
+
+
+class SuggestionSchema(BaseModel):
+    text: str
+    kind: str
+    inLibrary: bool
+
+    @classmethod
+    def from_domain(cls, suggestion: Suggestion) -> "SuggestionSchema":
+        return cls(
+            text=suggestion.text,
+            kind=suggestion.kind,
+            inLibrary=suggestion.in_library,
+        )
+
+
+class SuggestResponseSchema(BaseModel):
+    prefix: str
+    suggestions: List[SuggestionSchema]
+
+
+class SeriesDuplicateSchema(BaseModel):
+    left: LibraryItemSchema
+    right: LibraryItemSchema
+    titleSimilarity: float
+    authorSimilarity: float
+
+    @classmethod
+    def from_domain(
+        cls, candidate: SeriesDuplicateCandidate
+    ) -> "SeriesDuplicateSchema":
+        return cls(
+            left=LibraryItemSchema.from_domain(candidate.left),
+            right=LibraryItemSchema.from_domain(candidate.right),
+            titleSimilarity=round(candidate.title_similarity, 4),
+            authorSimilarity=round(candidate.author_similarity, 4),
+        )
+
+
+class MissingVolumesSchema(BaseModel):
+    itemId: str
+    seriesKey: str
+    ownedVolumes: List[int]
+    knownVolumes: List[int]
+    missingVolumes: List[int]
+    missingRanges: List[List[int]]
+    missingIsbns: Dict[str, str]
+    catalogUpdatedAt: Optional[str] = None
+    stale: bool
+
+    @classmethod
+    def from_domain(cls, missing: MissingVolumes) -> "MissingVolumesSchema":
+        refreshed_at = missing.catalog_refreshed_at
+        return cls(
+            itemId=missing.item.id,
+            seriesKey=missing.series_key,
+            ownedVolumes=missing.item.owned_volumes,
+            knownVolumes=missing.known_volumes,
+            missingVolumes=missing.missing_volumes,
+            missingRanges=[[start, end] for start, end in missing.missing_ranges],
+            missingIsbns={
+                str(volume): isbn for volume, isbn in missing.missing_isbns.items()
+            },
+            catalogUpdatedAt=refreshed_at.isoformat() if refreshed_at else None,
+            stale=missing.stale,
+        )
+
+
+class StatsBucketSchema(BaseModel):
+    key: str
+    count: int
+
+    @classmethod
+    def from_domain(cls, bucket: StatsBucket) -> "StatsBucketSchema":
+        return cls(key=bucket.key, count=bucket.count)
+
+
+class SeriesCompletionSchema(BaseModel):
+    itemId: str
+    title: str
+    ownedVolumes: int
+    latestVolume: int
+    ratio: float
+
+    @classmethod
+    def from_domain(cls, completion: SeriesCompletion) -> "SeriesCompletionSchema":
+        return cls(
+            itemId=completion.item_id,
+            title=completion.title,
+            ownedVolumes=completion.owned_volumes,
+            latestVolume=completion.latest_volume,
+            ratio=round(completion.ratio, 4),
+        )
+
+
+class LibraryStatsSchema(BaseModel):
+    revision: int
+    series: int
+    ownedVolumes: int
+    favorites: int
+    completedSeries: int
+    averageCompletion: float
+    volumesByAuthor: List[StatsBucketSchema]
+    volumesByPublisher: List[StatsBucketSchema]
+    completion: List[SeriesCompletionSchema]
+    upcomingReleases: List[StatsBucketSchema]
+    genres: List[StatsBucketSchema]
+
+    @classmethod
+    def from_domain(cls, stats: LibraryStats) -> "LibraryStatsSchema":
+        return cls(
+            revision=stats.revision,
+            series=stats.series,
+            ownedVolumes=stats.owned_volumes,
+            favorites=stats.favorites,
+            completedSeries=stats.completed_series,
+            averageCompletion=round(stats.average_completion, 4),
+            volumesByAuthor=[
+                StatsBucketSchema.from_domain(bucket)
+                for bucket in stats.volumes_by_author
+            ],
+            volumesByPublisher=[
+                StatsBucketSchema.from_domain(bucket)
+                for bucket in stats.volumes_by_publisher
+            ],
+            completion=[
+                SeriesCompletionSchema.from_domain(entry) for entry in stats.completion
+            ],
+            upcomingReleases=[
+                StatsBucketSchema.from_domain(bucket)
+                for bucket in stats.upcoming_releases
+            ],
+            genres=[StatsBucketSchema.from_domain(bucket) for bucket in stats.genres],
+        )
+
+
+class IsbnLookupRequestSchema(BaseModel):
+    isbns: List[str] = Field(min_length=1, max_length=500)
+
+
+class IsbnLookupResponseSchema(BaseModel):
+    items: Dict[str, LibraryItemSchema]
+    normalized: Dict[str, str]
+    notFound: List[str]
+    invalid: List[str]
+    cached: int
+
+    @classmethod
+    def from_domain(cls, result: IsbnLookupResult) -> "IsbnLookupResponseSchema":
+        return cls(
+            items={
+                isbn: LibraryItemSchema.from_domain(item)
+                for isbn, item in result.items.items()
+            },
+            normalized=result.normalized,
+            notFound=result.not_found,
+            invalid=result.invalid,
+            cached=result.cached,
+        )
+
+
+class ImportRowErrorSchema(BaseModel):
+    row: int
+    value: str
+    reason: str
+
+
+class ImportJobSchema(BaseModel):
+    jobId: str
+    format: str
+    status: str
+    processed: int
+    total: Optional[int] = None
+    imported: int
+    notFound: int
+    invalid: int
+    errors: List[ImportRowErrorSchema]
+    message: Optional[str] = None
+    createdAt: str
+    updatedAt: str
+
+    @classmethod
+    def from_domain(cls, job: ImportJob) -> "ImportJobSchema":
+        return cls(
+            jobId=job.job_id,
+            format=job.source_format,
+            status=job.status,
+            processed=job.cursor,
+            total=job.total,
+            imported=job.imported,
+            notFound=job.not_found,
+            invalid=job.invalid,
+            errors=[
+                ImportRowErrorSchema(
+                    row=error.row, value=error.value, reason=error.reason
+                )
+                for error in job.errors
+            ],
+            message=job.message,
+            createdAt=job.created_at.isoformat(),
+            updatedAt=job.updated_at.isoformat(),
+        )
+
+
+class BackupSnapshotSchema(BaseModel):
+    snapshotId: str
+    createdAt: str
+    revision: int
+    itemCount: int
+    parentId: Optional[str] = None
+    newObjects: int
+    storedBytes: int
+
+    @classmethod
+    def from_domain(cls, snapshot: BackupSnapshot) -> "BackupSnapshotSchema":
+        return cls(
+            snapshotId=snapshot.snapshot_id,
+            createdAt=snapshot.created_at.isoformat(),
+            revision=snapshot.revision,
+            itemCount=snapshot.item_count,
+            parentId=snapshot.parent_id,
+            newObjects=snapshot.new_objects,
+            storedBytes=snapshot.stored_bytes,
+        )
+
+
+class BackupVerificationSchema(BaseModel):
+    snapshotId: str
+    ok: bool
+    checkedObjects: int
+    missing: List[str]
+    corrupt: List[str]
+    brokenChain: bool
+
+    @classmethod
+    def from_domain(
+        cls, verification: BackupVerification
+    ) -> "BackupVerificationSchema":
+        return cls(
+            snapshotId=verification.snapshot_id,
+            ok=verification.ok,
+            checkedObjects=verification.checked_objects,
+            missing=verification.missing,
+            corrupt=verification.corrupt,
+            brokenChain=verification.broken_chain,
+        )
+
+
+class BackupRestoreSchema(BaseModel):
+    snapshotId: str
+    revision: int
@@ -18,7 +18,7 @@ export class SyncLibraryBidirectionallyWithGoogleDrive {
   ) {}
 
   async handle(): Promise<SyncLibraryBidirectionallyWithGoogleDriveResult> {
-    const localItems = await this.libraryRepository.list();
+    const localItems = await this.libraryRepository.listWithNotes();
     const remoteBackup = await this.googleDriveBackupRepository.getLatestLibraryBackup();
     const remoteItems = remoteBackup ? deduplicateSeriesByKey(remoteBackup.items) : [];
 
@@ -39,7 +39,7 @@ export class SyncLibraryBidirectionallyWithGoogleDrive {
       }
     }
 
-    const persistedItems = await this.libraryRepository.list();
+    const persistedItems = await this.libraryRepository.listWithNotes();
     const syncResult = await this.googleDriveBackupRepository.syncLibrary(persistedItems);
 
     return {
@@ -1,17 +1,17 @@
-import { MangaSeries } from '@domain/entities/MangaSeries';
 import {
   GoogleDriveBackupRepository,
   GoogleDriveSyncResult
 } from '@domain/repositories/GoogleDriveBackupRepository';
-
-export interface SyncLibraryToGoogleDriveCommand {
-  items: MangaSeries[];
-}
+import { LibraryRepository } from '@domain/repositories/LibraryRepository';
 
 export class SyncLibraryToGoogleDrive {
-  constructor(private repository: GoogleDriveBackupRepository) {}
+  constructor(
+    private repository: GoogleDriveBackupRepository,
+    private libraryRepository: LibraryRepository
+  ) {}
 
-  handle(command: SyncLibraryToGoogleDriveCommand): Promise<GoogleDriveSyncResult> {
-    return this.repository.syncLibrary(command.items);
+  async handle(): Promise<GoogleDriveSyncResult> {
+    const items = await this.libraryRepository.listWithNotes();
+    return this.repository.syncLibrary(items);
   }
 }
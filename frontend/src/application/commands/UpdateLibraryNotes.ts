@@ -0,0 +1,15 @@
+import { MangaSeries } from '@domain/entities/MangaSeries';
+import { LibraryRepository } from '@domain/repositories/LibraryRepository';
+
+export interface UpdateLibraryNotesCommand {
+  itemId: string;
+  notes: string;
+}
+
+export class UpdateLibraryNotes {
+  constructor(private repository: LibraryRepository) {}
+
+  handle(command: UpdateLibraryNotesCommand): Promise<MangaSeries> {
+    return this.repository.updateNotes(command.itemId, command.notes);
+  }
+}
@@ -9,6 +9,6 @@ export class UpsertLibraryItem {
   constructor(private repository: LibraryRepository) {}
 
   handle(command: UpsertLibraryItemCommand): Promise<MangaSeries> {
-    return this.repository.upsert(command.item);
+    return this.repository.upsert({ ...command.item, notes: null });
   }
 }
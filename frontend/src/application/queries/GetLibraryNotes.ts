@@ -0,0 +1,9 @@
+import { LibraryRepository } from '@domain/repositories/LibraryRepository';
+
+export class GetLibraryNotes {
+  constructor(private repository: LibraryRepository) {}
+
+  handle(itemId: string): Promise<string> {
+    return this.repository.getNotes(itemId);
+  }
+}
@@ -8,7 +8,7 @@ export interface MangaSeries {
   ownedVolumes: number[];
   nextReleaseDate?: string | null;
   isFavorite: boolean;
-  notes: string;
+  notes?: string | null;
   coverUrl: string;
   genre: string[];
   isbn?: string | null;
@@ -2,6 +2,9 @@ import { MangaSeries } from '@domain/entities/MangaSeries';
 
 export interface LibraryRepository {
   list(): Promise<MangaSeries[]>;
+  listWithNotes(): Promise<MangaSeries[]>;
+  getNotes(itemId: string): Promise<string>;
+  updateNotes(itemId: string, notes: string): Promise<MangaSeries>;
   upsert(item: MangaSeries): Promise<MangaSeries>;
   delete(itemId: string): Promise<void>;
 }
@@ -86,7 +86,7 @@ export function mergeSeriesWithPrimary(primary: MangaSeries, secondary: MangaSer
     ownedVolumes: normalizeOwnedVolumes(mergedOwnedVolumes, latestVolume),
     nextReleaseDate: pickNullableString(primary.nextReleaseDate, secondary.nextReleaseDate),
     isFavorite: primary.isFavorite || secondary.isFavorite,
-    notes: pickRequiredString(primary.notes, secondary.notes),
+    notes: pickNullableString(primary.notes, secondary.notes),
     coverUrl: pickRequiredString(primary.coverUrl, secondary.coverUrl),
     genre: mergeGenre(primary.genre, secondary.genre),
     isbn: pickNullableString(primary.isbn, secondary.isbn),
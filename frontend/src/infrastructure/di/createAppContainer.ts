@@ -3,9 +3,11 @@ import { RestoreLibraryFromGoogleDrive } from '@application/commands/RestoreLibr
 import { SaveAppSettings } from '@application/commands/SaveAppSettings';
 import { DeleteLibraryItem } from '@application/commands/DeleteLibraryItem';
 import { SyncLibraryBidirectionallyWithGoogleDrive } from '@application/commands/SyncLibraryBidirectionallyWithGoogleDrive';
+import { UpdateLibraryNotes } from '@application/commands/UpdateLibraryNotes';
 import { UpsertLibraryItem } from '@application/commands/UpsertLibraryItem';
 import { GetAppSettings } from '@application/queries/GetAppSettings';
 import { GetLibrary } from '@application/queries/GetLibrary';
+import { GetLibraryNotes } from '@application/queries/GetLibraryNotes';
 import { SearchBooks } from '@application/queries/SearchBooks';
 import { AppSettingsRepository } from '@domain/repositories/AppSettingsRepository';
 import { GoogleDriveBackupRepository } from '@domain/repositories/GoogleDriveBackupRepository';
@@ -23,12 +25,14 @@ export interface AppContainer {
   searchRepository: SearchRepository;
   getAppSettings: GetAppSettings;
   getLibrary: GetLibrary;
+  getLibraryNotes: GetLibraryNotes;
   searchBooks: SearchBooks;
   syncLibraryToGoogleDrive: SyncLibraryToGoogleDrive;
   restoreLibraryFromGoogleDrive: RestoreLibraryFromGoogleDrive;
   syncLibraryBidirectionallyWithGoogleDrive: SyncLibraryBidirectionallyWithGoogleDrive;
   saveAppSettings: SaveAppSettings;
   upsertLibraryItem: UpsertLibraryItem;
+  updateLibraryNotes: UpdateLibraryNotes;
   deleteLibraryItem: DeleteLibraryItem;
 }
 
@@ -45,8 +49,12 @@ export const createAppContainer = (): AppContainer => {
     searchRepository,
     getAppSettings: new GetAppSettings(appSettingsRepository),
     getLibrary: new GetLibrary(libraryRepository),
+    getLibraryNotes: new GetLibraryNotes(libraryRepository),
     searchBooks: new SearchBooks(searchRepository),
-    syncLibraryToGoogleDrive: new SyncLibraryToGoogleDrive(googleDriveBackupRepository),
+    syncLibraryToGoogleDrive: new SyncLibraryToGoogleDrive(
+      googleDriveBackupRepository,
+      libraryRepository
+    ),
     restoreLibraryFromGoogleDrive: new RestoreLibraryFromGoogleDrive(
       googleDriveBackupRepository,
       libraryRepository
@@ -57,6 +65,7 @@ export const createAppContainer = (): AppContainer => {
     ),
     saveAppSettings: new SaveAppSettings(appSettingsRepository),
     upsertLibraryItem: new UpsertLibraryItem(libraryRepository),
+    updateLibraryNotes: new UpdateLibraryNotes(libraryRepository),
     deleteLibraryItem: new DeleteLibraryItem(libraryRepository)
   };
 };
@@ -11,7 +11,7 @@ export type LibraryItemDto = {
   ownedVolumes: number[];
   nextReleaseDate?: string | null;
   isFavorite: boolean;
-  notes: string;
+  notes?: string | null;
   coverUrl: string;
   genre: string[];
   isbn?: string | null;
@@ -36,7 +36,7 @@ export const toDomain = (dto: LibraryItemDto): MangaSeries => ({
   ownedVolumes: dto.ownedVolumes,
   nextReleaseDate: dto.nextReleaseDate ?? null,
   isFavorite: dto.isFavorite,
-  notes: dto.notes,
+  notes: dto.notes ?? null,
   coverUrl: dto.coverUrl,
   genre: dto.genre,
   isbn: dto.isbn ?? null,
@@ -54,7 +54,7 @@ export const fromDomain = (item: MangaSeries): LibraryItemDto => ({
   ownedVolumes: item.ownedVolumes,
   nextReleaseDate: item.nextReleaseDate ?? null,
   isFavorite: item.isFavorite,
-  notes: item.notes,
+  ...(item.notes != null ? { notes: item.notes } : {}),
   coverUrl: item.coverUrl,
   genre: item.genre,
   isbn: item.isbn ?? null,
@@ -9,6 +9,25 @@ export class LibraryApiRepository implements LibraryRepository {
     return data.map((item) => toDomain(item));
   }
 
+  async listWithNotes(): Promise<MangaSeries[]> {
+    const data = await fetchJson<LibraryItemDto[]>('/api/library?fields=*');
+    return data.map((item) => toDomain(item));
+  }
+
+  async getNotes(itemId: string): Promise<string> {
+    const data = await fetchJson<{ notes: string }>(`/api/library/${itemId}/notes`);
+    return data.notes;
+  }
+
+  async updateNotes(itemId: string, notes: string): Promise<MangaSeries> {
+    const saved = await fetchJson<LibraryItemDto>(`/api/library/${itemId}/notes`, {
+      method: 'PUT',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ notes })
+    });
+    return toDomain(saved);
+  }
+
   async upsert(item: MangaSeries): Promise<MangaSeries> {
     const payload = fromDomain(item);
     const saved = await fetchJson<LibraryItemDto>('/api/library', {
@@ -63,7 +63,7 @@ export default function App() {
   const [libraryQuery, setLibraryQuery] = useState('');
   const [selectedSeries, setSelectedSeries] = useState<MangaSeries | null>(null);
 
-  const { library, libraryError, updateSeries, replaceLibrary } = useLibrary();
+  const { library, libraryError, updateSeries, updateNotes, replaceLibrary } = useLibrary();
   const {
     settings,
     settingsError,
@@ -127,6 +127,17 @@ export default function App() {
     });
   };
 
+  const handleUpdateNotes = (series: MangaSeries, notes: string) => {
+    const target = libraryIndex.has(series.id) ? Promise.resolve(series) : updateSeries(series);
+    void target
+      .then((stored) => (stored ? updateNotes(stored.id, notes) : null))
+      .then((saved) => {
+        if (saved) {
+          setSelectedSeries(saved);
+        }
+      });
+  };
+
   const filteredLibrary = useMemo(() => {
     let result = library;
     if (libraryQuery.trim()) {
@@ -442,6 +453,7 @@ export default function App() {
               series={selectedSeries}
               onBack={() => setSelectedSeries(null)}
               onUpdate={handleUpdateSeries}
+              onUpdateNotes={handleUpdateNotes}
               isDark={isDark}
               libraryStatus={selectedSeriesStatus}
               seriesTitleOnly={activeTab !== 'search'}
@@ -779,6 +791,7 @@ function SeriesDetail({
   series,
   onBack,
   onUpdate,
+  onUpdateNotes,
   isDark,
   libraryStatus,
   seriesTitleOnly
@@ -786,12 +799,15 @@ function SeriesDetail({
   series: MangaSeries;
   onBack: () => void;
   onUpdate: (s: MangaSeries) => void;
+  onUpdateNotes: (s: MangaSeries, notes: string) => void;
   isDark: boolean;
   libraryStatus: SeriesLibraryStatus;
   seriesTitleOnly?: boolean;
 }) {
-  const { searchBooks } = useAppContainer();
-  const [noteText, setNoteText] = useState(series.notes);
+  const { searchBooks, getLibraryNotes } = useAppContainer();
+  const [noteText, setNoteText] = useState(series.notes ?? '');
+  const [savedNoteText, setSavedNoteText] = useState(series.notes ?? '');
+  const [notesLoading, setNotesLoading] = useState(false);
   const [volumeCoverByVolume, setVolumeCoverByVolume] = useState<Record<number, string>>({});
   const displayTitle = seriesTitleOnly ? toSeriesDisplayTitle(series.title) : series.title;
   const detailMetaLine = seriesTitleOnly
@@ -811,8 +827,47 @@ function SeriesDetail({
   })();
 
   useEffect(() => {
-    setNoteText(series.notes);
-  }, [series.id, series.notes]);
+    if (series.notes != null || libraryStatus !== 'sameId') {
+      setNoteText(series.notes ?? '');
+      setSavedNoteText(series.notes ?? '');
+      setNotesLoading(false);
+      return;
+    }
+
+    let active = true;
+    const loadNotes = async () => {
+      setNotesLoading(true);
+      try {
+        const notes = await getLibraryNotes.handle(series.id);
+        if (!active) {
+          return;
+        }
+        setNoteText(notes);
+        setSavedNoteText(notes);
+      } catch {
+        // メモの取得に失敗した場合は空欄のまま編集を許可する
+      } finally {
+        if (active) {
+          setNotesLoading(false);
+        }
+      }
+    };
+
+    setNoteText('');
+    setSavedNoteText('');
+    void loadNotes();
+    return () => {
+      active = false;
+    };
+  }, [getLibraryNotes, libraryStatus, series.id, series.notes]);
+
+  const saveNotes = () => {
+    if (notesLoading || noteText === savedNoteText) {
+      return;
+    }
+    setSavedNoteText(noteText);
+    onUpdateNotes(series, noteText);
+  };
 
   useEffect(() => {
     const seed: Record<number, string> = {};
@@ -1047,8 +1102,9 @@ function SeriesDetail({
             }`}
             placeholder="感想やお気に入りのシーンなどをメモ..."
             value={noteText}
+            disabled={notesLoading}
             onChange={(e) => setNoteText(e.target.value)}
-            onBlur={() => onUpdate({ ...series, notes: noteText })}
+            onBlur={saveNotes}
           />
         </section>
       </div>
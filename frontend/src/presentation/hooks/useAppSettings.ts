@@ -266,7 +266,7 @@ export function useAppSettings({ library, onLibraryReplace }: UseAppSettingsPara
     setGoogleDriveSyncError(null);
 
     try {
-      const result = await syncLibraryToGoogleDrive.handle({ items: library });
+      const result = await syncLibraryToGoogleDrive.handle();
       setSettings((prev) => ({
         ...prev,
         googleDriveLinked: true,
@@ -281,7 +281,7 @@ export function useAppSettings({ library, onLibraryReplace }: UseAppSettingsPara
     } finally {
       setGoogleDriveSyncing(false);
     }
-  }, [library, syncLibraryToGoogleDrive]);
+  }, [syncLibraryToGoogleDrive]);
 
   const restoreGoogleDriveBackup = useCallback(async () => {
     if (
@@ -8,7 +8,7 @@ const LOAD_ERROR_MESSAGE = '本棚データの読み込みに失敗しました'
 const SAVE_ERROR_MESSAGE = '本棚への保存に失敗しました';
 
 export function useLibrary() {
-  const { getLibrary, upsertLibraryItem } = useAppContainer();
+  const { getLibrary, upsertLibraryItem, updateLibraryNotes } = useAppContainer();
   const [library, setLibrary] = useState<MangaSeries[]>([]);
   const [libraryError, setLibraryError] = useState<string | null>(null);
 
@@ -51,10 +51,25 @@ export function useLibrary() {
     [upsertLibraryItem]
   );
 
+  const updateNotes = useCallback(
+    async (itemId: string, notes: string) => {
+      try {
+        const saved = await updateLibraryNotes.handle({ itemId, notes });
+        setLibrary((prev) => prev.map((item) => (item.id === saved.id ? saved : item)));
+        setLibraryError(null);
+        return saved;
+      } catch {
+        setLibraryError(SAVE_ERROR_MESSAGE);
+        return null;
+      }
+    },
+    [updateLibraryNotes]
+  );
+
   const replaceLibrary = useCallback((items: MangaSeries[]) => {
     setLibrary(deduplicateSeriesByKey(items));
     setLibraryError(null);
   }, []);
 
-  return { library, libraryError, updateSeries, replaceLibrary };
+  return { library, libraryError, updateSeries, updateNotes, replaceLibrary };
 }